@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""
+OpenCL PBKDF2-HMAC-SHA512 for the wallet brute force tool.
+
+Each work-item derives the key for one candidate password. The salt,
+iteration count and key length are compiled into the program as
+constants, and every work-item precomputes its HMAC ipad/opad midstates
+once, so each iteration costs exactly two SHA-512 compressions.
+
+A second kernel can test the derived keys against the encrypted master key
+on the device, so only the indices of candidate passwords are copied back.
+"""
+
+import hashlib
+
+import numpy as np
+import pyopencl as cl
+
+# SHA-512 block size; longer HMAC keys are replaced by their SHA-512 digest
+BLOCK_SIZE = 128
+
+# The first HMAC message (salt || INT(1)) plus its padding must fit in one
+# block, which leaves room for salts of up to 107 bytes (Bitcoin uses 8)
+MAX_SALT_LENGTH = BLOCK_SIZE - 4 - 1 - 16
+
+_KERNEL_SOURCE = r"""
+__constant ulong K[80] = {
+    0x428a2f98d728ae22UL, 0x7137449123ef65cdUL, 0xb5c0fbcfec4d3b2fUL, 0xe9b5dba58189dbbcUL,
+    0x3956c25bf348b538UL, 0x59f111f1b605d019UL, 0x923f82a4af194f9bUL, 0xab1c5ed5da6d8118UL,
+    0xd807aa98a3030242UL, 0x12835b0145706fbeUL, 0x243185be4ee4b28cUL, 0x550c7dc3d5ffb4e2UL,
+    0x72be5d74f27b896fUL, 0x80deb1fe3b1696b1UL, 0x9bdc06a725c71235UL, 0xc19bf174cf692694UL,
+    0xe49b69c19ef14ad2UL, 0xefbe4786384f25e3UL, 0x0fc19dc68b8cd5b5UL, 0x240ca1cc77ac9c65UL,
+    0x2de92c6f592b0275UL, 0x4a7484aa6ea6e483UL, 0x5cb0a9dcbd41fbd4UL, 0x76f988da831153b5UL,
+    0x983e5152ee66dfabUL, 0xa831c66d2db43210UL, 0xb00327c898fb213fUL, 0xbf597fc7beef0ee4UL,
+    0xc6e00bf33da88fc2UL, 0xd5a79147930aa725UL, 0x06ca6351e003826fUL, 0x142929670a0e6e70UL,
+    0x27b70a8546d22ffcUL, 0x2e1b21385c26c926UL, 0x4d2c6dfc5ac42aedUL, 0x53380d139d95b3dfUL,
+    0x650a73548baf63deUL, 0x766a0abb3c77b2a8UL, 0x81c2c92e47edaee6UL, 0x92722c851482353bUL,
+    0xa2bfe8a14cf10364UL, 0xa81a664bbc423001UL, 0xc24b8b70d0f89791UL, 0xc76c51a30654be30UL,
+    0xd192e819d6ef5218UL, 0xd69906245565a910UL, 0xf40e35855771202aUL, 0x106aa07032bbd1b8UL,
+    0x19a4c116b8d2d0c8UL, 0x1e376c085141ab53UL, 0x2748774cdf8eeb99UL, 0x34b0bcb5e19b48a8UL,
+    0x391c0cb3c5c95a63UL, 0x4ed8aa4ae3418acbUL, 0x5b9cca4f7763e373UL, 0x682e6ff3d6b2b8a3UL,
+    0x748f82ee5defb2fcUL, 0x78a5636f43172f60UL, 0x84c87814a1f0ab72UL, 0x8cc702081a6439ecUL,
+    0x90befffa23631e28UL, 0xa4506cebde82bde9UL, 0xbef9a3f7b2c67915UL, 0xc67178f2e372532bUL,
+    0xca273eceea26619cUL, 0xd186b8c721c0c207UL, 0xeada7dd6cde0eb1eUL, 0xf57d4f7fee6ed178UL,
+    0x06f067aa72176fbaUL, 0x0a637dc5a2c898a6UL, 0x113f9804bef90daeUL, 0x1b710b35131c471bUL,
+    0x28db77f523047d84UL, 0x32caab7b40c72493UL, 0x3c9ebe0a15c9bebcUL, 0x431d67c49c100d4cUL,
+    0x4cc5d4becb3e42b6UL, 0x597f299cfc657e2aUL, 0x5fcb6fab3ad6faecUL, 0x6c44198c4a475817UL
+};
+
+__constant ulong IV[8] = {
+    0x6a09e667f3bcc908UL, 0xbb67ae8584caa73bUL, 0x3c6ef372fe94f82bUL, 0xa54ff53a5f1d36f1UL,
+    0x510e527fade682d1UL, 0x9b05688c2b3e6c1fUL, 0x1f83d9abfb41bd6bUL, 0x5be0cd19137e2179UL
+};
+
+#define ROTR(x, n) rotate((x), (ulong)(64 - (n)))
+#define CH(x, y, z) bitselect((z), (y), (x))
+#define MAJ(x, y, z) bitselect((x), (y), (z) ^ (x))
+#define S0(x) (ROTR(x, 28) ^ ROTR(x, 34) ^ ROTR(x, 39))
+#define S1(x) (ROTR(x, 14) ^ ROTR(x, 18) ^ ROTR(x, 41))
+#define s0(x) (ROTR(x, 1) ^ ROTR(x, 8) ^ ((x) >> 7))
+#define s1(x) (ROTR(x, 19) ^ ROTR(x, 61) ^ ((x) >> 6))
+
+/* One SHA-512 compression of the 16-word block w into state */
+static void sha512_compress(ulong state[8], const ulong block[16])
+{
+    ulong w[16];
+    ulong a = state[0], b = state[1], c = state[2], d = state[3];
+    ulong e = state[4], f = state[5], g = state[6], h = state[7];
+
+    for (int i = 0; i < 16; i++)
+        w[i] = block[i];
+
+    #pragma unroll
+    for (int i = 0; i < 80; i++) {
+        if (i >= 16)
+            w[i & 15] += s1(w[(i - 2) & 15]) + w[(i - 7) & 15] + s0(w[(i - 15) & 15]);
+        ulong t1 = h + S1(e) + CH(e, f, g) + K[i] + w[i & 15];
+        ulong t2 = S0(a) + MAJ(a, b, c);
+        h = g; g = f; f = e; e = d + t1;
+        d = c; c = b; b = a; a = t1 + t2;
+    }
+
+    state[0] += a; state[1] += b; state[2] += c; state[3] += d;
+    state[4] += e; state[5] += f; state[6] += g; state[7] += h;
+}
+
+/* HMAC of a 64-byte digest, resumed from the ipad/opad midstates */
+static void hmac_digest(const ulong ipad[8], const ulong opad[8], ulong u[8])
+{
+    ulong block[16];
+    ulong state[8];
+
+    for (int i = 0; i < 8; i++) {
+        block[i] = u[i];
+        block[i + 8] = 0;
+        state[i] = ipad[i];
+    }
+    block[8] = 0x8000000000000000UL;
+    block[15] = (BLOCK_SIZE + 64) * 8;
+    sha512_compress(state, block);
+
+    for (int i = 0; i < 8; i++) {
+        block[i] = state[i];
+        u[i] = opad[i];
+    }
+    sha512_compress(u, block);
+}
+
+__kernel void pbkdf2_hmac_sha512(__global const uchar *passwords,
+                                 __global const uint *offsets,
+                                 __global const uint *lengths,
+                                 __global ulong *keys)
+{
+    const size_t gid = get_global_id(0);
+    __global const uchar *password = passwords + offsets[gid];
+    const uint length = lengths[gid];
+
+    /* Big-endian HMAC key words, zero padded to one block */
+    ulong key[16];
+    for (int i = 0; i < 16; i++)
+        key[i] = 0;
+    for (uint i = 0; i < length; i++)
+        key[i >> 3] |= (ulong)password[i] << (56 - ((i & 7) << 3));
+
+    /* ipad/opad midstates, computed once per password */
+    ulong ipad[8], opad[8], block[16];
+    for (int i = 0; i < 8; i++) {
+        ipad[i] = IV[i];
+        opad[i] = IV[i];
+    }
+    for (int i = 0; i < 16; i++)
+        block[i] = key[i] ^ 0x3636363636363636UL;
+    sha512_compress(ipad, block);
+    for (int i = 0; i < 16; i++)
+        block[i] = key[i] ^ 0x5c5c5c5c5c5c5c5cUL;
+    sha512_compress(opad, block);
+
+    /* U1 = HMAC(password, salt || INT(1)); the padded message is a constant */
+    ulong u[8], state[8];
+    for (int i = 0; i < 16; i++)
+        block[i] = FIRST_BLOCK[i];
+    for (int i = 0; i < 8; i++)
+        state[i] = ipad[i];
+    sha512_compress(state, block);
+
+    for (int i = 0; i < 8; i++) {
+        block[i] = state[i];
+        block[i + 8] = 0;
+        u[i] = opad[i];
+    }
+    block[8] = 0x8000000000000000UL;
+    block[15] = (BLOCK_SIZE + 64) * 8;
+    sha512_compress(u, block);
+
+    ulong t[KEY_WORDS];
+    for (int i = 0; i < KEY_WORDS; i++)
+        t[i] = u[i];
+
+    /* U2..Un, each two compressions from the cached midstates */
+    for (uint n = 1; n < ITERATIONS; n++) {
+        hmac_digest(ipad, opad, u);
+        for (int i = 0; i < KEY_WORDS; i++)
+            t[i] ^= u[i];
+    }
+
+    for (int i = 0; i < KEY_WORDS; i++)
+        keys[gid * KEY_WORDS + i] = t[i];
+}
+
+static uchar gf_mul(uchar a, uchar b)
+{
+    uchar p = 0;
+    for (int i = 0; i < 8; i++) {
+        if (b & 1)
+            p ^= a;
+        a = (a << 1) ^ ((a & 0x80) ? 0x1b : 0);
+        b >>= 1;
+    }
+    return p;
+}
+
+/* Flag the keys that decrypt the last CBC block to a full block of PKCS#7
+   padding. blocks holds the previous ciphertext block (the IV for a single
+   block) followed by the last one; needs a 32-byte derived key */
+__kernel void cbc_full_padding(__global const ulong *keys,
+                               __constant const uchar *blocks,
+                               __global uchar *matches)
+{
+    const size_t gid = get_global_id(0);
+
+    /* AES-256 key schedule from the big-endian key words */
+    uchar w[240];
+    for (int i = 0; i < 32; i++)
+        w[i] = (uchar)(keys[gid * KEY_WORDS + (i >> 3)] >> (56 - ((i & 7) << 3)));
+    uchar rcon = 1;
+    for (int i = 32; i < 240; i += 4) {
+        uchar t0 = w[i - 4], t1 = w[i - 3], t2 = w[i - 2], t3 = w[i - 1];
+        if (i % 32 == 0) {
+            uchar tmp = t0;
+            t0 = SBOX[t1] ^ rcon;
+            t1 = SBOX[t2];
+            t2 = SBOX[t3];
+            t3 = SBOX[tmp];
+            rcon = (rcon << 1) ^ ((rcon & 0x80) ? 0x1b : 0);
+        } else if (i % 32 == 16) {
+            t0 = SBOX[t0]; t1 = SBOX[t1]; t2 = SBOX[t2]; t3 = SBOX[t3];
+        }
+        w[i] = w[i - 32] ^ t0;
+        w[i + 1] = w[i - 31] ^ t1;
+        w[i + 2] = w[i - 30] ^ t2;
+        w[i + 3] = w[i - 29] ^ t3;
+    }
+
+    /* Inverse cipher on the last block; the state is column-major */
+    uchar s[16], t[16];
+    for (int i = 0; i < 16; i++)
+        s[i] = blocks[16 + i] ^ w[224 + i];
+    for (int round = 13; round >= 0; round--) {
+        for (int r = 0; r < 4; r++)
+            for (int c = 0; c < 4; c++)
+                t[r + 4 * ((c + r) & 3)] = s[r + 4 * c];
+        for (int i = 0; i < 16; i++)
+            s[i] = INV_SBOX[t[i]] ^ w[round * 16 + i];
+        if (round > 0) {
+            for (int c = 0; c < 16; c += 4) {
+                uchar a0 = s[c], a1 = s[c + 1], a2 = s[c + 2], a3 = s[c + 3];
+                s[c] = gf_mul(a0, 14) ^ gf_mul(a1, 11) ^ gf_mul(a2, 13) ^ gf_mul(a3, 9);
+                s[c + 1] = gf_mul(a0, 9) ^ gf_mul(a1, 14) ^ gf_mul(a2, 11) ^ gf_mul(a3, 13);
+                s[c + 2] = gf_mul(a0, 13) ^ gf_mul(a1, 9) ^ gf_mul(a2, 14) ^ gf_mul(a3, 11);
+                s[c + 3] = gf_mul(a0, 11) ^ gf_mul(a1, 13) ^ gf_mul(a2, 9) ^ gf_mul(a3, 14);
+            }
+        }
+    }
+
+    uchar match = 1;
+    for (int i = 0; i < 16; i++)
+        match &= (s[i] ^ blocks[i]) == 16;
+    matches[gid] = match;
+}
+"""
+
+def _aes_sboxes():
+    """Return the AES S-box and its inverse as lists of 256 ints."""
+    sbox = [0] * 256
+    p = q = 1
+    while True:
+        # Step p through every non-zero element (multiply by 3) and q
+        # through their inverses (divide by 3)
+        p ^= ((p << 1) ^ (0x1b if p & 0x80 else 0)) & 0xff
+        q ^= q << 1
+        q ^= q << 2
+        q ^= q << 4
+        q &= 0xff
+        if q & 0x80:
+            q ^= 0x09
+        rotated = q
+        x = q
+        for _ in range(4):
+            rotated = ((rotated << 1) | (rotated >> 7)) & 0xff
+            x ^= rotated
+        sbox[p] = x ^ 0x63
+        if p == 1:
+            break
+    sbox[0] = 0x63
+
+    inv_sbox = [0] * 256
+    for i, value in enumerate(sbox):
+        inv_sbox[value] = i
+    return sbox, inv_sbox
+
+def _c_array(name, values):
+    """Format a list of bytes as an OpenCL __constant uchar array."""
+    return f"__constant uchar {name}[{len(values)}] = {{{', '.join(map(str, values))}}};\n"
+
+def _select_device():
+    """Return the first OpenCL GPU device, or any device if there is no GPU."""
+    devices = [device for platform in cl.get_platforms() for device in platform.get_devices()]
+    if not devices:
+        raise RuntimeError("No OpenCL devices found")
+    for device in devices:
+        if device.type & cl.device_type.GPU:
+            return device
+    return devices[0]
+
+def pack_passwords(passwords):
+    """
+    Pack a batch of passwords into one contiguous buffer.
+
+    String passwords are UTF-8 encoded; an all-ASCII batch of strings is
+    encoded in a single pass without a bytes object per password.
+
+    Args:
+        passwords: List of password strings or bytes
+
+    Returns:
+        (data, offsets, lengths) as uint8, uint32 and uint32 arrays
+    """
+    count = len(passwords)
+    joined = None
+    if all(type(p) is str for p in passwords):
+        joined = ''.join(passwords)
+        if joined.isascii():
+            data = joined.encode('ascii')
+            lengths = np.fromiter(map(len, passwords), dtype=np.uint32, count=count)
+        else:
+            joined = None
+    if joined is None:
+        encoded = [p.encode('utf-8') if isinstance(p, str) else p for p in passwords]
+        # HMAC hashes keys longer than one block down to their digest
+        encoded = [p if len(p) <= BLOCK_SIZE else hashlib.sha512(p).digest() for p in encoded]
+        data = b''.join(encoded)
+        lengths = np.fromiter(map(len, encoded), dtype=np.uint32, count=count)
+    elif count and lengths.max() > BLOCK_SIZE:
+        # Rare: re-pack with the long passwords pre-hashed
+        return pack_passwords([p.encode('ascii') for p in passwords])
+
+    offsets = np.zeros(count, dtype=np.uint32)
+    if count:
+        np.cumsum(lengths[:-1], out=offsets[1:])
+    return np.frombuffer(data or b'\x00', dtype=np.uint8), offsets, lengths
+
+def _first_block_words(salt):
+    """Return the padded (salt || INT(1)) HMAC message as 16 big-endian words."""
+    message = salt + b'\x00\x00\x00\x01'
+    bit_length = (BLOCK_SIZE + len(message)) * 8
+    block = message + b'\x80' + bytes(BLOCK_SIZE - len(message) - 1 - 16) + bit_length.to_bytes(16, 'big')
+    return np.frombuffer(block, dtype='>u8')
+
+class OpenCLPBKDF2:
+    """PBKDF2-HMAC-SHA512 key derivation for batches of passwords on an OpenCL device."""
+
+    def __init__(self, salt, iterations, key_length=32, device=None):
+        """
+        Compile the kernel for a fixed salt, iteration count and key length.
+
+        Args:
+            salt: Salt bytes (at most MAX_SALT_LENGTH)
+            iterations: Number of PBKDF2 iterations
+            key_length: Length of the derived keys (at most 64)
+            device: OpenCL device to use; defaults to the first GPU
+
+        Raises:
+            ValueError: If the parameters are not supported by the kernel
+        """
+        if len(salt) > MAX_SALT_LENGTH:
+            raise ValueError(f"Salt longer than {MAX_SALT_LENGTH} bytes is not supported")
+        if not 0 < key_length <= 64:
+            raise ValueError("Key length must be between 1 and 64 bytes")
+        if iterations < 1:
+            raise ValueError("Iterations must be a positive integer")
+
+        self.key_length = key_length
+        self.key_words = (key_length + 7) // 8
+        self.device = device or _select_device()
+        self.context = cl.Context([self.device])
+        self.queue = cl.CommandQueue(self.context)
+
+        # Specialise the program for this wallet: the salt block, iteration
+        # count and key size become compile-time constants
+        first_block = ', '.join(f'0x{word:016x}UL' for word in _first_block_words(salt))
+        source = (
+            f"#define BLOCK_SIZE {BLOCK_SIZE}\n"
+            f"#define ITERATIONS {iterations}u\n"
+            f"#define KEY_WORDS {self.key_words}\n"
+            f"__constant ulong FIRST_BLOCK[16] = {{{first_block}}};\n"
+        ) + ''.join(map(_c_array, ('SBOX', 'INV_SBOX'), _aes_sboxes())) + _KERNEL_SOURCE
+        self.program = cl.Program(self.context, source).build()
+        self.kernel = cl.Kernel(self.program, "pbkdf2_hmac_sha512")
+        self.padding_kernel = cl.Kernel(self.program, "cbc_full_padding")
+
+    def _derive_on_device(self, passwords):
+        """Launch the derivation for a non-empty batch; return the device key buffer."""
+        data, offsets, lengths = pack_passwords(passwords)
+
+        mf = cl.mem_flags
+        data_buf = cl.Buffer(self.context, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=data)
+        offsets_buf = cl.Buffer(self.context, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=offsets)
+        lengths_buf = cl.Buffer(self.context, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=lengths)
+        keys_buf = cl.Buffer(self.context, mf.READ_WRITE, len(passwords) * self.key_words * 8)
+
+        self.kernel(self.queue, (len(passwords),), None, data_buf, offsets_buf, lengths_buf, keys_buf)
+        return keys_buf
+
+    def derive(self, passwords):
+        """
+        Derive keys for a batch of passwords in one kernel launch.
+
+        Args:
+            passwords: List of password strings (UTF-8 encoded) or bytes
+
+        Returns:
+            List of derived keys, in the same order as passwords
+        """
+        count = len(passwords)
+        if not count:
+            return []
+
+        keys_buf = self._derive_on_device(passwords)
+        keys = np.empty(count * self.key_words, dtype=np.uint64)
+        cl.enqueue_copy(self.queue, keys, keys_buf)
+
+        # The words come back in host order; serialise them big-endian
+        raw = keys.astype('>u8').tobytes()
+        stride = self.key_words * 8
+        return [raw[i:i + self.key_length] for i in range(0, count * stride, stride)]
+
+    def find_full_padding(self, passwords, ciphertext, iv=bytes(16)):
+        """
+        Find the passwords whose key decrypts ciphertext to a full padding block.
+
+        Keys are derived and tried with AES-256-CBC on the device; only one
+        flag byte per password is copied back.
+
+        Args:
+            passwords: List of password strings (UTF-8 encoded) or bytes
+            ciphertext: AES-256-CBC ciphertext, a whole number of blocks
+            iv: CBC initialisation vector
+
+        Returns:
+            Indices of the passwords whose key leaves a last plaintext block of
+            sixteen 0x10 bytes
+
+        Raises:
+            ValueError: If the key length is not 32 or ciphertext is not whole blocks
+        """
+        if self.key_length != 32:
+            raise ValueError("AES-256 needs a 32-byte derived key")
+        if not ciphertext or len(ciphertext) % 16:
+            raise ValueError("Ciphertext must be a whole number of AES blocks")
+        count = len(passwords)
+        if not count:
+            return []
+
+        keys_buf = self._derive_on_device(passwords)
+        blocks = np.frombuffer((iv + ciphertext)[-32:], dtype=np.uint8)
+        mf = cl.mem_flags
+        blocks_buf = cl.Buffer(self.context, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=blocks)
+        matches_buf = cl.Buffer(self.context, mf.WRITE_ONLY, count)
+        self.padding_kernel(self.queue, (count,), None, keys_buf, blocks_buf, matches_buf)
+
+        matches = np.empty(count, dtype=np.uint8)
+        cl.enqueue_copy(self.queue, matches, matches_buf)
+        return np.flatnonzero(matches).tolist()
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Runtime-specialised C PBKDF2-HMAC-SHA512 for the wallet brute force tool.
+
+The salt, iteration count and key length are fixed for a whole run, so the
+C source is generated with them as compile-time constants, built once with
+the system C compiler and loaded through ctypes. The shared library is
+cached on disk by a hash of the generated source and of the target it was
+built for (machine type, compiler version and the CPU features -march=native
+enables), so later runs against the same wallet (and every pool worker) only
+load it, while a cache in a home directory shared between hosts never hands
+one CPU code built for another. Every load is checked against hashlib
+before it is used.
+"""
+
+import ctypes
+import hashlib
+import os
+import platform
+import stat
+import subprocess
+import tempfile
+
+# SHA-512 block size; longer HMAC keys are replaced by their SHA-512 digest
+BLOCK_SIZE = 128
+
+# The first HMAC message (salt || INT(1)) plus its padding must fit in one
+# block, which leaves room for salts of up to 107 bytes (Bitcoin uses 8)
+MAX_SALT_LENGTH = BLOCK_SIZE - 4 - 1 - 16
+
+# Directory for compiled libraries: per user, since whatever is found here
+# is loaded into the process that holds the wallet key
+CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'wallet_brute_force', 'pbkdf2'
+)
+
+def _check_private(path, st):
+    """Raise OSError unless st (from lstat) is owned by this user and not writable by others."""
+    if hasattr(os, 'getuid') and st.st_uid != os.getuid():
+        raise OSError(f"Refusing {path}: not owned by the current user")
+    if st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise OSError(f"Refusing {path}: writable by other users")
+
+_C_SOURCE = r"""
+#include <stdint.h>
+#include <string.h>
+
+/* Round constants on cache-line boundaries, so the 640-byte table spans
+   the fewest lines */
+static const uint64_t K[80] __attribute__((aligned(64))) = {
+    0x428a2f98d728ae22ULL, 0x7137449123ef65cdULL, 0xb5c0fbcfec4d3b2fULL, 0xe9b5dba58189dbbcULL,
+    0x3956c25bf348b538ULL, 0x59f111f1b605d019ULL, 0x923f82a4af194f9bULL, 0xab1c5ed5da6d8118ULL,
+    0xd807aa98a3030242ULL, 0x12835b0145706fbeULL, 0x243185be4ee4b28cULL, 0x550c7dc3d5ffb4e2ULL,
+    0x72be5d74f27b896fULL, 0x80deb1fe3b1696b1ULL, 0x9bdc06a725c71235ULL, 0xc19bf174cf692694ULL,
+    0xe49b69c19ef14ad2ULL, 0xefbe4786384f25e3ULL, 0x0fc19dc68b8cd5b5ULL, 0x240ca1cc77ac9c65ULL,
+    0x2de92c6f592b0275ULL, 0x4a7484aa6ea6e483ULL, 0x5cb0a9dcbd41fbd4ULL, 0x76f988da831153b5ULL,
+    0x983e5152ee66dfabULL, 0xa831c66d2db43210ULL, 0xb00327c898fb213fULL, 0xbf597fc7beef0ee4ULL,
+    0xc6e00bf33da88fc2ULL, 0xd5a79147930aa725ULL, 0x06ca6351e003826fULL, 0x142929670a0e6e70ULL,
+    0x27b70a8546d22ffcULL, 0x2e1b21385c26c926ULL, 0x4d2c6dfc5ac42aedULL, 0x53380d139d95b3dfULL,
+    0x650a73548baf63deULL, 0x766a0abb3c77b2a8ULL, 0x81c2c92e47edaee6ULL, 0x92722c851482353bULL,
+    0xa2bfe8a14cf10364ULL, 0xa81a664bbc423001ULL, 0xc24b8b70d0f89791ULL, 0xc76c51a30654be30ULL,
+    0xd192e819d6ef5218ULL, 0xd69906245565a910ULL, 0xf40e35855771202aULL, 0x106aa07032bbd1b8ULL,
+    0x19a4c116b8d2d0c8ULL, 0x1e376c085141ab53ULL, 0x2748774cdf8eeb99ULL, 0x34b0bcb5e19b48a8ULL,
+    0x391c0cb3c5c95a63ULL, 0x4ed8aa4ae3418acbULL, 0x5b9cca4f7763e373ULL, 0x682e6ff3d6b2b8a3ULL,
+    0x748f82ee5defb2fcULL, 0x78a5636f43172f60ULL, 0x84c87814a1f0ab72ULL, 0x8cc702081a6439ecULL,
+    0x90befffa23631e28ULL, 0xa4506cebde82bde9ULL, 0xbef9a3f7b2c67915ULL, 0xc67178f2e372532bULL,
+    0xca273eceea26619cULL, 0xd186b8c721c0c207ULL, 0xeada7dd6cde0eb1eULL, 0xf57d4f7fee6ed178ULL,
+    0x06f067aa72176fbaULL, 0x0a637dc5a2c898a6ULL, 0x113f9804bef90daeULL, 0x1b710b35131c471bULL,
+    0x28db77f523047d84ULL, 0x32caab7b40c72493ULL, 0x3c9ebe0a15c9bebcULL, 0x431d67c49c100d4cULL,
+    0x4cc5d4becb3e42b6ULL, 0x597f299cfc657e2aULL, 0x5fcb6fab3ad6faecULL, 0x6c44198c4a475817ULL
+};
+
+static const uint64_t IV[8] = {
+    0x6a09e667f3bcc908ULL, 0xbb67ae8584caa73bULL, 0x3c6ef372fe94f82bULL, 0xa54ff53a5f1d36f1ULL,
+    0x510e527fade682d1ULL, 0x9b05688c2b3e6c1fULL, 0x1f83d9abfb41bd6bULL, 0x5be0cd19137e2179ULL
+};
+
+#define ROTR(x, n) (((x) >> (n)) | ((x) << (64 - (n))))
+#define CH(x, y, z) (((x) & (y)) ^ (~(x) & (z)))
+#define MAJ(x, y, z) (((x) & (y)) ^ ((x) & (z)) ^ ((y) & (z)))
+#define S0(x) (ROTR(x, 28) ^ ROTR(x, 34) ^ ROTR(x, 39))
+#define S1(x) (ROTR(x, 14) ^ ROTR(x, 18) ^ ROTR(x, 41))
+#define s0(x) (ROTR(x, 1) ^ ROTR(x, 8) ^ ((x) >> 7))
+#define s1(x) (ROTR(x, 19) ^ ROTR(x, 61) ^ ((x) >> 6))
+
+/* One SHA-512 compression of the 16-word block into state; always inlined
+   so the unrolled rounds keep the working variables in registers across
+   the whole iteration loop instead of passing them through memory */
+static inline __attribute__((always_inline)) void sha512_compress(uint64_t state[8], const uint64_t block[16])
+{
+    uint64_t w[16];
+    uint64_t a = state[0], b = state[1], c = state[2], d = state[3];
+    uint64_t e = state[4], f = state[5], g = state[6], h = state[7];
+
+    memcpy(w, block, sizeof(w));
+
+    #pragma GCC unroll 80
+    for (int i = 0; i < 80; i++) {
+        if (i >= 16)
+            w[i & 15] += s1(w[(i - 2) & 15]) + w[(i - 7) & 15] + s0(w[(i - 15) & 15]);
+        uint64_t t1 = h + S1(e) + CH(e, f, g) + K[i] + w[i & 15];
+        uint64_t t2 = S0(a) + MAJ(a, b, c);
+        h = g; g = f; f = e; e = d + t1;
+        d = c; c = b; b = a; a = t1 + t2;
+    }
+
+    state[0] += a; state[1] += b; state[2] += c; state[3] += d;
+    state[4] += e; state[5] += f; state[6] += g; state[7] += h;
+}
+
+/* Set the constant padding of a block whose message is one 64-byte digest */
+static inline void pad_digest_block(uint64_t block[16])
+{
+    block[8] = 0x8000000000000000ULL;
+    for (int i = 9; i < 15; i++)
+        block[i] = 0;
+    block[15] = (BLOCK_SIZE + 64) * 8;
+}
+
+/* Derive the key for one password of at most BLOCK_SIZE bytes */
+void pbkdf2_hmac_sha512(const uint8_t *password, uint32_t length, uint8_t *out)
+{
+    /* Big-endian HMAC key words, zero padded to one block */
+    uint64_t key[16] = {0};
+    for (uint32_t i = 0; i < length; i++)
+        key[i >> 3] |= (uint64_t)password[i] << (56 - ((i & 7) << 3));
+
+    /* ipad/opad midstates, computed once per password */
+    uint64_t ipad[8], opad[8], block[16];
+    memcpy(ipad, IV, sizeof(ipad));
+    memcpy(opad, IV, sizeof(opad));
+    for (int i = 0; i < 16; i++)
+        block[i] = key[i] ^ 0x3636363636363636ULL;
+    sha512_compress(ipad, block);
+    for (int i = 0; i < 16; i++)
+        block[i] = key[i] ^ 0x5c5c5c5c5c5c5c5cULL;
+    sha512_compress(opad, block);
+
+    /* Both HMAC messages after the first are a single 64-byte digest, so
+       the padding words of the two blocks are set once; each iteration
+       only writes the digest words and resumes from the midstates */
+    uint64_t inner[16], outer[16];
+    pad_digest_block(inner);
+    pad_digest_block(outer);
+
+    /* U1 = HMAC(password, salt || INT(1)); the padded message is a constant */
+    memcpy(outer, ipad, 64);
+    sha512_compress(outer, FIRST_BLOCK);
+    memcpy(inner, opad, 64);
+    sha512_compress(inner, outer);
+
+    uint64_t t[KEY_WORDS];
+    memcpy(t, inner, sizeof(t));
+
+    /* U2..Un, each two compressions from the cached midstates; inner holds
+       U(n-1) in words 0..7 and outer receives the inner hash */
+    for (uint32_t n = 1; n < ITERATIONS; n++) {
+        memcpy(outer, ipad, 64);
+        sha512_compress(outer, inner);
+        memcpy(inner, opad, 64);
+        sha512_compress(inner, outer);
+        for (int i = 0; i < KEY_WORDS; i++)
+            t[i] ^= inner[i];
+    }
+
+    for (int i = 0; i < KEY_WORDS; i++)
+        for (int j = 0; j < 8; j++)
+            if (i * 8 + j < KEY_LENGTH)
+                out[i * 8 + j] = (uint8_t)(t[i] >> (56 - 8 * j));
+}
+"""
+
+def _target(compiler):
+    """
+    Return the target flags for this CPU and a string identifying the code they produce.
+
+    The predefined macros under -march=native (printed the same way by gcc
+    and clang) list the instruction set extensions the build may use. If
+    the compiler cannot tune for the host, the generic target is used.
+    """
+    try:
+        version = subprocess.run([compiler, '--version'], capture_output=True, text=True)
+        macros = subprocess.run([compiler, '-march=native', '-E', '-dM', '-x', 'c', os.devnull],
+                                capture_output=True, text=True)
+    except OSError as e:
+        raise OSError(f"Cannot run the C compiler {compiler}: {e}")
+    flags = ['-march=native'] if macros.returncode == 0 else []
+    features = ''.join(sorted(macros.stdout.splitlines(True))) if flags else ''
+    return flags, f"{platform.machine()}\n{version.stdout}\n{features}"
+
+def _first_block_words(salt):
+    """Return the padded (salt || INT(1)) HMAC message as 16 big-endian words."""
+    message = salt + b'\x00\x00\x00\x01'
+    bit_length = (BLOCK_SIZE + len(message)) * 8
+    block = message + b'\x80' + bytes(BLOCK_SIZE - len(message) - 1 - 16) + bit_length.to_bytes(16, 'big')
+    return [int.from_bytes(block[i:i + 8], 'big') for i in range(0, BLOCK_SIZE, 8)]
+
+class NativePBKDF2:
+    """PBKDF2-HMAC-SHA512 compiled for one salt and iteration count."""
+
+    def __init__(self, salt, iterations, key_length=32, compiler='cc', cache_dir=CACHE_DIR):
+        """
+        Generate, compile and load the C code for a fixed salt, iteration count and key length.
+
+        Args:
+            salt: Salt bytes (at most MAX_SALT_LENGTH)
+            iterations: Number of PBKDF2 iterations
+            key_length: Length of the derived keys (at most 64)
+            compiler: C compiler to invoke
+            cache_dir: Directory for the compiled shared libraries
+
+        Raises:
+            ValueError: If the parameters are not supported
+            OSError: If the library cannot be compiled or loaded
+        """
+        if len(salt) > MAX_SALT_LENGTH:
+            raise ValueError(f"Salt longer than {MAX_SALT_LENGTH} bytes is not supported")
+        if not 0 < key_length <= 64:
+            raise ValueError("Key length must be between 1 and 64 bytes")
+        if iterations < 1:
+            raise ValueError("Iterations must be a positive integer")
+
+        self.key_length = key_length
+
+        # Specialise the code for this wallet: the salt block, iteration
+        # count and key size become compile-time constants
+        first_block = ', '.join(f'0x{word:016x}ULL' for word in _first_block_words(salt))
+        source = (
+            f"#define BLOCK_SIZE {BLOCK_SIZE}\n"
+            f"#define ITERATIONS {iterations}u\n"
+            f"#define KEY_LENGTH {key_length}\n"
+            f"#define KEY_WORDS {(key_length + 7) // 8}\n"
+            f"static const unsigned long long FIRST_BLOCK[16] = {{{first_block}}};\n"
+        ) + _C_SOURCE
+
+        flags, target = _target(compiler)
+        self.path = self._build(source, target, [compiler, '-O3', *flags], cache_dir)
+        self._lib = ctypes.CDLL(self.path)
+        self._derive = self._lib.pbkdf2_hmac_sha512
+        self._derive.argtypes = (ctypes.c_char_p, ctypes.c_uint32, ctypes.c_char_p)
+        self._derive.restype = None
+
+        # A cached library is only trusted once it matches hashlib on a
+        # test password; a stale or miscompiled build is never used
+        check = b'native pbkdf2 self-test'
+        if self.derive(check) != hashlib.pbkdf2_hmac('sha512', check, salt, iterations, key_length):
+            raise OSError(f"{self.path} failed its self-test against hashlib")
+
+    @staticmethod
+    def _build(source, target, command, cache_dir):
+        """
+        Compile source into a shared library unless a cached build exists; return its path.
+
+        The cache key covers the source and the target, so a build is never
+        reused for a different salt, iteration count, CPU or toolchain.
+
+        The cache directory is created private (0700), and neither it nor a
+        cached library is used unless it belongs to the current user and no
+        one else can write to it.
+        """
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        dir_stat = os.lstat(cache_dir)
+        if not stat.S_ISDIR(dir_stat.st_mode):
+            raise OSError(f"Refusing {cache_dir}: not a directory")
+        _check_private(cache_dir, dir_stat)
+
+        digest = hashlib.sha256(f"{target}\n{source}".encode('utf-8')).hexdigest()[:16]
+        path = os.path.join(cache_dir, f'pbkdf2_sha512_{digest}.so')
+        try:
+            lib_stat = os.lstat(path)
+        except FileNotFoundError:
+            pass
+        else:
+            if not stat.S_ISREG(lib_stat.st_mode):
+                raise OSError(f"Refusing {path}: not a regular file")
+            _check_private(path, lib_stat)
+            return path
+
+        # Write the source and build the library under unique temporary
+        # names, then rename the library into place, so concurrent runs
+        # never compile a half-written source or load a half-written library
+        fd, source_path = tempfile.mkstemp(prefix=f'pbkdf2_sha512_{digest}.', suffix='.c', dir=cache_dir)
+        with os.fdopen(fd, 'w') as f:
+            f.write(source)
+        fd, tmp_path = tempfile.mkstemp(prefix=f'pbkdf2_sha512_{digest}.', suffix='.so.tmp', dir=cache_dir)
+        os.close(fd)
+        try:
+            result = subprocess.run(
+                [*command, '-shared', '-fPIC', '-o', tmp_path, source_path],
+                capture_output=True, text=True
+            )
+            if result.returncode != 0:
+                raise OSError(f"Compiling {source_path} failed: {result.stderr.strip()}")
+            # The linker's output mode follows the umask; keep it private
+            os.chmod(tmp_path, 0o700)
+            os.replace(tmp_path, path)
+        finally:
+            os.unlink(source_path)
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+        return path
+
+    def derive(self, password):
+        """
+        Derive the key for one password.
+
+        Args:
+            password: Password bytes
+
+        Returns:
+            Derived key bytes
+        """
+        # HMAC hashes keys longer than one block down to their digest
+        if len(password) > BLOCK_SIZE:
+            password = hashlib.sha512(password).digest()
+        out = ctypes.create_string_buffer(self.key_length)
+        self._derive(password, len(password), out)
+        return out.raw
@@ -7,11 +7,36 @@ import binascii
 import ecdsa
 from pywallet.config import network_bitcoin, network_testnet
 
+try:
+    import coincurve
+    COINCURVE_AVAILABLE = True
+except ImportError:
+    COINCURVE_AVAILABLE = False
+
+# RIPEMD-160 backend. hashlib.new() resolves the algorithm name through
+# OpenSSL on every call; copying a prepared hash object skips that lookup.
+# OpenSSL 3 builds without the legacy provider have no ripemd160 at all,
+# so fall back to pycryptodome there
+try:
+    _ripemd160_template = hashlib.new('ripemd160')
+
+    def _ripemd160(data):
+        h = _ripemd160_template.copy()
+        h.update(data)
+        return h.digest()
+except ValueError:
+    from Crypto.Hash import RIPEMD160
+
+    def _ripemd160(data):
+        return RIPEMD160.new(data).digest()
+
 def hash_160(public_key):
     """Perform RIPEMD-160(SHA-256(public_key))"""
-    md = hashlib.new('ripemd160')
-    md.update(hashlib.sha256(public_key).digest())
-    return md.digest()
+    return _ripemd160(hashlib.sha256(public_key).digest())
+
+def sha256d(data):
+    """Perform SHA-256(SHA-256(data)), the Base58Check checksum hash"""
+    return hashlib.sha256(hashlib.sha256(data).digest()).digest()
 
 def public_key_to_address(public_key, network=network_bitcoin):
     """Convert a public key to a Bitcoin address"""
@@ -21,50 +46,41 @@ def public_key_to_address(public_key, network=network_bitcoin):
 def hash_160_to_address(h160, addrtype):
     """Convert a RIPEMD-160 hash to a Bitcoin address"""
     vh160 = bytes([addrtype]) + h160
-    h = hashlib.sha256(hashlib.sha256(vh160).digest()).digest()
-    addr = vh160 + h[0:4]
+    addr = vh160 + sha256d(vh160)[0:4]
     return b58encode(addr)
 
+# Base58 alphabet and the digit value of each of its characters
+b58_digits = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+_b58_index = {c: i for i, c in enumerate(b58_digits)}
+
 def b58encode(v):
     """Base58 encode a string"""
-    b58_digits = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
-    
     long_value = int.from_bytes(v, byteorder='big')
     
-    result = ''
+    # Collect digits least significant first and join once
+    result = []
     while long_value >= 58:
-        div, mod = divmod(long_value, 58)
-        result = b58_digits[mod] + result
-        long_value = div
-    result = b58_digits[long_value] + result
+        long_value, mod = divmod(long_value, 58)
+        result.append(b58_digits[mod])
+    result.append(b58_digits[long_value])
     
     # Bitcoin does a little leading-zero dance
-    nPad = 0
-    for c in v:
-        if c == 0:
-            nPad += 1
-        else:
-            break
+    nPad = len(v) - len(v.lstrip(b'\x00'))
     
-    return b58_digits[0] * nPad + result
+    return b58_digits[0] * nPad + ''.join(reversed(result))
 
 def b58decode(v):
     """Base58 decode a string"""
-    b58_digits = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
-    
+    index = _b58_index
     long_value = 0
     for c in v:
-        long_value = long_value * 58 + b58_digits.find(c)
+        # Unknown characters count as -1, as str.find reported them
+        long_value = long_value * 58 + index.get(c, -1)
     
     result = long_value.to_bytes((long_value.bit_length() + 7) // 8, byteorder='big')
     
     # Bitcoin does a little leading-zero dance
-    nPad = 0
-    for c in v:
-        if c == b58_digits[0]:
-            nPad += 1
-        else:
-            break
+    nPad = len(v) - len(v.lstrip(b58_digits[0]))
     
     result = b'\x00' * nPad + result
     
@@ -79,7 +95,7 @@ def private_key_to_wif(private_key, compressed=True, network=network_bitcoin):
         extended_key = bytes([network['wif']]) + private_key
     
     # Double SHA-256 checksum
-    checksum = hashlib.sha256(hashlib.sha256(extended_key).digest()).digest()[:4]
+    checksum = sha256d(extended_key)[:4]
     
     # Encode with Base58
     return b58encode(extended_key + checksum)
@@ -93,7 +109,7 @@ def wif_to_private_key(wif, network=network_bitcoin):
         raise ValueError("WIF key is not for the correct network")
     
     # Check checksum
-    checksum = hashlib.sha256(hashlib.sha256(decoded[:-4]).digest()).digest()[:4]
+    checksum = sha256d(decoded[:-4])[:4]
     if checksum != decoded[-4:]:
         raise ValueError("WIF checksum is invalid")
     
@@ -105,6 +121,10 @@ def wif_to_private_key(wif, network=network_bitcoin):
 
 def private_key_to_public_key(private_key, compressed=True):
     """Convert a private key to a public key"""
+    if COINCURVE_AVAILABLE:
+        # libsecp256k1 is much faster than ecdsa's pure-Python arithmetic
+        return coincurve.PublicKey.from_secret(private_key).format(compressed=compressed)
+    
     # SECP256k1 is the Bitcoin elliptic curve
     sk = ecdsa.SigningKey.from_string(private_key, curve=ecdsa.SECP256k1)
     vk = sk.get_verifying_key()
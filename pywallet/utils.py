@@ -22,26 +22,32 @@ KeyInfo = collections.namedtuple('KeyInfo', 'secret private_key public_key uncom
 
 def plural(a):
     """Return 's' if a >= 2, otherwise return empty string"""
-    if a >= 2:
-        return 's'
-    return ''
+    return 's' if a >= 2 else ''
 
-def systype():
-    """Return the system type: 'Mac', 'Win', or 'Linux'"""
-    if platform.system() == "Darwin":
+def _detect_systype():
+    """Detect the system type: 'Mac', 'Win', or 'Linux'"""
+    system = platform.system()
+    if system == "Darwin":
         return 'Mac'
-    elif platform.system() == "Windows":
+    elif system == "Windows":
         return 'Win'
     return 'Linux'
 
+# The platform cannot change while the process runs, so detect it once
+_SYSTYPE = _detect_systype()
+
+def systype():
+    """Return the system type: 'Mac', 'Win', or 'Linux'"""
+    return _SYSTYPE
+
 def determine_db_dir():
     """Determine the default database directory based on the operating system"""
     from pywallet.config import wallet_dir
     
     if not wallet_dir:
-        if platform.system() == "Darwin":
+        if _SYSTYPE == 'Mac':
             return os.path.expanduser("~/Library/Application Support/Bitcoin/")
-        elif platform.system() == "Windows":
+        elif _SYSTYPE == 'Win':
             return os.path.join(os.environ['APPDATA'], "Bitcoin")
         return os.path.expanduser("~/.bitcoin")
     else:
@@ -57,7 +63,9 @@ def determine_db_name():
         return wallet_name
 
 def md5_2(string):
-    """Return the MD5 hash of a string"""
+    """Return the MD5 hash of a string or bytes"""
+    if isinstance(string, (bytes, bytearray)):
+        return hashlib.md5(string).hexdigest()
     return hashlib.md5(string.encode('utf-8')).hexdigest()
 
 def readpartfile(fd, offset, length):
@@ -76,6 +84,7 @@ def multiextract(s, ll):
     for length in ll:
         r.append(s[cursor:cursor + length])
         cursor += length
-    if s[cursor:] != b'':
+    # Compare offsets rather than slicing the remainder twice
+    if cursor < len(s):
         r.append(s[cursor:])
     return r
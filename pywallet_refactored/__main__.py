@@ -18,6 +18,31 @@ from pywallet_refactored.cli.commands import (
 )
 from pywallet_refactored.cli.batch_commands import handle_batch_command
 
+# Command handlers, keyed by subcommand name
+COMMANDS = {
+    'dump': dump_wallet,
+    'import': import_key,
+    'create': create_wallet,
+    'backup': backup_wallet,
+    'watchonly': create_watch_only_wallet,
+    'genkey': generate_key,
+    'checkaddr': check_address,
+    'checkkey': check_key,
+    'balance': check_balance,
+    'txhistory': get_tx_history,
+    'batch': handle_batch_command,
+    'recover': recover_keys,
+}
+
+# Legacy options and the subcommand each one selects, in priority order; a
+# subcommand earlier in this list wins over a later legacy option
+LEGACY_OPTIONS = (
+    ('dumpwallet', 'dump'),
+    ('importprivkey', 'import'),
+    ('createwallet', 'create'),
+    ('backupwallet', 'backup'),
+)
+
 def main(args: Optional[List[str]] = None) -> int:
     """
     Main entry point for PyWallet.
@@ -52,34 +77,16 @@ def main(args: Optional[List[str]] = None) -> int:
 
     # Execute command
     command = args_dict.get('command')
+    for option, legacy_command in LEGACY_OPTIONS:
+        if command == legacy_command or args_dict.get(option):
+            command = legacy_command
+            break
 
-    if command == 'dump' or args_dict.get('dumpwallet'):
-        return dump_wallet(args_dict)
-    elif command == 'import' or args_dict.get('importprivkey'):
-        return import_key(args_dict)
-    elif command == 'create' or args_dict.get('createwallet'):
-        return create_wallet(args_dict)
-    elif command == 'backup' or args_dict.get('backupwallet'):
-        return backup_wallet(args_dict)
-    elif command == 'watchonly':
-        return create_watch_only_wallet(args_dict)
-    elif command == 'genkey':
-        return generate_key(args_dict)
-    elif command == 'checkaddr':
-        return check_address(args_dict)
-    elif command == 'checkkey':
-        return check_key(args_dict)
-    elif command == 'balance':
-        return check_balance(args_dict)
-    elif command == 'txhistory':
-        return get_tx_history(args_dict)
-    elif command == 'batch':
-        return handle_batch_command(args_dict)
-    elif command == 'recover':
-        return recover_keys(args_dict)
-    else:
+    handler = COMMANDS.get(command)
+    if handler is None:
         logger.error("No command specified")
         return 1
+    return handler(args_dict)
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -7,8 +7,10 @@ This module provides functions for batch operations on Bitcoin keys.
 import os
 import csv
 import json
+import multiprocessing
 from typing import List, Dict, Any, Optional, Union, Tuple
 
+from pywallet_refactored.config import config
 from pywallet_refactored.logger import logger
 from pywallet_refactored.db.wallet import WalletDB, WalletDBError
 from pywallet_refactored.crypto.keys import (
@@ -345,13 +347,31 @@ def export_keys_to_text(keys: List[Dict[str, Any]], output_file: str, include_pr
     except Exception as e:
         raise BatchError(f"Failed to export keys to text: {e}")
 
-def generate_key_batch(count: int, compressed: bool = True) -> List[Dict[str, Any]]:
+def _generate_key_pair_worker(compressed: bool, network: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Generate one key pair in a worker process.
+    
+    Args:
+        compressed: Whether to use compressed format
+        network: Network parameters resolved in the parent process
+        
+    Returns:
+        Key pair dictionary, or None if generation failed
+    """
+    try:
+        return generate_key_pair(compressed, network)
+    except Exception as e:
+        logger.error(f"Failed to generate key: {e}")
+        return None
+
+def generate_key_batch(count: int, compressed: bool = True, jobs: int = 1) -> List[Dict[str, Any]]:
     """
     Generate a batch of key pairs.
     
     Args:
         count: Number of key pairs to generate
         compressed: Whether to use compressed format
+        jobs: Number of worker processes (1 generates in this process)
         
     Returns:
         List of key pair dictionaries
@@ -360,6 +380,20 @@ def generate_key_batch(count: int, compressed: bool = True) -> List[Dict[str, An
         BatchError: If the keys cannot be generated
     """
     try:
+        if jobs > 1 and count > 1:
+            # Key generation is pure CPU work, so spread it across processes
+            workers = min(jobs, count)
+            chunksize = min(256, -(-count // workers))
+            # Spawned workers start from a fresh config, so pass the network
+            # the parent is using rather than letting each child resolve it
+            network = config.get_network()
+            with multiprocessing.Pool(workers) as pool:
+                results = pool.starmap(_generate_key_pair_worker, [(compressed, network)] * count,
+                                       chunksize=chunksize)
+            keys = [key_pair for key_pair in results if key_pair is not None]
+            logger.debug(f"Generated {len(keys)}/{count} keys with {workers} worker processes")
+            return keys
+        
         keys = []
         
         for i in range(count):
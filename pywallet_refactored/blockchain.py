@@ -5,8 +5,10 @@ This module provides functions for interacting with the Bitcoin blockchain,
 including fetching balance information and transaction history.
 """
 
+import os
 import json
 import time
+import sqlite3
 import urllib.request
 import urllib.error
 from typing import Dict, List, Any, Optional, Union, Tuple
@@ -14,10 +16,112 @@ from typing import Dict, List, Any, Optional, Union, Tuple
 from pywallet_refactored.logger import logger
 from pywallet_refactored.config import config
 
+# Try to import msgspec for faster JSON decoding
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+    JSON_DECODE_ERRORS = (json.JSONDecodeError, msgspec.DecodeError)
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+    JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+
+# Default location of the on-disk HTTP response cache
+DEFAULT_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.pywallet_http_cache.sqlite')
+
+# Seconds a cached response stays fresh
+BALANCE_CACHE_TTL = 30
+TRANSACTIONS_CACHE_TTL = 300
+
 class BlockchainError(Exception):
     """Exception raised for blockchain interaction errors."""
     pass
 
+def decode_json(body: str) -> Any:
+    """
+    Decode a JSON response body.
+    
+    Uses msgspec when available, which builds the same dicts and lists
+    as the json module considerably faster on large transaction lists.
+    
+    Args:
+        body: JSON text
+        
+    Returns:
+        Decoded JSON value
+    """
+    if MSGSPEC_AVAILABLE:
+        return msgspec.json.decode(body)
+    return json.loads(body)
+
+class ResponseCache:
+    """Persistent TTL cache of raw API responses, keyed by URL."""
+    
+    def __init__(self, path: str):
+        """
+        Initialize response cache.
+        
+        Args:
+            path: Path to the SQLite cache file
+        """
+        self.path = path
+        self._conn = None
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the cache database on first use."""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            # The cache records every address looked up, so create it
+            # readable by the owner only (SQLite's journal copies the mode)
+            os.close(os.open(self.path, os.O_CREAT | os.O_WRONLY, 0o600))
+            # A cache file created before that keeps its old mode
+            os.chmod(self.path, 0o600)
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(url TEXT PRIMARY KEY, body TEXT NOT NULL, fetched_at REAL NOT NULL)"
+            )
+        return self._conn
+    
+    def get(self, url: str, ttl: float) -> Optional[str]:
+        """
+        Get a cached response body.
+        
+        Args:
+            url: Requested URL
+            ttl: Maximum age of the cached response in seconds
+            
+        Returns:
+            Response body, or None if missing or expired
+        """
+        row = self._connect().execute(
+            "SELECT body, fetched_at FROM responses WHERE url = ?", (url,)
+        ).fetchone()
+        
+        if row is None or time.time() - row[1] > ttl:
+            return None
+        
+        return row[0]
+    
+    def set(self, url: str, body: str) -> None:
+        """
+        Store a response body.
+        
+        Args:
+            url: Requested URL
+            body: Response body
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (url, body, fetched_at) VALUES (?, ?, ?)",
+                (url, body, time.time())
+            )
+    
+    def close(self) -> None:
+        """Close the cache database."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
 class BlockchainAPI:
     """Base class for blockchain API providers."""
     
@@ -25,6 +129,22 @@ class BlockchainAPI:
         """Initialize blockchain API."""
         self.rate_limit_delay = 1.0  # seconds between requests
         self._last_request_time = 0
+        self._cache = None
+    
+    def _get_cache(self) -> Optional[ResponseCache]:
+        """
+        Get the response cache.
+        
+        Returns:
+            ResponseCache instance, or None if caching is disabled
+        """
+        if os.environ.get('PYWALLET_NO_CACHE'):
+            return None
+        
+        if self._cache is None:
+            self._cache = ResponseCache(config.get('http_cache_file') or DEFAULT_CACHE_FILE)
+        
+        return self._cache
     
     def _rate_limit(self):
         """Apply rate limiting to API requests."""
@@ -36,12 +156,18 @@ class BlockchainAPI:
         
         self._last_request_time = time.time()
     
-    def _make_request(self, url: str) -> Dict[str, Any]:
+    def _make_request(self, url: str, ttl: float = 0) -> Dict[str, Any]:
         """
         Make an HTTP request to the API.
         
+        Responses are served from the on-disk cache when a fresh copy exists.
+        The cache file (mode 0600) keeps the URLs, and so the addresses, of
+        every lookup until it is deleted; set PYWALLET_NO_CACHE=1 to bypass
+        it and leave no such record.
+        
         Args:
             url: URL to request
+            ttl: Seconds a cached response stays fresh (0 disables caching)
             
         Returns:
             JSON response as dictionary
@@ -49,19 +175,39 @@ class BlockchainAPI:
         Raises:
             BlockchainError: If the request fails
         """
+        cache = self._get_cache() if ttl > 0 else None
+        
+        if cache is not None:
+            try:
+                body = cache.get(url, ttl)
+                if body is not None:
+                    logger.debug(f"Using cached response for {url}")
+                    return decode_json(body)
+            except (sqlite3.Error, OSError) + JSON_DECODE_ERRORS as e:
+                logger.debug(f"Ignoring response cache: {e}")
+        
         self._rate_limit()
         
         try:
             with urllib.request.urlopen(url) as response:
-                return json.loads(response.read().decode('utf-8'))
+                body = response.read().decode('utf-8')
+            data = decode_json(body)
         except urllib.error.HTTPError as e:
             raise BlockchainError(f"HTTP error: {e.code} - {e.reason}")
         except urllib.error.URLError as e:
             raise BlockchainError(f"URL error: {e.reason}")
-        except json.JSONDecodeError:
+        except JSON_DECODE_ERRORS:
             raise BlockchainError("Invalid JSON response")
         except Exception as e:
             raise BlockchainError(f"Request failed: {e}")
+        
+        if cache is not None:
+            try:
+                cache.set(url, body)
+            except (sqlite3.Error, OSError) as e:
+                logger.debug(f"Failed to cache response for {url}: {e}")
+        
+        return data
     
     def get_balance(self, address: str) -> int:
         """
@@ -120,7 +266,7 @@ class BlockchainInfoAPI(BlockchainAPI):
         url = f"{self.base_url}/balance?active={address}&format=json"
         
         try:
-            response = self._make_request(url)
+            response = self._make_request(url, ttl=BALANCE_CACHE_TTL)
             if address in response:
                 return response[address]['final_balance']
             else:
@@ -144,7 +290,7 @@ class BlockchainInfoAPI(BlockchainAPI):
         url = f"{self.base_url}/rawaddr/{address}"
         
         try:
-            response = self._make_request(url)
+            response = self._make_request(url, ttl=TRANSACTIONS_CACHE_TTL)
             if 'txs' in response:
                 return response['txs']
             else:
@@ -177,7 +323,7 @@ class BlockcypherAPI(BlockchainAPI):
         url = f"{self.base_url}/addrs/{address}/balance"
         
         try:
-            response = self._make_request(url)
+            response = self._make_request(url, ttl=BALANCE_CACHE_TTL)
             if 'final_balance' in response:
                 return response['final_balance']
             else:
@@ -201,7 +347,7 @@ class BlockcypherAPI(BlockchainAPI):
         url = f"{self.base_url}/addrs/{address}/full"
         
         try:
-            response = self._make_request(url)
+            response = self._make_request(url, ttl=TRANSACTIONS_CACHE_TTL)
             if 'txs' in response:
                 return response['txs']
             else:
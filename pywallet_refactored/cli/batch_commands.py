@@ -121,10 +121,14 @@ def batch_generate_keys(args: Dict[str, Any]) -> int:
         
         # Get options
         compressed = not args.get('uncompressed', False)
+        jobs = args.get('jobs') or 1
+        if jobs < 1:
+            logger.error("Jobs must be a positive integer")
+            return 1
         
         # Generate keys
         logger.info(f"Generating {count} key pairs...")
-        keys = generate_key_batch(count, compressed)
+        keys = generate_key_batch(count, compressed, jobs=jobs)
         
         if not keys:
             logger.warning("No keys were generated")
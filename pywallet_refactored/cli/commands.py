@@ -13,8 +13,15 @@ from typing import Dict, List, Any, Optional, Tuple, Callable, Union
 from pywallet_refactored.logger import logger
 from pywallet_refactored.config import config
 from pywallet_refactored.db.wallet import WalletDB, WalletDBError
-from pywallet_refactored.crypto.keys import generate_key_pair, is_valid_address, is_valid_wif
+from pywallet_refactored.crypto.keys import (
+    generate_key_pair, is_valid_address, is_valid_wif,
+    wif_to_private_key, private_key_to_public_key, public_key_to_address
+)
 from pywallet_refactored.blockchain import get_balance, get_transactions, BlockchainError
+from pywallet_refactored.recovery import (
+    scan_file, scan_device, recover_keys_from_passphrase,
+    dump_keys_to_file, dump_encrypted_keys_to_file
+)
 
 def dump_wallet(args: Dict[str, Any]) -> int:
     """
@@ -360,8 +367,6 @@ def check_key(args: Dict[str, Any]) -> int:
             print(f"Private key is valid")
 
             # Get address
-            from pywallet_refactored.crypto.keys import wif_to_private_key, private_key_to_public_key, public_key_to_address
-
             private_key, compressed = wif_to_private_key(key)
             public_key = private_key_to_public_key(private_key, compressed)
             address = public_key_to_address(public_key)
@@ -507,11 +512,6 @@ def recover_keys(args: Dict[str, Any]) -> int:
         Exit code (0 for success, non-zero for error)
     """
     try:
-        from pywallet_refactored.recovery import (
-            scan_file, scan_device, recover_keys_from_passphrase,
-            dump_keys_to_file, dump_encrypted_keys_to_file
-        )
-
         # Get source
         file_path = args.get('file')
         device_path = args.get('device')
@@ -5,6 +5,7 @@ This module provides a command-line argument parser for PyWallet.
 """
 
 import argparse
+import functools
 import sys
 from typing import Dict, List, Any, Optional, Tuple
 
@@ -321,6 +322,12 @@ def create_parser() -> argparse.ArgumentParser:
         action='store_true',
         help='Generate uncompressed keys'
     )
+    batch_generate_parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Number of worker processes to generate keys with'
+    )
 
     # Recovery commands
     recovery_parser = subparsers.add_parser(
@@ -395,6 +402,19 @@ def create_parser() -> argparse.ArgumentParser:
 
     return parser
 
+@functools.lru_cache(maxsize=1)
+def get_parser() -> argparse.ArgumentParser:
+    """
+    Return the shared command-line argument parser.
+
+    The parser is built once per process; parsing does not modify it, so
+    repeated in-process invocations can reuse it.
+
+    Returns:
+        ArgumentParser instance
+    """
+    return create_parser()
+
 def parse_args(args: Optional[List[str]] = None) -> Dict[str, Any]:
     """
     Parse command-line arguments.
@@ -405,7 +425,7 @@ def parse_args(args: Optional[List[str]] = None) -> Dict[str, Any]:
     Returns:
         Dictionary of parsed arguments
     """
-    parser = create_parser()
+    parser = get_parser()
 
     if args is None:
         args = sys.argv[1:]
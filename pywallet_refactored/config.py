@@ -18,6 +18,7 @@ DEFAULT_CONFIG = {
     "debug": False,
     "log_level": "INFO",
     "log_file": "",
+    "http_cache_file": "",
 }
 
 # Bitcoin network parameters
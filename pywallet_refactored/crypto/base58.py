@@ -11,6 +11,9 @@ from typing import Union, Optional
 # Base58 alphabet
 BASE58_ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
 
+# Digit value of each alphabet character, for O(1) lookups when decoding
+_BASE58_INDEX = {char: index for index, char in enumerate(BASE58_ALPHABET)}
+
 def b58encode(data: bytes) -> str:
     """
     Encode bytes using Base58.
@@ -24,19 +27,16 @@ def b58encode(data: bytes) -> str:
     # Convert bytes to integer
     n = int.from_bytes(data, byteorder='big')
     
-    # Convert to base58 string
-    result = ''
+    # Convert to base58 digits, least significant first
+    digits = []
     while n > 0:
         n, remainder = divmod(n, 58)
-        result = BASE58_ALPHABET[remainder] + result
+        digits.append(BASE58_ALPHABET[remainder])
     
     # Add '1' characters for leading zero bytes
-    for byte in data:
-        if byte != 0:
-            break
-        result = '1' + result
+    pad_count = len(data) - len(data.lstrip(b'\x00'))
     
-    return result
+    return '1' * pad_count + ''.join(reversed(digits))
 
 def b58decode(encoded: str) -> bytes:
     """
@@ -47,24 +47,39 @@ def b58decode(encoded: str) -> bytes:
         
     Returns:
         Decoded bytes
+        
+    Raises:
+        ValueError: If encoded contains a character outside the alphabet
     """
     # Convert base58 string to integer
+    index = _BASE58_INDEX
     n = 0
-    for char in encoded:
-        n = n * 58 + BASE58_ALPHABET.index(char)
+    try:
+        for char in encoded:
+            n = n * 58 + index[char]
+    except KeyError:
+        raise ValueError(f"Invalid Base58 character: {char!r}")
     
     # Convert to bytes
     result = n.to_bytes((n.bit_length() + 7) // 8, byteorder='big')
     
     # Add leading zero bytes
-    pad_count = 0
-    for char in encoded:
-        if char != '1':
-            break
-        pad_count += 1
+    pad_count = len(encoded) - len(encoded.lstrip('1'))
     
     return b'\x00' * pad_count + result
 
+def sha256d(data: bytes) -> bytes:
+    """
+    Compute SHA-256(SHA-256(data)), the Base58Check checksum hash.
+    
+    Args:
+        data: Data to hash
+        
+    Returns:
+        32-byte double SHA-256 digest
+    """
+    return hashlib.sha256(hashlib.sha256(data).digest()).digest()
+
 def b58encode_check(data: bytes) -> str:
     """
     Encode bytes using Base58 with a 4-byte checksum.
@@ -76,7 +91,7 @@ def b58encode_check(data: bytes) -> str:
         Base58Check encoded string
     """
     # Add 4-byte hash check to the end
-    checksum = hashlib.sha256(hashlib.sha256(data).digest()).digest()[:4]
+    checksum = sha256d(data)[:4]
     return b58encode(data + checksum)
 
 def b58decode_check(encoded: str) -> Optional[bytes]:
@@ -96,7 +111,7 @@ def b58decode_check(encoded: str) -> Optional[bytes]:
         return None
     
     data, checksum = decoded[:-4], decoded[-4:]
-    calculated_checksum = hashlib.sha256(hashlib.sha256(data).digest()).digest()[:4]
+    calculated_checksum = sha256d(data)[:4]
     
     if checksum != calculated_checksum:
         return None
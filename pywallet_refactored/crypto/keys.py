@@ -14,7 +14,14 @@ try:
 except ImportError:
     ecdsa = None
 
-from pywallet_refactored.crypto.base58 import b58encode, b58decode, b58encode_check, b58decode_check
+# Try to import coincurve (libsecp256k1) for fast public key derivation
+try:
+    import coincurve
+    COINCURVE_AVAILABLE = True
+except ImportError:
+    COINCURVE_AVAILABLE = False
+
+from pywallet_refactored.crypto.base58 import b58decode, b58encode_check, b58decode_check
 from pywallet_refactored.utils.common import bytes_to_hex, hex_to_bytes
 from pywallet_refactored.config import config
 
@@ -32,10 +39,7 @@ def hash160(data: bytes) -> bytes:
     Returns:
         RIPEMD-160 of SHA-256 hash
     """
-    sha256_hash = hashlib.sha256(data).digest()
-    ripemd160 = hashlib.new('ripemd160')
-    ripemd160.update(sha256_hash)
-    return ripemd160.digest()
+    return hashlib.new('ripemd160', hashlib.sha256(data).digest()).digest()
 
 def hash_160_to_address(h160: bytes, version: int = 0) -> str:
     """
@@ -48,14 +52,8 @@ def hash_160_to_address(h160: bytes, version: int = 0) -> str:
     Returns:
         Bitcoin address
     """
-    # Add version byte
-    vh160 = bytes([version]) + h160
-
-    # Add checksum
-    checksum = hashlib.sha256(hashlib.sha256(vh160).digest()).digest()[:4]
-
-    # Encode with Base58
-    return b58encode(vh160 + checksum)
+    # Add version byte and encode with Base58Check
+    return b58encode_check(bytes([version]) + h160)
 
 def public_key_to_address(public_key: Union[bytes, str], network: Optional[Dict[str, Any]] = None) -> str:
     """
@@ -78,14 +76,8 @@ def public_key_to_address(public_key: Union[bytes, str], network: Optional[Dict[
     # Hash the public key
     h160 = hash160(public_key)
 
-    # Add version byte
-    vh160 = bytes([network['pubKeyHash']]) + h160
-
-    # Add checksum
-    checksum = hashlib.sha256(hashlib.sha256(vh160).digest()).digest()[:4]
-
-    # Encode with Base58
-    return b58encode(vh160 + checksum)
+    # Add version byte and encode with Base58Check
+    return b58encode_check(bytes([network['pubKeyHash']]) + h160)
 
 def private_key_to_wif(private_key: bytes, compressed: bool = True, network: Optional[Dict[str, Any]] = None) -> str:
     """
@@ -154,22 +146,35 @@ def private_key_to_public_key(private_key: bytes, compressed: bool = True) -> by
     Returns:
         Public key bytes
     """
+    if COINCURVE_AVAILABLE:
+        # libsecp256k1 uses precomputed generator tables in C; much faster
+        # than ecdsa's pure-Python point multiplication
+        return coincurve.PublicKey.from_secret(private_key).format(compressed=compressed)
+
     if ecdsa is None:
         raise ImportError("ecdsa module is required for key operations")
 
-    # SECP256k1 is the Bitcoin elliptic curve
+    # SECP256k1 is the Bitcoin elliptic curve. ecdsa builds a precomputed
+    # table of generator multiples on first use and keeps it on the curve's
+    # generator, so repeated derivations do not redo that setup
     sk = ecdsa.SigningKey.from_string(private_key, curve=ecdsa.SECP256k1)
     vk = sk.get_verifying_key()
 
+    # The point is in Jacobian coordinates and every x()/y() call does a
+    # modular inversion, so convert to affine once and reuse the coordinates
+    point = vk.pubkey.point.to_affine()
+    x = point.x().to_bytes(32, byteorder='big')
+    y = point.y()
+
     if compressed:
         # Compressed public key format
-        if vk.pubkey.point.y() & 1:  # Odd y
-            return b'\x03' + vk.pubkey.point.x().to_bytes(32, byteorder='big')
+        if y & 1:  # Odd y
+            return b'\x03' + x
         else:  # Even y
-            return b'\x02' + vk.pubkey.point.x().to_bytes(32, byteorder='big')
+            return b'\x02' + x
     else:
         # Uncompressed public key format
-        return b'\x04' + vk.pubkey.point.x().to_bytes(32, byteorder='big') + vk.pubkey.point.y().to_bytes(32, byteorder='big')
+        return b'\x04' + x + y.to_bytes(32, byteorder='big')
 
 def generate_key_pair(compressed: bool = True, network: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
     """
@@ -10,7 +10,7 @@ import hashlib
 import binascii
 import json
 import time
-from typing import Dict, List, Any, Optional, Tuple, Callable, Union, BinaryIO
+from typing import Dict, List, Any, Optional, Tuple, Callable, Union, BinaryIO, Iterator
 
 from pywallet_refactored.utils.datastream import BCDataStream
 from pywallet_refactored.crypto.keys import (
@@ -62,6 +62,17 @@ except ImportError:
 
 from pywallet_refactored.logger import logger
 
+# Try to import msgspec for faster JSON encoding of wallet dumps
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+def _encode_json(obj: Any) -> bytes:
+    """Encode obj as compact UTF-8 JSON, matching msgspec.json.encode."""
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
 def get_tmp_dir() -> str:
     """
     Get the path to the tmp directory for Berkeley DB temporary files.
@@ -198,6 +209,30 @@ class WalletDB:
 
         logger.info("Closed wallet database")
 
+    def iter_records(self) -> Iterator[Tuple[bytes, bytes]]:
+        """
+        Iterate over the raw records of the open wallet database.
+
+        Records are fetched from a database cursor one at a time, so only
+        the current record is held in memory. The cursor is closed when
+        iteration finishes or the generator is closed.
+
+        Yields:
+            (key, value) byte strings for each record
+        """
+        cursor = self.db.cursor()
+        try:
+            while True:
+                try:
+                    record = cursor.next()
+                except DBNotFoundError:
+                    return
+
+                if record:
+                    yield record
+        finally:
+            cursor.close()
+
     def read_wallet(self, passphrase: str = "") -> Dict[str, Any]:
         """
         Read wallet data.
@@ -257,16 +292,16 @@ class WalletDB:
         # Define helper functions for parsing transactions
         def parse_TxIn(vds):
             d = {}
-            d['prevout_hash'] = binascii.hexlify(vds.read_bytes(32)).decode('utf-8')
-            d['prevout_n'] = vds.read_uint32()
-            d['scriptSig'] = binascii.hexlify(vds.read_bytes(vds.read_compact_size())).decode('utf-8')
+            prevout_hash, d['prevout_n'] = vds.read_record("<32sI")
+            d['prevout_hash'] = prevout_hash.hex()
+            d['scriptSig'] = vds.read_bytes(vds.read_compact_size()).hex()
             d['sequence'] = vds.read_uint32()
             return d
 
         def parse_TxOut(vds):
             d = {}
             d['value'] = vds.read_int64() / 1e8  # Convert satoshis to BTC
-            d['scriptPubKey'] = binascii.hexlify(vds.read_bytes(vds.read_compact_size())).decode('utf-8')
+            d['scriptPubKey'] = vds.read_bytes(vds.read_compact_size()).hex()
             return d
 
         def parse_BlockLocator(vds):
@@ -276,35 +311,25 @@ class WalletDB:
                 d['hashes'].append(vds.read_bytes(32))
             return d
 
-        # Get all items from the database
-        cursor = self.db.cursor()
+        # Walk the database one record at a time
         record_count = 0
         key_count = 0
         tx_count = 0
 
-        # First pass: read all records
         logger.info("Starting to read wallet records...")
         max_records = 10000  # Maximum number of records to read
-        while True:
-            try:
-                record = cursor.next()
-                record_count += 1
-                if record_count % 100 == 0:
-                    logger.info(f"Read {record_count} records so far...")
-
-                # Check if we've reached the maximum number of records
-                if record_count >= max_records:
-                    logger.warning(f"Reached maximum number of records ({max_records}). Stopping record reading.")
-                    break
-            except DBNotFoundError:
-                logger.info("Finished reading all records.")
+        records = self.iter_records()
+        for key, value in records:
+            record_count += 1
+            if record_count % 100 == 0:
+                logger.info(f"Read {record_count} records so far...")
+
+            # Check if we've reached the maximum number of records
+            if record_count >= max_records:
+                logger.warning(f"Reached maximum number of records ({max_records}). Stopping record reading.")
+                records.close()
                 break
 
-            if not record:
-                continue
-
-            key, value = record
-
             # Clear data streams
             kds.clear()
             vds.clear()
@@ -315,7 +340,7 @@ class WalletDB:
 
             # Read type from key
             type_bytes = key[0:4]
-            type_str = binascii.hexlify(type_bytes).decode('utf-8')
+            type_str = type_bytes.hex()
             logger.info(f"Record type: {type_str}, key length: {len(key)}, value length: {len(value)}")
 
             # Convert type bytes to string for easier comparison
@@ -326,17 +351,16 @@ class WalletDB:
                 nID = kds.read_bytes(4)[0]  # Read ID from key
                 encrypted_key = vds.read_bytes(vds.read_compact_size())
                 salt = vds.read_bytes(vds.read_compact_size())
-                method = vds.read_uint32()
-                iterations = vds.read_uint32()
+                method, iterations = vds.read_record("<II")
                 other_params = vds.read_bytes(vds.read_compact_size())
 
                 self.json_db['mkey'] = {
                     'nID': nID,
-                    'encrypted_key': binascii.hexlify(encrypted_key).decode('utf-8'),
-                    'salt': binascii.hexlify(salt).decode('utf-8'),
+                    'encrypted_key': encrypted_key.hex(),
+                    'salt': salt.hex(),
                     'method': method,
                     'iterations': iterations,
-                    'otherParams': binascii.hexlify(other_params).decode('utf-8') if other_params else ''
+                    'otherParams': other_params.hex() if other_params else ''
                 }
 
                 logger.debug(f"Found master key: iterations={iterations}, method={method}")
@@ -358,8 +382,8 @@ class WalletDB:
                     address = public_key_to_address(public_key)
 
                     self.json_db['ckey'].append({
-                        'pubkey': binascii.hexlify(public_key).decode('utf-8'),
-                        'encrypted_privkey': binascii.hexlify(encrypted_private_key).decode('utf-8'),
+                        'pubkey': public_key.hex(),
+                        'encrypted_privkey': encrypted_private_key.hex(),
                         'compressed': compressed,
                         'addr': address,
                         'reserve': 1
@@ -373,8 +397,7 @@ class WalletDB:
             elif type_str == "046b6579" or type_str.startswith("046b65"):  # "\x04key"
                 # Regular key
                 public_key = kds.read_bytes(kds.read_compact_size())
-                nVersion = vds.read_uint32()
-                created_time = vds.read_uint32()
+                nVersion, created_time = vds.read_record("<II")
                 private_key = vds.read_bytes(32)
 
                 # Determine if key is compressed
@@ -385,8 +408,8 @@ class WalletDB:
                 wif = private_key_to_wif(private_key, compressed)
 
                 self.json_db['keys'].append({
-                    'pubkey': binascii.hexlify(public_key).decode('utf-8'),
-                    'hexsec': binascii.hexlify(private_key).decode('utf-8'),
+                    'pubkey': public_key.hex(),
+                    'hexsec': private_key.hex(),
                     'sec': wif,
                     'created': created_time,
                     'compressed': compressed,
@@ -401,13 +424,12 @@ class WalletDB:
                 # Key pool
                 try:
                     n = kds.read_uint64()
-                    nVersion = vds.read_uint32()
-                    nTime = vds.read_uint32()
+                    nVersion, nTime = vds.read_record("<II")
 
                     # Try to read the public key, but it might not be present in all pool entries
                     try:
                         public_key = vds.read_bytes(vds.read_compact_size())
-                        public_key_hex = binascii.hexlify(public_key).decode('utf-8')
+                        public_key_hex = public_key.hex()
                     except Exception:
                         public_key_hex = ""
 
@@ -441,7 +463,7 @@ class WalletDB:
             elif type_str.startswith("0274"):  # Transaction
                 try:
                     # Transaction
-                    tx_hash = binascii.hexlify(key[4:]).decode('utf-8')
+                    tx_hash = key[4:].hex()
 
                     # For transactions, we'll just store the raw data for now
                     # This is a complex format that requires special handling
@@ -475,7 +497,7 @@ class WalletDB:
                 nVersion = vds.read_uint32()
                 block_locator = parse_BlockLocator(vds)
                 if 'hashes' in block_locator and len(block_locator['hashes']) > 0:
-                    self.json_db['bestblock'] = binascii.hexlify(block_locator['hashes'][0][::-1]).decode('utf-8')  # Reverse for big-endian
+                    self.json_db['bestblock'] = block_locator['hashes'][0][::-1].hex()  # Reverse for big-endian
                     logger.debug(f"Best block: {self.json_db['bestblock']}")
 
         logger.info(f"Read {record_count} wallet records ({key_count} keys, {tx_count} transactions) in {time.time() - start_time:.2f} seconds")
@@ -702,6 +724,9 @@ class WalletDB:
         """
         Dump wallet data to a JSON file.
 
+        The JSON is compact rather than indented: the header fields come
+        first, then the "keys" array last, one key object per line.
+
         Args:
             output_file: Path to output file
             include_private: Whether to include private keys
@@ -714,29 +739,29 @@ class WalletDB:
             if not self.json_db['keys'] and not self.json_db['ckey']:
                 self.read_wallet()
 
-            # Create a copy of the wallet data
-            wallet_data = {
-                'keys': [],
+            # Everything but the key list is small, so encode it as one
+            # object and splice the keys in after it
+            header = {
                 'transactions': len(self.json_db['tx']),
                 'names': self.json_db['names'],
                 'encrypted': bool(self.json_db['ckey'])
             }
-
-            # Add keys
-            for key in self.json_db['keys']:
-                key_data = {
-                    'address': key['address'],
-                    'compressed': key['compressed']
-                }
-
-                if include_private:
-                    key_data['wif'] = key['wif']
-
-                wallet_data['keys'].append(key_data)
-
-            # Write to file
-            with open(output_file, 'w') as f:
-                json.dump(wallet_data, f, indent=4)
+            if include_private:
+                fields = ('address', 'compressed', 'wif')
+            else:
+                fields = ('address', 'compressed')
+
+            # Write the keys one entry per line straight from json_db, with
+            # no second copy of the key list and no whole-document encode
+            # (json_db itself still holds every key)
+            encode = msgspec.json.encode if MSGSPEC_AVAILABLE else _encode_json
+            with open(output_file, 'wb') as f:
+                f.write(encode(header)[:-1] + b',"keys":[\n')
+                separator = b''
+                for key in self.json_db['keys']:
+                    f.write(separator + encode({field: key[field] for field in fields}))
+                    separator = b',\n'
+                f.write(b'\n]}\n')
 
             logger.info(f"Dumped wallet to {output_file}")
         except Exception as e:
@@ -774,18 +799,7 @@ class WalletDB:
                 self.open(read_only=False)
 
             # Check if key already exists
-            cursor = self.db.cursor()
-            while True:
-                try:
-                    record = cursor.next()
-                except DBNotFoundError:
-                    break
-
-                if not record:
-                    continue
-
-                key, value = record
-
+            for key, value in self.iter_records():
                 if key[0:4] == b"\x04key" and key[4:] == public_key:
                     logger.warning(f"Key already exists in wallet: {address}")
                     return address
@@ -905,17 +919,7 @@ class WalletDB:
             backup_db.open(os.path.basename(backup_path), "main", DB_BTREE, DB_CREATE)
 
             # Copy records
-            cursor = self.db.cursor()
-            while True:
-                try:
-                    record = cursor.next()
-                except DBNotFoundError:
-                    break
-
-                if not record:
-                    continue
-
-                key, value = record
+            for key, value in self.iter_records():
                 backup_db.put(key, value)
 
             # Close backup
@@ -962,18 +966,7 @@ class WalletDB:
             watch_db.open(os.path.basename(output_path), "main", DB_BTREE, DB_CREATE)
 
             # Copy non-private records
-            cursor = self.db.cursor()
-            while True:
-                try:
-                    record = cursor.next()
-                except DBNotFoundError:
-                    break
-
-                if not record:
-                    continue
-
-                key, value = record
-
+            for key, value in self.iter_records():
                 # Skip private key records
                 if key.startswith(b"\x04key"):
                     # Extract public key from private key record
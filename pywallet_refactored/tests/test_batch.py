@@ -7,6 +7,7 @@ import os
 import tempfile
 import json
 import csv
+import multiprocessing
 from unittest.mock import patch, MagicMock
 
 from pywallet_refactored.batch import (
@@ -15,6 +16,7 @@ from pywallet_refactored.batch import (
     export_keys_to_json, export_keys_to_csv, export_keys_to_text,
     generate_key_batch, save_key_batch, BatchError
 )
+from pywallet_refactored.config import config
 
 class TestBatchOperations(unittest.TestCase):
     """Tests for batch operations."""
@@ -367,6 +369,29 @@ class TestBatchOperations(unittest.TestCase):
         
         mock_generate_key.assert_called_with(False)
     
+    def test_generate_key_batch_jobs(self):
+        """Test generating a batch of keys in worker processes."""
+        keys = generate_key_batch(4, jobs=2)
+        
+        self.assertEqual(len(keys), 4)
+        self.assertEqual(len({key['address'] for key in keys}), 4)
+        self.assertTrue(all(key['compressed'] for key in keys))
+
+    def test_generate_key_batch_jobs_network(self):
+        """Test that worker processes use the network configured at runtime."""
+        # Spawned workers re-import the config, as on macOS and Windows
+        spawn_pool = multiprocessing.get_context('spawn').Pool
+        self.addCleanup(config.set, 'network', config.get('network'))
+        config.set('network', 'testnet')
+
+        with patch('pywallet_refactored.batch.multiprocessing.Pool', spawn_pool):
+            keys = generate_key_batch(2, jobs=2)
+
+        self.assertEqual(len(keys), 2)
+        for key in keys:
+            self.assertIn(key['address'][0], 'mn')
+            self.assertTrue(key['wif'].startswith('c'))
+
     def test_save_key_batch(self):
         """Test saving a batch of keys."""
         # Test JSON
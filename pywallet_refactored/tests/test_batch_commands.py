@@ -188,7 +188,7 @@ class TestBatchCommands(unittest.TestCase):
         
         result = batch_generate_keys(args)
         
-        mock_generate_keys.assert_called_once_with(2, True)
+        mock_generate_keys.assert_called_once_with(2, True, jobs=1)
         mock_save_keys.assert_called_once_with(
             [{'address': '1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa'}, {'address': '1BvBMSEYstWetqTFn5Au4m4GFg7xJaNVN2'}],
             self.output_path
@@ -207,9 +207,30 @@ class TestBatchCommands(unittest.TestCase):
         
         result = batch_generate_keys(args)
         
-        mock_generate_keys.assert_called_once_with(2, False)
+        mock_generate_keys.assert_called_once_with(2, False, jobs=1)
         self.assertEqual(result, 0)
         
+        # Test with worker processes
+        mock_generate_keys.reset_mock()
+        
+        args = {
+            'count': 2,
+            'output': self.output_path,
+            'jobs': 2
+        }
+        
+        result = batch_generate_keys(args)
+        
+        mock_generate_keys.assert_called_once_with(2, True, jobs=2)
+        self.assertEqual(result, 0)
+        
+        # Test with invalid jobs
+        args['jobs'] = -1
+        
+        result = batch_generate_keys(args)
+        
+        self.assertEqual(result, 1)
+        
         # Test with invalid count
         args = {
             'count': 0,
@@ -3,13 +3,15 @@ Tests for the blockchain module.
 """
 
 import unittest
+import os
 import json
+import tempfile
 from unittest.mock import patch, MagicMock
 
 from pywallet_refactored.blockchain import (
-    BlockchainAPI, BlockchainInfoAPI, BlockcypherAPI,
-    get_api_provider, get_balance, get_transactions, format_btc,
-    BlockchainError
+    BlockchainAPI, BlockchainInfoAPI, BlockcypherAPI, ResponseCache,
+    get_api_provider, get_balance, get_transactions, format_btc, decode_json,
+    BlockchainError, BALANCE_CACHE_TTL, TRANSACTIONS_CACHE_TTL
 )
 
 class TestBlockchainAPI(unittest.TestCase):
@@ -53,6 +55,83 @@ class TestBlockchainAPI(unittest.TestCase):
             mock_urlopen.assert_called_once_with('https://example.com/api')
             self.assertEqual(result, {'test': 'data'})
     
+    def test_make_request_cached(self):
+        """Test that cached responses skip the network."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        
+        # Run with the cache enabled even if the developer's shell disables it
+        environ = {k: v for k, v in os.environ.items() if k != 'PYWALLET_NO_CACHE'}
+        env_patcher = patch.dict(os.environ, environ, clear=True)
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+        
+        api = BlockchainAPI()
+        api._rate_limit = MagicMock()
+        api._cache = ResponseCache(os.path.join(temp_dir.name, 'cache.sqlite'))
+        self.addCleanup(api._cache.close)
+        
+        with patch('urllib.request.urlopen') as mock_urlopen:
+            mock_urlopen.return_value.__enter__.return_value.read.return_value = b'{"test": "data"}'
+            
+            first = api._make_request('https://example.com/api', ttl=30)
+            second = api._make_request('https://example.com/api', ttl=30)
+            
+            mock_urlopen.assert_called_once_with('https://example.com/api')
+            self.assertEqual(first, {'test': 'data'})
+            self.assertEqual(second, {'test': 'data'})
+            
+            # The cache file is private to the user
+            self.assertEqual(os.stat(api._cache.path).st_mode & 0o777, 0o600)
+            
+            # Expired entries are fetched again
+            with patch('time.time', return_value=10 ** 10):
+                api._make_request('https://example.com/api', ttl=30)
+            self.assertEqual(mock_urlopen.call_count, 2)
+            
+            # PYWALLET_NO_CACHE bypasses the cache entirely
+            with patch.dict(os.environ, {'PYWALLET_NO_CACHE': '1'}):
+                api._make_request('https://example.com/api', ttl=30)
+            self.assertEqual(mock_urlopen.call_count, 3)
+
+    def test_make_request_broken_cache(self):
+        """Test that an unusable cache path falls back to the network."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+
+        environ = {k: v for k, v in os.environ.items() if k != 'PYWALLET_NO_CACHE'}
+        env_patcher = patch.dict(os.environ, environ, clear=True)
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+
+        api = BlockchainAPI()
+        api._rate_limit = MagicMock()
+        # A directory where the cache file should be cannot be opened
+        api._cache = ResponseCache(temp_dir.name)
+
+        with patch('urllib.request.urlopen') as mock_urlopen:
+            mock_urlopen.return_value.__enter__.return_value.read.return_value = b'{"test": "data"}'
+
+            result = api._make_request('https://example.com/api', ttl=30)
+
+            mock_urlopen.assert_called_once_with('https://example.com/api')
+            self.assertEqual(result, {'test': 'data'})
+
+    def test_response_cache_restricts_existing_file(self):
+        """Test that a cache file created with a looser mode is made private."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+
+        path = os.path.join(temp_dir.name, 'cache.sqlite')
+        os.close(os.open(path, os.O_CREAT | os.O_WRONLY, 0o644))
+        os.chmod(path, 0o644)
+
+        cache = ResponseCache(path)
+        self.addCleanup(cache.close)
+        cache.set('https://example.com/api', '{}')
+
+        self.assertEqual(os.stat(path).st_mode & 0o777, 0o600)
+
     def test_get_balance_not_implemented(self):
         """Test get_balance raises NotImplementedError."""
         api = BlockchainAPI()
@@ -88,7 +167,8 @@ class TestBlockchainInfoAPI(unittest.TestCase):
         balance = self.api.get_balance('1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa')
         
         self.api._make_request.assert_called_once_with(
-            'https://blockchain.info/balance?active=1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa&format=json'
+            'https://blockchain.info/balance?active=1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa&format=json',
+            ttl=BALANCE_CACHE_TTL
         )
         self.assertEqual(balance, 12345678)
     
@@ -115,7 +195,8 @@ class TestBlockchainInfoAPI(unittest.TestCase):
         transactions = self.api.get_transactions('1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa')
         
         self.api._make_request.assert_called_once_with(
-            'https://blockchain.info/rawaddr/1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa'
+            'https://blockchain.info/rawaddr/1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa',
+            ttl=TRANSACTIONS_CACHE_TTL
         )
         self.assertEqual(len(transactions), 2)
         self.assertEqual(transactions[0]['hash'], 'tx1')
@@ -149,7 +230,8 @@ class TestBlockcypherAPI(unittest.TestCase):
         balance = self.api.get_balance('1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa')
         
         self.api._make_request.assert_called_once_with(
-            'https://api.blockcypher.com/v1/btc/main/addrs/1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa/balance'
+            'https://api.blockcypher.com/v1/btc/main/addrs/1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa/balance',
+            ttl=BALANCE_CACHE_TTL
         )
         self.assertEqual(balance, 12345678)
     
@@ -176,7 +258,8 @@ class TestBlockcypherAPI(unittest.TestCase):
         transactions = self.api.get_transactions('1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa')
         
         self.api._make_request.assert_called_once_with(
-            'https://api.blockcypher.com/v1/btc/main/addrs/1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa/full'
+            'https://api.blockcypher.com/v1/btc/main/addrs/1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa/full',
+            ttl=TRANSACTIONS_CACHE_TTL
         )
         self.assertEqual(len(transactions), 2)
         self.assertEqual(transactions[0]['hash'], 'tx1')
@@ -248,6 +331,16 @@ class TestBlockchainUtils(unittest.TestCase):
         self.assertEqual(transactions[0]['hash'], 'tx1')
         self.assertEqual(transactions[1]['hash'], 'tx2')
     
+    def test_decode_json(self):
+        """Test JSON decoding with and without msgspec."""
+        body = json.dumps({'txs': [{'hash': 'tx1', 'time': 1234567890, 'out': [{'value': 1}]}]})
+        expected = {'txs': [{'hash': 'tx1', 'time': 1234567890, 'out': [{'value': 1}]}]}
+        
+        self.assertEqual(decode_json(body), expected)
+        
+        with patch('pywallet_refactored.blockchain.MSGSPEC_AVAILABLE', False):
+            self.assertEqual(decode_json(body), expected)
+    
     def test_format_btc(self):
         """Test BTC formatting."""
         self.assertEqual(format_btc(0), '0.00000000 BTC')
@@ -3,84 +3,155 @@ Tests for the crypto module.
 """
 
 import unittest
-import binascii
-from pywallet_refactored.crypto.base58 import b58encode, b58decode, b58encode_check, b58decode_check
+import types
+from unittest.mock import patch
+from pywallet_refactored.crypto import keys
+from pywallet_refactored.crypto.base58 import b58encode, b58decode, b58encode_check, b58decode_check, sha256d
 from pywallet_refactored.crypto.keys import (
     hash160, public_key_to_address, private_key_to_wif, wif_to_private_key,
     private_key_to_public_key, is_valid_address, is_valid_wif
 )
 
+# Test vectors, decoded once at import time
+_ADDR_HEX = '00010966776006953D5567439E5E39F86A0D273BEED61967F6'
+_ADDR_BYTES = bytes.fromhex(_ADDR_HEX)
+_EXPECTED_ADDR = '16UwLL9Risc3QfPqBUvKofHmBQ7wMtjvM'
+
+_ZERO_BYTES = bytes(24)
+_ZERO_CHECK = '1111111111111111111114oLvT2'
+
+_PK_HEX = '0C28FCA386C7A227600B2FE50B7CAE11EC86D3BF1FBE471BE89827E19D72AA1D'
+_PK_BYTES = bytes.fromhex(_PK_HEX)
+_WIF_UNCOMPRESSED = '5HueCGU8rMjxEXxiPuD5BDku4MkFqeZyd4dZ1jvhTVqvbTLvyTJ'
+_WIF_COMPRESSED = 'KwdMAjGmerYanjeui5SHS7JkmpZvVipYvB2LJGU1ZxJwYvP98617'
+_PUB_X_HEX = 'D0DE0AAEAEFAD02B8BDC8A01A1B8B11C696BD3D66A2C5F10780D95B7DF42645C'
+_PUB_Y_HEX = 'D85228A6FB29940E858E7E55842AE2BD115D1ED7CC0E82D934E929C97648CB0A'
+
+# Bitcoin wiki "Technical background of version 1 Bitcoin addresses" vector
+_WIKI_PUBKEY = bytes.fromhex('0250863ad64a87ae8a2fe83c1af1a8403cb53f53e486d8511dad8a04887e5b2352')
+_WIKI_HASH160 = 'f54a5851e9372b87810a8e60cdd2e7cfd80b6e31'
+_WIKI_ADDRESS = '1PMycacnJaSqwwJqjawXBErnLsZ7RkXUAs'
+
+# (input, expected validity) pairs for the validation tests
+_WIF_CASES = (
+    (_WIF_UNCOMPRESSED, True),
+    (_WIF_COMPRESSED, True),
+    ('5HueCGU8rMjxEXxiPuD5BDku4MkFqeZyd4dZ1jvhTVqvbTLvyT', False),  # Too short
+    ('5HueCGU8rMjxEXxiPuD5BDku4MkFqeZyd4dZ1jvhTVqvbTLvyTJJ', False),  # Too long
+    ('5HueCGU8rMjxEXxiPuD5BDku4MkFqeZyd4dZ1jvhTVqvbTLvyTI', False),  # Invalid checksum
+)
+
+_ADDRESS_CASES = (
+    ('1BvBMSEYstWetqTFn5Au4m4GFg7xJaNVN2', True),
+    ('3J98t1WpEZ73CNmQviecrnyiWrnqRhWNLy', True),
+    ('1BvBMSEYstWetqTFn5Au4m4GFg7xJaNVN', False),  # Too short
+    ('1BvBMSEYstWetqTFn5Au4m4GFg7xJaNVN22', False),  # Too long
+    ('1BvBMSEYstWetqTFn5Au4m4GFg7xJaNVN1', False),  # Invalid checksum
+)
+
 class TestBase58(unittest.TestCase):
     """Tests for Base58 encoding and decoding."""
     
     def test_b58encode(self):
         """Test Base58 encoding."""
-        data = binascii.unhexlify('00010966776006953D5567439E5E39F86A0D273BEED61967F6')
-        encoded = b58encode(data)
-        self.assertEqual(encoded, '16UwLL9Risc3QfPqBUvKofHmBQ7wMtjvM')
+        encoded = b58encode(_ADDR_BYTES)
+        self.assertEqual(encoded, _EXPECTED_ADDR)
     
     def test_b58decode(self):
         """Test Base58 decoding."""
-        encoded = '16UwLL9Risc3QfPqBUvKofHmBQ7wMtjvM'
-        data = b58decode(encoded)
-        self.assertEqual(binascii.hexlify(data).decode('ascii').upper(), '00010966776006953D5567439E5E39F86A0D273BEED61967F6')
+        data = b58decode(_EXPECTED_ADDR)
+        self.assertEqual(data.hex().upper(), _ADDR_HEX)
+    
+    def test_b58_round_trip(self):
+        """Test Base58 round trips, including leading zero bytes."""
+        for data in (b'', b'\x00', b'\x00\x00\x01', _ADDR_BYTES, _PK_BYTES):
+            with self.subTest(data=data):
+                self.assertEqual(b58decode(b58encode(data)), data)
+        self.assertEqual(b58encode(b'\x00\x00\x01'), '112')
+        with self.assertRaises(ValueError):
+            b58decode('10OIl')
+    
+    def test_sha256d(self):
+        """Test double SHA-256."""
+        self.assertEqual(sha256d(b'hello').hex(),
+                         '9595c9df90075148eb06860365df33584b75bff782a510c6cd4883a419833d50')
     
     def test_b58encode_check(self):
         """Test Base58Check encoding."""
-        data = binascii.unhexlify('000000000000000000000000000000000000000000000000')
-        encoded = b58encode_check(data)
-        self.assertEqual(encoded, '1111111111111111111114oLvT2')
+        encoded = b58encode_check(_ZERO_BYTES)
+        self.assertEqual(encoded, _ZERO_CHECK)
     
     def test_b58decode_check(self):
         """Test Base58Check decoding."""
-        encoded = '1111111111111111111114oLvT2'
-        data = b58decode_check(encoded)
-        self.assertEqual(binascii.hexlify(data).decode('ascii').upper(), '000000000000000000000000000000000000000000000000')
+        data = b58decode_check(_ZERO_CHECK)
+        self.assertEqual(data, _ZERO_BYTES)
 
 class TestKeys(unittest.TestCase):
     """Tests for key handling functions."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Validate the shared vectors once for the whole class."""
+        cls.wif_validity = types.MappingProxyType(
+            {wif: is_valid_wif(wif) for wif, _ in _WIF_CASES}
+        )
+        cls.address_validity = types.MappingProxyType(
+            {address: is_valid_address(address) for address, _ in _ADDRESS_CASES}
+        )
+    
+    def test_hash160(self):
+        """Test RIPEMD-160(SHA-256) hashing."""
+        self.assertEqual(hash160(_WIKI_PUBKEY).hex(), _WIKI_HASH160)
+    
+    def test_public_key_to_address(self):
+        """Test converting a public key to an address."""
+        self.assertEqual(public_key_to_address(_WIKI_PUBKEY), _WIKI_ADDRESS)
+        self.assertEqual(public_key_to_address(_WIKI_PUBKEY.hex()), _WIKI_ADDRESS)
+    
     def test_private_key_to_wif_uncompressed(self):
         """Test converting private key to WIF (uncompressed)."""
-        private_key = binascii.unhexlify('0C28FCA386C7A227600B2FE50B7CAE11EC86D3BF1FBE471BE89827E19D72AA1D')
-        wif = private_key_to_wif(private_key, compressed=False)
-        self.assertEqual(wif, '5HueCGU8rMjxEXxiPuD5BDku4MkFqeZyd4dZ1jvhTVqvbTLvyTJ')
+        wif = private_key_to_wif(_PK_BYTES, compressed=False)
+        self.assertEqual(wif, _WIF_UNCOMPRESSED)
     
     def test_private_key_to_wif_compressed(self):
         """Test converting private key to WIF (compressed)."""
-        private_key = binascii.unhexlify('0C28FCA386C7A227600B2FE50B7CAE11EC86D3BF1FBE471BE89827E19D72AA1D')
-        wif = private_key_to_wif(private_key, compressed=True)
-        self.assertEqual(wif, 'KwdMAjGmerYanjeui5SHS7JkmpZvVipYvB2LJGU1ZxJwYvP98617')
+        wif = private_key_to_wif(_PK_BYTES, compressed=True)
+        self.assertEqual(wif, _WIF_COMPRESSED)
     
     def test_wif_to_private_key_uncompressed(self):
         """Test converting WIF to private key (uncompressed)."""
-        wif = '5HueCGU8rMjxEXxiPuD5BDku4MkFqeZyd4dZ1jvhTVqvbTLvyTJ'
-        private_key, compressed = wif_to_private_key(wif)
-        self.assertEqual(binascii.hexlify(private_key).decode('ascii').upper(), '0C28FCA386C7A227600B2FE50B7CAE11EC86D3BF1FBE471BE89827E19D72AA1D')
+        private_key, compressed = wif_to_private_key(_WIF_UNCOMPRESSED)
+        self.assertEqual(private_key.hex().upper(), _PK_HEX)
         self.assertFalse(compressed)
     
     def test_wif_to_private_key_compressed(self):
         """Test converting WIF to private key (compressed)."""
-        wif = 'KwdMAjGmerYanjeui5SHS7JkmpZvVipYvB2LJGU1ZxJwYvP98617'
-        private_key, compressed = wif_to_private_key(wif)
-        self.assertEqual(binascii.hexlify(private_key).decode('ascii').upper(), '0C28FCA386C7A227600B2FE50B7CAE11EC86D3BF1FBE471BE89827E19D72AA1D')
+        private_key, compressed = wif_to_private_key(_WIF_COMPRESSED)
+        self.assertEqual(private_key.hex().upper(), _PK_HEX)
         self.assertTrue(compressed)
     
+    def test_private_key_to_public_key(self):
+        """Test public key derivation with each available backend."""
+        backends = [False, True] if keys.COINCURVE_AVAILABLE else [False]
+        for use_coincurve in backends:
+            with self.subTest(coincurve=use_coincurve), \
+                    patch.object(keys, 'COINCURVE_AVAILABLE', use_coincurve):
+                self.assertEqual(private_key_to_public_key(_PK_BYTES, compressed=False).hex().upper(),
+                                 '04' + _PUB_X_HEX + _PUB_Y_HEX)
+                self.assertEqual(private_key_to_public_key(_PK_BYTES, compressed=True).hex().upper(),
+                                 '02' + _PUB_X_HEX)
+    
     def test_is_valid_wif(self):
         """Test WIF validation."""
-        self.assertTrue(is_valid_wif('5HueCGU8rMjxEXxiPuD5BDku4MkFqeZyd4dZ1jvhTVqvbTLvyTJ'))
-        self.assertTrue(is_valid_wif('KwdMAjGmerYanjeui5SHS7JkmpZvVipYvB2LJGU1ZxJwYvP98617'))
-        self.assertFalse(is_valid_wif('5HueCGU8rMjxEXxiPuD5BDku4MkFqeZyd4dZ1jvhTVqvbTLvyT'))  # Too short
-        self.assertFalse(is_valid_wif('5HueCGU8rMjxEXxiPuD5BDku4MkFqeZyd4dZ1jvhTVqvbTLvyTJJ'))  # Too long
-        self.assertFalse(is_valid_wif('5HueCGU8rMjxEXxiPuD5BDku4MkFqeZyd4dZ1jvhTVqvbTLvyTI'))  # Invalid checksum
+        for wif, ok in _WIF_CASES:
+            with self.subTest(wif=wif):
+                self.assertEqual(self.wif_validity[wif], ok)
     
     def test_is_valid_address(self):
         """Test address validation."""
-        self.assertTrue(is_valid_address('1BvBMSEYstWetqTFn5Au4m4GFg7xJaNVN2'))
-        self.assertTrue(is_valid_address('3J98t1WpEZ73CNmQviecrnyiWrnqRhWNLy'))
-        self.assertFalse(is_valid_address('1BvBMSEYstWetqTFn5Au4m4GFg7xJaNVN'))  # Too short
-        self.assertFalse(is_valid_address('1BvBMSEYstWetqTFn5Au4m4GFg7xJaNVN22'))  # Too long
-        self.assertFalse(is_valid_address('1BvBMSEYstWetqTFn5Au4m4GFg7xJaNVN1'))  # Invalid checksum
+        for address, ok in _ADDRESS_CASES:
+            with self.subTest(address=address):
+                self.assertEqual(self.address_validity[address], ok)
 
 if __name__ == '__main__':
     unittest.main()
@@ -4,11 +4,14 @@ Tests for the utils module.
 
 import unittest
 import os
+import struct
 import tempfile
+from unittest.mock import patch
 from pywallet_refactored.utils.common import (
     plural, systype, md5_hash, sha256_hash, str_to_bytes, bytes_to_str,
     hex_to_bytes, bytes_to_hex, multi_extract
 )
+from pywallet_refactored.utils.datastream import BCDataStream
 
 class TestCommonUtils(unittest.TestCase):
     """Tests for common utility functions."""
@@ -23,6 +26,14 @@ class TestCommonUtils(unittest.TestCase):
         """Test systype function."""
         system_type = systype()
         self.assertIn(system_type, ['Mac', 'Win', 'Linux'])
+        
+        # The platform lookup is cached after the first call
+        systype.cache_clear()
+        self.addCleanup(systype.cache_clear)
+        with patch('platform.system', return_value='Darwin') as mock_system:
+            self.assertEqual(systype(), 'Mac')
+            self.assertEqual(systype(), 'Mac')
+            mock_system.assert_called_once()
     
     def test_md5_hash(self):
         """Test MD5 hash function."""
@@ -52,11 +63,21 @@ class TestCommonUtils(unittest.TestCase):
         """Test hex to bytes conversion."""
         self.assertEqual(hex_to_bytes('74657374'), b'test')
         self.assertEqual(hex_to_bytes('00010203'), b'\x00\x01\x02\x03')
+        self.assertEqual(hex_to_bytes(b'74657374'), b'test')
+        with self.assertRaises(ValueError):
+            hex_to_bytes('7465737')
     
     def test_bytes_to_hex(self):
         """Test bytes to hex conversion."""
         self.assertEqual(bytes_to_hex(b'test'), '74657374')
         self.assertEqual(bytes_to_hex(b'\x00\x01\x02\x03'), '00010203')
+        self.assertEqual(bytes_to_hex(bytearray(b'test')), '74657374')
+        self.assertEqual(bytes_to_hex(memoryview(b'test')), '74657374')
+        
+        # Every byte value maps to its two lowercase hex digits
+        table = ['%02x' % b for b in range(256)]
+        self.assertEqual(bytes_to_hex(bytes(range(256))), ''.join(table))
+        self.assertEqual(hex_to_bytes(''.join(table)), bytes(range(256)))
     
     def test_multi_extract(self):
         """Test multi_extract function."""
@@ -71,5 +92,69 @@ class TestCommonUtils(unittest.TestCase):
         result = multi_extract(data, lengths)
         self.assertEqual(result, [b'abc', b'defgh', b'ijklmn'])
 
+class TestBCDataStream(unittest.TestCase):
+    """Tests for the BCDataStream parser."""
+    
+    def _stream(self, data):
+        """Return a stream positioned at the start of data."""
+        stream = BCDataStream()
+        stream.write(data)
+        return stream
+    
+    def test_read_compact_size(self):
+        """Test compact size decoding for every prefix width."""
+        cases = (
+            (b'\x00', 0),
+            (b'\xfc', 252),
+            (b'\xfd\xfd\x00', 253),
+            (b'\xfd\x34\x12', 0x1234),
+            (b'\xfe\x78\x56\x34\x12', 0x12345678),
+            (b'\xff\xef\xcd\xab\x90\x78\x56\x34\x12', 0x1234567890abcdef),
+        )
+        for data, expected in cases:
+            with self.subTest(data=data):
+                stream = self._stream(data + b'\x01')
+                self.assertEqual(stream.read_compact_size(), expected)
+                self.assertEqual(stream.read_cursor, len(data))
+    
+    def test_read_integers(self):
+        """Test fixed-width little-endian integer reads."""
+        stream = self._stream(
+            b'\xfe\xff' b'\x34\x12' b'\xfe\xff\xff\xff' b'\x78\x56\x34\x12'
+            b'\xfe\xff\xff\xff\xff\xff\xff\xff' b'\xef\xcd\xab\x90\x78\x56\x34\x12'
+        )
+        self.assertEqual(stream.read_int16(), -2)
+        self.assertEqual(stream.read_uint16(), 0x1234)
+        self.assertEqual(stream.read_int32(), -2)
+        self.assertEqual(stream.read_uint32(), 0x12345678)
+        self.assertEqual(stream.read_int64(), -2)
+        self.assertEqual(stream.read_uint64(), 0x1234567890abcdef)
+        self.assertEqual(stream.read_cursor, 28)
+    
+    def test_read_string(self):
+        """Test reading a length-prefixed string."""
+        stream = self._stream(b'\x04test\x00')
+        self.assertEqual(stream.read_string(), b'test')
+        self.assertEqual(stream.read_string(), b'')
+    
+    def test_read_record(self):
+        """Test fixed-layout record reads."""
+        data = b'\x01\x00\x00\x00' b'\x02\x00\x00\x00' + bytes(range(32))
+        stream = self._stream(data)
+        self.assertEqual(stream.read_record("<II"), (1, 2))
+        self.assertEqual(stream.read_cursor, 8)
+        self.assertEqual(stream.read_bytes(32), bytes(range(32)))
+        with self.assertRaises(struct.error):
+            stream.read_record("<I")
+    
+    def test_write_appends(self):
+        """Test that repeated writes append and reads still return bytes."""
+        stream = self._stream(b'\x04te')
+        stream.write(b'st')
+        stream.write(bytearray(b'\x01!'))
+        self.assertEqual(stream.read_string(), b'test')
+        self.assertIs(type(stream.read_bytes(1)), bytes)
+        self.assertEqual(stream.read_bytes(1), b'!')
+
 if __name__ == '__main__':
     unittest.main()
@@ -8,6 +8,7 @@ import tempfile
 import json
 from unittest.mock import patch, MagicMock
 
+from pywallet_refactored.db import wallet as wallet_module
 from pywallet_refactored.db.wallet import WalletDB, WalletDBError
 
 class TestWalletDB(unittest.TestCase):
@@ -102,6 +103,31 @@ class TestWalletDB(unittest.TestCase):
         mock_read_records.assert_called_once()
         self.assertEqual(result, wallet.json_db)
     
+    def test_iter_records(self):
+        """Test iterating over raw wallet records."""
+        wallet = WalletDB(self.wallet_path)
+        wallet.db = MagicMock()
+        mock_cursor = wallet.db.cursor.return_value
+        mock_cursor.next.side_effect = [
+            (b'\x04key1', b'value1'),
+            None,
+            (b'\x04key2', b'value2'),
+            wallet_module.DBNotFoundError()
+        ]
+        
+        records = list(wallet.iter_records())
+        
+        self.assertEqual(records, [(b'\x04key1', b'value1'), (b'\x04key2', b'value2')])
+        mock_cursor.close.assert_called_once()
+        
+        # Stopping early still closes the cursor
+        mock_cursor.reset_mock()
+        mock_cursor.next.side_effect = [(b'\x04key1', b'value1'), (b'\x04key2', b'value2')]
+        records = wallet.iter_records()
+        self.assertEqual(next(records), (b'\x04key1', b'value1'))
+        records.close()
+        mock_cursor.close.assert_called_once()
+    
     @patch('pywallet_refactored.db.wallet.WalletDB.read_wallet')
     def test_dump_wallet(self, mock_read_wallet):
         """Test dumping wallet data to a file."""
@@ -151,6 +177,60 @@ class TestWalletDB(unittest.TestCase):
         self.assertEqual(dump_data_no_private['keys'][0]['address'], '1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa')
         self.assertNotIn('wif', dump_data_no_private['keys'][0])
     
+    def test_dump_wallet_encoders(self):
+        """Test that both JSON encoders write the same wallet dump."""
+        wallet = WalletDB(self.wallet_path)
+        wallet.json_db['keys'] = [
+            {'address': '1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa', 'compressed': True,
+             'wif': '5KQNQrchXvxdR5WNi5Y1BqQyfeHGLEyqKHDB3XyCQYJjPo5rtz8'}
+        ]
+        wallet.json_db['names'] = {'1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa': 'caf\u00e9'}
+        
+        dumps = []
+        backends = [False, True] if wallet_module.MSGSPEC_AVAILABLE else [False]
+        for msgspec_available in backends:
+            with self.subTest(msgspec_available=msgspec_available), \
+                    patch('pywallet_refactored.db.wallet.MSGSPEC_AVAILABLE', msgspec_available):
+                output_file = os.path.join(self.temp_dir, f'dump_{msgspec_available}.json')
+                wallet.dump_wallet(output_file)
+                with open(output_file, 'r', encoding='utf-8') as f:
+                    dumps.append(json.load(f))
+        
+        self.assertEqual(dumps[0], dumps[-1])
+        self.assertEqual(dumps[0]['keys'][0]['wif'], '5KQNQrchXvxdR5WNi5Y1BqQyfeHGLEyqKHDB3XyCQYJjPo5rtz8')
+    
+    def test_dump_wallet_streams_keys(self):
+        """Test that the dump holds one parseable key entry per line."""
+        wallet = WalletDB(self.wallet_path)
+        wallet.json_db['keys'] = [
+            {'address': f'1Address{i}', 'compressed': bool(i % 2), 'wif': f'wif{i}'}
+            for i in range(3)
+        ]
+        wallet.json_db['names'] = {'1Address0': 'zero'}
+        output_file = os.path.join(self.temp_dir, 'dump_stream.json')
+        
+        wallet.dump_wallet(output_file, include_private=False)
+        
+        with open(output_file, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        entries = [json.loads(line.rstrip(',')) for line in lines[1:-1]]
+        self.assertEqual(entries, [
+            {'address': f'1Address{i}', 'compressed': bool(i % 2)} for i in range(3)
+        ])
+        self.assertEqual(json.loads('\n'.join(lines)), {
+            'transactions': 0,
+            'names': {'1Address0': 'zero'},
+            'encrypted': False,
+            'keys': entries
+        })
+        
+        # An empty wallet still produces a valid document
+        wallet.json_db['keys'] = []
+        with patch.object(WalletDB, 'read_wallet'):
+            wallet.dump_wallet(output_file)
+        with open(output_file, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['keys'], [])
+    
     @patch('pywallet_refactored.crypto.keys.wif_to_private_key')
     @patch('pywallet_refactored.crypto.keys.private_key_to_public_key')
     @patch('pywallet_refactored.crypto.keys.public_key_to_address')
@@ -3,12 +3,33 @@ BCDataStream implementation for parsing binary data from wallet.dat.
 """
 import struct
 import mmap
-from typing import Any, Union, Optional
+import functools
+from typing import Any, Tuple, Union, Optional
+
+# Precompiled little-endian integer formats
+_S16 = struct.Struct("<h")
+_U16 = struct.Struct("<H")
+_S32 = struct.Struct("<i")
+_U32 = struct.Struct("<I")
+_S64 = struct.Struct("<q")
+_U64 = struct.Struct("<Q")
+
+# Payload format of the multi-byte compact size prefixes
+_COMPACT_SIZE_FORMATS = {253: _U16, 254: _U32, 255: _U64}
+
+@functools.lru_cache(maxsize=64)
+def _record_struct(fmt: str) -> struct.Struct:
+    """Return the compiled Struct for a record layout, compiling it once."""
+    return struct.Struct(fmt)
 
 class BCDataStream:
     """
     Parse binary data from wallet.dat.
     """
+    # Fixed attribute layout: faster attribute access on the hot read
+    # paths and no per-instance __dict__
+    __slots__ = ('input', 'read_cursor')
+
     def __init__(self):
         self.input = None
         self.read_cursor = 0
@@ -21,9 +42,19 @@ class BCDataStream:
     def write(self, data: bytes):
         """Write data to the stream."""
         if self.input is None:
+            # A single write is the common case: keep the caller's buffer
             self.input = data
+        elif type(self.input) is bytearray:
+            self.input.extend(data)
         else:
-            self.input += data
+            # Appending to bytes copies the whole prefix on every call;
+            # switch to a bytearray so repeated writes are amortised O(1)
+            self.input = bytearray(self.input)
+            self.input.extend(data)
+
+    def _finalize(self):
+        """Freeze an appended-to buffer back into bytes before reading."""
+        self.input = bytes(self.input)
 
     def map_file(self, file, start: int):
         """Map a file to the stream."""
@@ -46,13 +77,36 @@ class BCDataStream:
         return self.read_bytes(length)
 
     def read_bytes(self, length: int) -> bytes:
-        """Read bytes from the stream."""
-        try:
-            result = self.input[self.read_cursor:self.read_cursor+length]
-            self.read_cursor += length
-            return result
-        except IndexError:
-            raise IndexError("read_bytes: IndexError")
+        """
+        Read bytes from the stream.
+        
+        Like any slice, a read past the end of the stream returns the
+        bytes that remain rather than raising.
+        """
+        if type(self.input) is bytearray:
+            self._finalize()
+        cursor = self.read_cursor
+        end = cursor + length
+        self.read_cursor = end
+        return self.input[cursor:end]
+
+    def read_record(self, fmt: str) -> Tuple[Any, ...]:
+        """
+        Unpack a fixed-layout record at the cursor and advance past it.
+        
+        Args:
+            fmt: struct format of the whole record, e.g. "<II"
+            
+        Returns:
+            Tuple of the unpacked fields
+            
+        Raises:
+            struct.error: If the stream is too short for the record
+        """
+        record = _record_struct(fmt)
+        cursor = self.read_cursor
+        self.read_cursor = cursor + record.size
+        return record.unpack_from(self.input, cursor)
 
     def read_boolean(self) -> bool:
         """Read a boolean from the stream."""
@@ -60,36 +114,48 @@ class BCDataStream:
 
     def read_int16(self) -> int:
         """Read a 16-bit integer from the stream."""
-        return struct.unpack("<h", self.read_bytes(2))[0]
+        value = _S16.unpack_from(self.input, self.read_cursor)[0]
+        self.read_cursor += 2
+        return value
 
     def read_uint16(self) -> int:
         """Read a 16-bit unsigned integer from the stream."""
-        return struct.unpack("<H", self.read_bytes(2))[0]
+        value = _U16.unpack_from(self.input, self.read_cursor)[0]
+        self.read_cursor += 2
+        return value
 
     def read_int32(self) -> int:
         """Read a 32-bit integer from the stream."""
-        return struct.unpack("<i", self.read_bytes(4))[0]
+        value = _S32.unpack_from(self.input, self.read_cursor)[0]
+        self.read_cursor += 4
+        return value
 
     def read_uint32(self) -> int:
         """Read a 32-bit unsigned integer from the stream."""
-        return struct.unpack("<I", self.read_bytes(4))[0]
+        value = _U32.unpack_from(self.input, self.read_cursor)[0]
+        self.read_cursor += 4
+        return value
 
     def read_int64(self) -> int:
         """Read a 64-bit integer from the stream."""
-        return struct.unpack("<q", self.read_bytes(8))[0]
+        value = _S64.unpack_from(self.input, self.read_cursor)[0]
+        self.read_cursor += 8
+        return value
 
     def read_uint64(self) -> int:
         """Read a 64-bit unsigned integer from the stream."""
-        return struct.unpack("<Q", self.read_bytes(8))[0]
+        value = _U64.unpack_from(self.input, self.read_cursor)[0]
+        self.read_cursor += 8
+        return value
 
     def read_compact_size(self) -> int:
         """Read a compact size from the stream."""
-        size = self.input[self.read_cursor]
-        self.read_cursor += 1
-        if size == 253:
-            size = self.read_uint16()
-        elif size == 254:
-            size = self.read_uint32()
-        elif size == 255:
-            size = self.read_uint64()
-        return size
+        cursor = self.read_cursor
+        size = self.input[cursor]
+        if size < 253:
+            # Single-byte sizes are by far the most common in wallet records
+            self.read_cursor = cursor + 1
+            return size
+        fmt = _COMPACT_SIZE_FORMATS[size]
+        self.read_cursor = cursor + 1 + fmt.size
+        return fmt.unpack_from(self.input, cursor + 1)[0]
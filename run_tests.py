@@ -10,33 +10,29 @@ import sys
 import os
 import argparse
 
-def run_tests(verbose=True):
+# Test packages, relative to the repository root
+TEST_DIRS = ('pywallet_refactored/tests', 'tests')
+
+def run_tests(verbose=False, buffer=False):
     """Run all tests."""
     # Add the current directory to the path
-    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    root_dir = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, root_dir)
 
-    # Discover and run tests
+    # Discover every test package against the same top-level directory, so
+    # each module is imported once under its package name and the two
+    # test_crypto/test_utils modules do not shadow each other
     test_loader = unittest.TestLoader()
-
-    # Run the tests directly
     test_suite = unittest.TestSuite()
-
-    # Add tests from pywallet_refactored/tests
-    try:
-        module_tests = test_loader.discover('pywallet_refactored/tests', pattern='test_*.py')
-        test_suite.addTest(module_tests)
-    except ImportError as e:
-        print(f"Warning: Could not load tests from pywallet_refactored/tests: {e}")
-
-    # Add tests from tests directory
-    try:
-        root_tests = test_loader.discover('tests', pattern='test_*.py')
-        test_suite.addTest(root_tests)
-    except ImportError as e:
-        print(f"Warning: Could not load tests from tests: {e}")
-
-    # Run tests with specified verbosity
-    test_runner = unittest.TextTestRunner(verbosity=2 if verbose else 1)
+    for test_dir in TEST_DIRS:
+        try:
+            test_suite.addTest(test_loader.discover(
+                os.path.join(root_dir, test_dir), pattern='test_*.py', top_level_dir=root_dir))
+        except ImportError as e:
+            print(f"Warning: Could not load tests from {test_dir}: {e}")
+
+    # Run tests with specified verbosity; buffering hides output of passing tests
+    test_runner = unittest.TextTestRunner(verbosity=2 if verbose else 1, buffer=buffer)
     result = test_runner.run(test_suite)
 
     return result.wasSuccessful()
@@ -45,8 +41,12 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Run pywallet_refactored tests')
     parser.add_argument('-v', '--verbose', action='store_true', help='Verbose output')
     parser.add_argument('-q', '--quiet', action='store_true', help='Quiet output')
+    parser.add_argument('-b', '--buffer', action='store_true', help='Buffer output of passing tests')
+    parser.add_argument('--skip-network', action='store_true', help='Skip blockchain provider tests')
     args = parser.parse_args()
 
-    verbose = not args.quiet if args.quiet else True
-    success = run_tests(verbose=verbose)
+    if args.skip_network:
+        os.environ['PYWALLET_SKIP_NETWORK_TESTS'] = '1'
+
+    success = run_tests(verbose=args.verbose and not args.quiet, buffer=args.buffer)
     sys.exit(0 if success else 1)
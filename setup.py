@@ -77,6 +77,7 @@ GPU_REQUIREMENTS = [
 DEV_REQUIREMENTS = [
     'pytest>=7.0.0',
     'pytest-cov>=3.0.0',
+    'pytest-xdist>=3.0.0',
     'black>=22.3.0',
     'isort>=5.10.1',
     'flake8>=4.0.1',
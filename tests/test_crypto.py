@@ -3,7 +3,6 @@ Tests for the crypto module
 """
 
 import unittest
-import binascii
 from pywallet.crypto import (
     hash_160, 
     public_key_to_address, 
@@ -13,47 +12,66 @@ from pywallet.crypto import (
 )
 from pywallet.config import network_bitcoin, network_testnet
 
+# Test vector private key from Bitcoin Wiki, decoded once for every test
+_PRIV = bytes.fromhex('0C28FCA386C7A227600B2FE50B7CAE11EC86D3BF1FBE471BE89827E19D72AA1D')
+
 class TestCrypto(unittest.TestCase):
     def test_private_key_to_wif_uncompressed(self):
         # Test vector from Bitcoin Wiki
-        private_key = binascii.unhexlify('0C28FCA386C7A227600B2FE50B7CAE11EC86D3BF1FBE471BE89827E19D72AA1D')
+        private_key = _PRIV
         wif = private_key_to_wif(private_key, compressed=False)
         self.assertEqual(wif, '5HueCGU8rMjxEXxiPuD5BDku4MkFqeZyd4dZ1jvhTVqvbTLvyTJ')
 
     def test_private_key_to_wif_compressed(self):
         # Test vector from Bitcoin Wiki
-        private_key = binascii.unhexlify('0C28FCA386C7A227600B2FE50B7CAE11EC86D3BF1FBE471BE89827E19D72AA1D')
+        private_key = _PRIV
         wif = private_key_to_wif(private_key, compressed=True)
         self.assertEqual(wif, 'KwdMAjGmerYanjeui5SHS7JkmpZvVipYvB2LJGU1ZxJwYvP98617')
 
+    def test_private_key_to_wif_testnet(self):
+        # Testnet uses version byte 0xEF
+        private_key = _PRIV
+        wif = private_key_to_wif(private_key, compressed=False, network=network_testnet)
+        self.assertEqual(wif, '91gGn1HgSap6CbU12F6z3pJri26xzp7Ay1VW6NHCoEayNXwRpu2')
+        # Switching back to mainnet uses the mainnet version byte again
+        self.assertEqual(private_key_to_wif(private_key, compressed=False),
+                         '5HueCGU8rMjxEXxiPuD5BDku4MkFqeZyd4dZ1jvhTVqvbTLvyTJ')
+
+    def test_hash_160(self):
+        # Test vector from Bitcoin Wiki
+        public_key = bytes.fromhex('0450863AD64A87AE8A2FE83C1AF1A8403CB53F53E486D8511DAD8A04887E5B2352'
+                                   '2CD470243453A299FA9E77237716103ABC11A1DF38855ED6F2EE187E9C582BA6')
+        self.assertEqual(hash_160(public_key).hex().upper(), '010966776006953D5567439E5E39F86A0D273BEE')
+        # Repeated calls must not share hash state
+        self.assertEqual(hash_160(public_key).hex().upper(), '010966776006953D5567439E5E39F86A0D273BEE')
+        self.assertEqual(public_key_to_address(public_key), '16UwLL9Risc3QfPqBUvKofHmBQ7wMtjvM')
+
     def test_wif_to_private_key_uncompressed(self):
         wif = '5HueCGU8rMjxEXxiPuD5BDku4MkFqeZyd4dZ1jvhTVqvbTLvyTJ'
         private_key, compressed = wif_to_private_key(wif)
-        self.assertEqual(binascii.hexlify(private_key).decode('ascii').upper(), 
-                         '0C28FCA386C7A227600B2FE50B7CAE11EC86D3BF1FBE471BE89827E19D72AA1D')
+        self.assertEqual(private_key, _PRIV)
         self.assertFalse(compressed)
 
     def test_wif_to_private_key_compressed(self):
         wif = 'KwdMAjGmerYanjeui5SHS7JkmpZvVipYvB2LJGU1ZxJwYvP98617'
         private_key, compressed = wif_to_private_key(wif)
-        self.assertEqual(binascii.hexlify(private_key).decode('ascii').upper(), 
-                         '0C28FCA386C7A227600B2FE50B7CAE11EC86D3BF1FBE471BE89827E19D72AA1D')
+        self.assertEqual(private_key, _PRIV)
         self.assertTrue(compressed)
 
     def test_private_key_to_public_key_uncompressed(self):
-        private_key = binascii.unhexlify('0C28FCA386C7A227600B2FE50B7CAE11EC86D3BF1FBE471BE89827E19D72AA1D')
+        private_key = _PRIV
         public_key = private_key_to_public_key(private_key, compressed=False)
         expected = '04D0DE0AAEAEFAD02B8BDC8A01A1B8B11C696BD3D66A2C5F10780D95B7DF42645CD85228A6FB29940E858E7E55842AE2BD115D1ED7CC0E82D934E929C97648CB0A'
-        self.assertEqual(binascii.hexlify(public_key).decode('ascii').upper(), expected)
+        self.assertEqual(public_key.hex().upper(), expected)
 
     def test_private_key_to_public_key_compressed(self):
-        private_key = binascii.unhexlify('0C28FCA386C7A227600B2FE50B7CAE11EC86D3BF1FBE471BE89827E19D72AA1D')
+        private_key = _PRIV
         public_key = private_key_to_public_key(private_key, compressed=True)
         # The expected value depends on whether the y-coordinate is even or odd
         expected_even = '02D0DE0AAEAEFAD02B8BDC8A01A1B8B11C696BD3D66A2C5F10780D95B7DF42645C'
         expected_odd = '03D0DE0AAEAEFAD02B8BDC8A01A1B8B11C696BD3D66A2C5F10780D95B7DF42645C'
         
-        actual = binascii.hexlify(public_key).decode('ascii').upper()
+        actual = public_key.hex().upper()
         self.assertTrue(actual == expected_even or actual == expected_odd)
 
 if __name__ == '__main__':
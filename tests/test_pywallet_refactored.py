@@ -5,16 +5,18 @@ Comprehensive test suite for pywallet_refactored.py
 
 import os
 import sys
+import json
 import unittest
 import tempfile
 import shutil
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
 
 # Add parent directory to path to import pywallet_refactored
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import the main function from the __main__ module
-from pywallet_refactored.__main__ import main
+from pywallet_refactored.__main__ import main, COMMANDS
+from pywallet_refactored.cli.parser import get_parser
 from pywallet_refactored.db.wallet import WalletDB
 from pywallet_refactored.crypto.keys import (
     private_key_to_wif,
@@ -22,6 +24,22 @@ from pywallet_refactored.crypto.keys import (
     public_key_to_address
 )
 
+# Test vector private key from Bitcoin Wiki
+_PRIV = bytes.fromhex('0c28fca386c7a227600b2fe50b7cae11ec86d3bf1fbe471be89827e19d72aa1d')
+
+# Command lines that need a wallet file, with the parsed options each must set
+_WALLET_COMMANDS = (
+    (['dump'], {'command': 'dump'}),
+    (['watchonly'], {'command': 'watchonly'}),
+    (['batch', 'export'], {'command': 'batch', 'batch_command': 'export'}),
+)
+
+# Command lines that only take an address
+_ADDRESS_COMMANDS = (
+    ['balance', '1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa'],
+    ['txhistory', '1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa'],
+)
+
 
 class TestPyWalletRefactored(unittest.TestCase):
     """Test suite for pywallet_refactored.py"""
@@ -35,13 +53,15 @@ class TestPyWalletRefactored(unittest.TestCase):
         # Path to test wallet file
         cls.test_wallet_path = os.path.join(cls.test_dir, "test_wallet.dat")
 
-        # Path to output files
-        cls.test_output_json = os.path.join(cls.test_dir, "test_output.json")
-        cls.test_output_keys = os.path.join(cls.test_dir, "test_keys.txt")
-
-        # Copy test wallet file if it exists
+        # Copy test wallet file if it exists, and read it once for all tests
+        cls._wallet_db = None
         if os.path.exists("./wallet.dat"):
             shutil.copy("./wallet.dat", cls.test_wallet_path)
+            cls._wallet_db = WalletDB(cls.test_wallet_path)
+            try:
+                cls._wallet_db.read_wallet()
+            finally:
+                cls._wallet_db.close()
         else:
             print("Warning: No test wallet.dat found. Some tests may fail.")
 
@@ -53,40 +73,17 @@ class TestPyWalletRefactored(unittest.TestCase):
 
     def test_wallet_loading(self):
         """Test loading a wallet file"""
-        if not os.path.exists(self.test_wallet_path):
+        if self._wallet_db is None:
             self.skipTest("No test wallet available")
 
-        wallet_db = WalletDB(self.test_wallet_path)
-        wallet_db.open()
-        wallet_db.read_wallet()
-        wallet_db.close()
-
         # Check that the wallet was loaded
-        self.assertTrue(isinstance(wallet_db.json_db, dict))
-        self.assertIn('version', wallet_db.json_db)
-
-    def test_dump_wallet(self):
-        """Test dumping wallet to JSON"""
-        if not os.path.exists(self.test_wallet_path):
-            self.skipTest("No test wallet available")
-
-        # Mock sys.argv to simulate command line arguments
-        with patch('sys.argv', ['pywallet_refactored.py', 'dump',
-                               f'--wallet={self.test_wallet_path}',
-                               f'--output={self.test_output_json}']):
-            try:
-                # Skip the actual test for now until we fix the command line arguments
-                # main()
-                # If we get here without exceptions, the test passes
-                pass
-            except SystemExit as e:
-                # Some commands exit with sys.exit(), which is expected
-                self.assertEqual(e.code, 0)
+        self.assertTrue(isinstance(self._wallet_db.json_db, dict))
+        self.assertIn('version', self._wallet_db.json_db)
 
     def test_key_operations(self):
         """Test key conversion operations"""
         # Test private key to WIF conversion
-        private_key = bytes.fromhex('0c28fca386c7a227600b2fe50b7cae11ec86d3bf1fbe471be89827e19d72aa1d')
+        private_key = _PRIV
         expected_wif = '5HueCGU8rMjxEXxiPuD5BDku4MkFqeZyd4dZ1jvhTVqvbTLvyTJ'
 
         wif = private_key_to_wif(private_key, compressed=False)
@@ -100,109 +97,79 @@ class TestPyWalletRefactored(unittest.TestCase):
         address = public_key_to_address(public_key)
         self.assertTrue(address.startswith('1'))
 
-    def test_balance_check(self):
-        """Test balance checking functionality"""
-        # Mock sys.argv to simulate command line arguments
-        with patch('sys.argv', ['pywallet_refactored.py', 'balance', '1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa']):
-            # This is a simplified test that just checks if the command runs without exceptions
-            try:
-                # We'll just test if the command runs without exceptions
-                main()
-                # If we get here without exceptions, the test passes
-            except SystemExit as e:
-                # Some commands exit with sys.exit(), which is expected
-                self.assertEqual(e.code, 0)
-
-    def test_transaction_history(self):
-        """Test transaction history functionality"""
-        # Mock sys.argv to simulate command line arguments
-        with patch('sys.argv', ['pywallet_refactored.py', 'txhistory', '1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa']):
-            # This is a simplified test that just checks if the command runs without exceptions
-            try:
-                # We'll just test if the command runs without exceptions
-                main()
-                # If we get here without exceptions, the test passes
-            except SystemExit as e:
-                # Some commands exit with sys.exit(), which is expected
-                self.assertEqual(e.code, 0)
-
-    def test_watch_only_wallet(self):
-        """Test watch-only wallet creation"""
-        if not os.path.exists(self.test_wallet_path):
-            self.skipTest("No test wallet available")
-
-        # Mock sys.argv to simulate command line arguments
-        with patch('sys.argv', ['pywallet_refactored.py', 'watchonly',
-                               f'--wallet={self.test_wallet_path}',
-                               f'--output={self.test_dir}/watch_only.dat']):
-            try:
-                # Skip the actual test for now until we fix the command line arguments
-                # main()
-                # If we get here without exceptions, the test passes
-                pass
-            except SystemExit as e:
-                # Some commands exit with sys.exit(), which is expected
-                self.assertEqual(e.code, 0)
-
     def test_batch_operations(self):
-        """Test batch operations for keys"""
-        # Create a test private key
-        private_key = "0c28fca386c7a227600b2fe50b7cae11ec86d3bf1fbe471be89827e19d72aa1d"
-
-        # Write the key to a file
-        keys_file = os.path.join(self.test_dir, "keys.txt")
-        with open(keys_file, 'w') as f:
-            f.write(f"{private_key}\n")
-
-        # Mock sys.argv to simulate command line arguments
-        with patch('sys.argv', ['pywallet_refactored.py', 'batch', 'export',
-                               f'--wallet={self.test_wallet_path}',
-                               f'--output={self.test_output_keys}']):
-            try:
-                # Skip the actual test for now until we fix the command line arguments
-                # main()
-                # If we get here without exceptions, the test passes
-                pass
-            except SystemExit as e:
-                # Some commands exit with sys.exit(), which is expected
-                self.assertEqual(e.code, 0)
-
-        # The following assertions are commented out because we're not actually creating the output file in the test
-        # Check that the output file was created
-        # self.assertTrue(os.path.exists(self.test_output_keys))
-
-    def test_output_parameter(self):
-        """Test the --output parameter for commands"""
-        if not os.path.exists(self.test_wallet_path):
-            self.skipTest("No test wallet available")
-
-        # Test with dump command
-        with patch('sys.argv', ['pywallet_refactored.py', 'dump',
-                               f'--wallet={self.test_wallet_path}',
-                               f'--output={self.test_output_json}']):
-            try:
-                # Skip the actual test for now until we fix the command line arguments
-                # main()
-                # If we get here without exceptions, the test passes
-                pass
-            except SystemExit as e:
-                # Some commands exit with sys.exit(), which is expected
-                self.assertEqual(e.code, 0)
-
-        # The following assertion is commented out because we're not actually creating the output file in the test
-        # Check that the output file was created
-        # self.assertTrue(os.path.exists(self.test_output_json))
+        """Test that batch generate writes the generated keys"""
+        keys_file = os.path.join(self.test_dir, "keys.json")
+
+        self.assertEqual(main(['batch', 'generate', '2', f'--output={keys_file}']), 0)
+
+        with open(keys_file) as f:
+            keys = json.load(f)['keys']
+        self.assertEqual(len(keys), 2)
+        for key in keys:
+            self.assertTrue(key['address'].startswith('1'))
+            self.assertTrue(key['wif'].startswith(('K', 'L')))
+
+    def test_wallet_command_arguments(self):
+        """Test that wallet commands accept --wallet and --output"""
+        parser = get_parser()
+        for argv, expected in _WALLET_COMMANDS:
+            with self.subTest(command=' '.join(argv)):
+                output = os.path.join(self.test_dir, f"{argv[-1]}_output")
+                args = vars(parser.parse_args(
+                    argv + [f'--wallet={self.test_wallet_path}', f'--output={output}']
+                ))
+                self.assertEqual(args['wallet'], self.test_wallet_path)
+                self.assertEqual(args['output'], output)
+                for name, value in expected.items():
+                    self.assertEqual(args[name], value)
+
+    def test_address_commands(self):
+        """Test that address lookup commands run without raising"""
+        # This is a simplified test that just checks if each command runs without exceptions.
+        # The HTTP response cache is disabled so no cache file is written to the user's home
+        for argv in _ADDRESS_COMMANDS:
+            with self.subTest(command=argv[0]), patch.dict(os.environ, {'PYWALLET_NO_CACHE': '1'}):
+                try:
+                    main(argv)
+                except SystemExit as e:
+                    # Some commands exit with sys.exit(), which is expected
+                    self.assertEqual(e.code, 0)
+
+    def test_command_dispatch(self):
+        """Test that main routes to the handler for each command"""
+        handler = MagicMock(return_value=0)
+        with patch.dict(COMMANDS, {'genkey': handler}):
+            self.assertEqual(main(['genkey']), 0)
+        handler.assert_called_once()
+        self.assertEqual(handler.call_args[0][0]['command'], 'genkey')
+
+        # The parser is built once and shared between invocations
+        self.assertIs(get_parser(), get_parser())
+
+    def test_legacy_option_dispatch(self):
+        """Test that a subcommand earlier in the legacy chain wins over a later legacy option"""
+        cases = (
+            ({'command': 'dump', 'backupwallet': 'backup.dat'}, 'dump'),
+            ({'command': 'import', 'createwallet': 'new.dat'}, 'import'),
+            ({'command': 'backup', 'dumpwallet': 'dump.json'}, 'dump'),
+            ({'command': None, 'createwallet': 'new.dat'}, 'create'),
+        )
+        for args_dict, expected in cases:
+            with self.subTest(args=args_dict):
+                handlers = {name: MagicMock(return_value=0) for name in ('dump', 'import', 'create', 'backup')}
+                with patch.dict(COMMANDS, handlers), \
+                        patch('pywallet_refactored.__main__.parse_args', return_value=dict(args_dict)):
+                    self.assertEqual(main([]), 0)
+                for name, handler in handlers.items():
+                    self.assertEqual(handler.called, name == expected, name)
 
     def test_help_command(self):
         """Test the help command"""
-        # Mock sys.argv to simulate command line arguments
-        with patch('sys.argv', ['pywallet_refactored.py', '--help']):
-            try:
-                main()
-            except SystemExit:
-                pass  # Help command exits with sys.exit()
-
-        # If we get here without exceptions, the test passes
+        # argparse prints the help text and exits with status 0
+        with patch('sys.stdout'), self.assertRaises(SystemExit) as cm:
+            main(['--help'])
+        self.assertEqual(cm.exception.code, 0)
 
 
 if __name__ == '__main__':
@@ -5,7 +5,8 @@ Tests for the utils module
 import unittest
 import os
 import tempfile
-from pywallet.utils import plural, systype, md5_2, multiextract
+from unittest.mock import patch
+from pywallet.utils import plural, systype, md5_2, multiextract, _detect_systype
 
 class TestUtils(unittest.TestCase):
     def test_plural(self):
@@ -19,10 +20,17 @@ class TestUtils(unittest.TestCase):
         # Just make sure it returns one of the expected values
         system_type = systype()
         self.assertIn(system_type, ['Mac', 'Win', 'Linux'])
+        self.assertEqual(system_type, _detect_systype())
+
+        for system, expected in (('Darwin', 'Mac'), ('Windows', 'Win'), ('Linux', 'Linux')):
+            with self.subTest(system=system), patch('platform.system', return_value=system):
+                self.assertEqual(_detect_systype(), expected)
 
     def test_md5_2(self):
         self.assertEqual(md5_2('test'), '098f6bcd4621d373cade4e832627b4f6')
         self.assertEqual(md5_2(''), 'd41d8cd98f00b204e9800998ecf8427e')
+        self.assertEqual(md5_2(b'test'), '098f6bcd4621d373cade4e832627b4f6')
+        self.assertEqual(md5_2(bytearray(b'test')), '098f6bcd4621d373cade4e832627b4f6')
 
     def test_multiextract(self):
         data = b'abcdefghijklmnopqrstuvwxyz'
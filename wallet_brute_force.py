@@ -7,12 +7,15 @@ It includes visual feedback and progress information during the brute force proc
 """
 
 import argparse
+import functools
 import json
 import os
 import sys
 import time
 import itertools
-from concurrent.futures import ProcessPoolExecutor, as_completed
+import multiprocessing
+import queue
+import threading
 # Platform is imported in print_system_info
 
 try:
@@ -23,6 +26,67 @@ except ImportError:
     print("pip install pycryptodome")
     sys.exit(1)
 
+# PyCryptodome loads its AES-NI implementation, and uses it for every
+# AES.new, only when the CPU has the instructions
+AESNI_AVAILABLE = getattr(AES, '_raw_aesni_lib', None) is not None
+
+# Try to import the fastpbkdf2 C binding; it keeps the HMAC ipad/opad
+# midstates across iterations and is a drop-in for hashlib.pbkdf2_hmac
+# when called positionally (it names the iteration count "rounds")
+try:
+    from fastpbkdf2 import pbkdf2_hmac
+    FASTPBKDF2_AVAILABLE = True
+except ImportError:
+    pbkdf2_hmac = hashlib.pbkdf2_hmac
+    FASTPBKDF2_AVAILABLE = False
+
+# On Apple Silicon, CommonCrypto's PBKDF2 runs on the CPU's SHA-512
+# instructions; it is part of libSystem, so there is nothing to install
+COMMONCRYPTO_AVAILABLE = False
+if sys.platform == 'darwin' and os.uname().machine == 'arm64':
+    try:
+        import ctypes
+        _CCKeyDerivationPBKDF = ctypes.CDLL('/usr/lib/libSystem.B.dylib').CCKeyDerivationPBKDF
+        _CCKeyDerivationPBKDF.argtypes = (
+            ctypes.c_uint32, ctypes.c_char_p, ctypes.c_size_t, ctypes.c_char_p, ctypes.c_size_t,
+            ctypes.c_uint32, ctypes.c_uint, ctypes.c_char_p, ctypes.c_size_t
+        )
+        _CCKeyDerivationPBKDF.restype = ctypes.c_int
+
+        # CommonCryptoKeyDerivation.h: kCCPBKDF2 and kCCPRFHmacAlgSHA512
+        _kCCPBKDF2 = 2
+        _kCCPRFHmacAlgSHA512 = 5
+
+        _generic_pbkdf2_hmac = pbkdf2_hmac
+
+        def pbkdf2_hmac(hash_name, password, salt, iterations, dklen=None):
+            """hashlib.pbkdf2_hmac work-alike that derives SHA-512 keys through CommonCrypto."""
+            if hash_name != 'sha512':
+                return _generic_pbkdf2_hmac(hash_name, password, salt, iterations, dklen)
+            dklen = dklen or 64
+            key = ctypes.create_string_buffer(dklen)
+            status = _CCKeyDerivationPBKDF(_kCCPBKDF2, password, len(password), salt, len(salt),
+                                           _kCCPRFHmacAlgSHA512, iterations, key, dklen)
+            if status != 0:
+                raise ValueError(f"CCKeyDerivationPBKDF failed with status {status}")
+            return key.raw
+
+        COMMONCRYPTO_AVAILABLE = True
+    except (OSError, AttributeError):
+        pass
+
+# Name of the generic PBKDF2 implementation, for status output
+if COMMONCRYPTO_AVAILABLE:
+    PBKDF2_BACKEND = "CommonCrypto"
+elif FASTPBKDF2_AVAILABLE:
+    PBKDF2_BACKEND = "fastpbkdf2"
+else:
+    PBKDF2_BACKEND = "hashlib"
+
+# PBKDF2 compiled at runtime for the wallet's salt and iteration count
+# (needs only ctypes and a C compiler; see native_pbkdf2.py)
+from native_pbkdf2 import NativePBKDF2
+
 # Try to import optional packages for visual feedback
 try:
     import tqdm
@@ -37,11 +101,18 @@ try:
 except ImportError:
     PSUTIL_AVAILABLE = False
 
+# Try to import NumPy for vectorized candidate generation
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # Try to import GPU acceleration packages
 try:
     import pyopencl
-    import numpy as np
-    GPU_AVAILABLE = True
+    from gpu_pbkdf2 import OpenCLPBKDF2
+    GPU_AVAILABLE = NUMPY_AVAILABLE
 except ImportError:
     GPU_AVAILABLE = False
 
@@ -70,6 +141,14 @@ except ImportError:
     RESET = ""
     COLORAMA_AVAILABLE = False
 
+# Status line pieces, built once rather than on every update
+CLEAR_LINE = "\r" + " " * 150 + "\r"
+WORDLIST_BATCH_STATUS = f"\r{INFO}Batch %d: Testing %d passwords from wordlist{RESET}"
+GENERATED_BATCH_STATUS = f"\r{INFO}Batch %d: Testing %d passwords of length %d{RESET}"
+
+# Minimum time between progress bar refreshes, in monotonic nanoseconds
+PROGRESS_BAR_INTERVAL_NS = 100_000_000
+
 # Try to import Metal support for Apple Silicon
 try:
     import tensorflow as tf
@@ -150,10 +229,12 @@ def process_passwords_metal(passwords, encrypted_key, salt, iterations):
                 # Generate keys
                 keys = pbkdf2_batch(batch_passwords, batch_salt)
                 
-                # Check each key
-                for j, key in enumerate(keys):
-                    if check_password(passwords[i + j], encrypted_key, salt, iterations)[0]:
-                        return [(True, passwords[i + j])]
+                # Check the keys just derived instead of deriving each one
+                # again through check_password
+                matches = check_derived_keys(passwords[i:i + batch_size],
+                                             (key.numpy() for key in keys), encrypted_key)
+                if matches:
+                    return [(True, matches[0])]
             
             return None
 
@@ -179,7 +260,7 @@ def parse_arguments():
     parser.add_argument("--charset", default="abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*()-_=+",
                         help="Character set to use for password generation")
     parser.add_argument("--processes", type=int, default=os.cpu_count(), help="Number of processes to use")
-    parser.add_argument("--status_interval", type=int, default=1000, help="How often to print status updates (in attempts)")
+    parser.add_argument("--status_interval", type=int, default=1000, help="How often to print status updates (in attempts, rounded to a power of two)")
     parser.add_argument("--wordlist", help="Path to wordlist file (one password per line)")
     parser.add_argument("--show_current", action="store_true", help="Show current password being tried (may slow down the process)")
     parser.add_argument("--quiet", action="store_true", help="Reduce output verbosity")
@@ -191,6 +272,8 @@ def parse_arguments():
     parser.add_argument("--checkpoint", help="Path to save/load checkpoint file")
     parser.add_argument("--checkpoint_interval", type=int, default=60, help="Save checkpoint every N seconds (default: 60)")
     parser.add_argument("--use_gpu", action="store_true", help="Use GPU acceleration if available")
+    parser.add_argument("--native", action="store_true",
+                        help="Compile and use a PBKDF2 specialised for the wallet's salt and iterations")
     parser.add_argument("--optimize_for", choices=["m1", "m2", "m3", "intel", "auto"], default="auto",
                       help="Optimize for specific CPU architecture (default: auto)")
     parser.add_argument("--max_consecutive", type=int, default=0,
@@ -203,10 +286,12 @@ def has_too_many_consecutive_chars(password, max_consecutive):
     if max_consecutive <= 0:  # 0 or negative means no limit
         return False
 
-    if len(password) <= 1:
+    # A password no longer than the limit cannot exceed it
+    if len(password) <= max_consecutive:
         return False
 
-    # Count consecutive characters
+    # A plain scan beats bit tricks on Python ints (which are not machine
+    # words) and regex searches for these short candidates
     current_char = password[0]
     count = 1
 
@@ -225,40 +310,89 @@ def hex_to_bytes(hex_string):
     """Convert a hex string to bytes."""
     return bytes.fromhex(hex_string)
 
-# Cache for derived keys to avoid recalculating
-_key_cache = {}
-_key_cache_size = 1000  # Limit cache size to avoid memory issues
+# Runtime-compiled PBKDF2, keyed by (salt, iterations); see enable_native_pbkdf2
+_native_derivers = {}
 
-def derive_key(password, salt, iterations, key_length=32):
-    """Derive a key from a password using PBKDF2-HMAC-SHA512 with caching."""
-    # Create a cache key from the parameters
-    cache_key = (password, salt, iterations, key_length)
-
-    # Check if we have this key in the cache
-    if cache_key in _key_cache:
-        return _key_cache[cache_key]
-
-    # Not in cache, calculate it
-    derived_key = hashlib.pbkdf2_hmac(
-        'sha512',
-        password,
-        salt,
-        iterations,
-        key_length
-    )
-
-    # Store in cache if not too large
-    if len(_key_cache) < _key_cache_size:
-        _key_cache[cache_key] = derived_key
+def enable_native_pbkdf2(salt, iterations):
+    """Compile (or load the cached) specialised PBKDF2 for salt and iterations; return True on success."""
+    cache_key = (salt, iterations)
+    if cache_key not in _native_derivers:
+        try:
+            _native_derivers[cache_key] = NativePBKDF2(salt, iterations)
+        except (OSError, ValueError) as e:
+            print(f"{WARNING}Specialised PBKDF2 unavailable, using the generic implementation: {e}{RESET}")
+            _native_derivers[cache_key] = None
+    return _native_derivers[cache_key] is not None
 
-    return derived_key
+def derive_key(password, salt, iterations, key_length=32):
+    """Derive a key from a password using PBKDF2-HMAC-SHA512."""
+    # No cache: brute-force candidates are never repeated, so a lookup per
+    # call is pure overhead (wordlists are de-duplicated when loaded).
+    # Every backend here reuses the HMAC ipad/opad midstates in C; the same
+    # trick written in Python with hash .copy() is about twice as slow as
+    # hashlib.pbkdf2_hmac, so there is deliberately no Python fallback loop
+    native = _native_derivers.get((salt, iterations)) if key_length == 32 else None
+    if native is not None:
+        return native.derive(password)
+    return pbkdf2_hmac('sha512', password, salt, iterations, key_length)
+
+# Bitcoin Core uses a zero IV
+ZERO_IV = b'\x00' * 16
 
 def decrypt_aes(encrypted_data, key):
     """Decrypt data using AES-256-CBC."""
-    iv = b'\x00' * 16  # Bitcoin Core uses a zero IV
-    cipher = AES.new(key, AES.MODE_CBC, iv)
+    cipher = AES.new(key, AES.MODE_CBC, ZERO_IV)
     return cipher.decrypt(encrypted_data)
 
+def decrypt_aes_batch(encrypted_data, keys):
+    """Decrypt the same data under each key in a batch, yielding the plaintexts in order."""
+    new, mode, iv = AES.new, AES.MODE_CBC, ZERO_IV
+    for key in keys:
+        yield new(key, mode, iv).decrypt(encrypted_data)
+
+def derive_keys(passwords, salt, iterations, key_length=32):
+    """Derive keys for a batch of byte passwords, yielding them in order."""
+    native = _native_derivers.get((salt, iterations)) if key_length == 32 else None
+    if native is not None:
+        yield from map(native.derive, passwords)
+        return
+    for password in passwords:
+        yield pbkdf2_hmac('sha512', password, salt, iterations, key_length)
+
+# Valid padding suffixes indexed by padding length, and an all-zero key
+_PAD_TABLE = [bytes((i,)) * i for i in range(17)]
+_ZERO_KEY = bytes(32)
+
+def is_valid_master_key(decrypted):
+    """Check if decrypted data looks like a padded 32-byte master key."""
+    # Ultra-fast check: The last byte should be a valid padding value (1-16)
+    padding_byte = decrypted[-1]
+    if not (1 <= padding_byte <= 16):
+        return False
+
+    # Fast check: After removing padding, we should have a 32-byte key
+    if len(decrypted) - padding_byte != 32:
+        return False
+
+    # Fast check: Verify padding bytes match, without slicing or building
+    # the pattern on every call
+    if not decrypted.endswith(_PAD_TABLE[padding_byte]):
+        return False
+
+    # Fast check: Check for all zeros (unlikely to be a valid key); the key
+    # is the first 32 bytes, so compare in place instead of stripping padding
+    if decrypted.startswith(_ZERO_KEY):
+        return False
+
+    # Check for entropy in the key (valid keys should have good entropy);
+    # a random 16-byte prefix has fewer than 5 distinct bytes with
+    # negligible probability
+    if len(set(decrypted[:16])) < 5:
+        return False
+
+    # If we passed all checks, this is likely a valid password
+    return True
+
 def check_password(password, encrypted_key, salt, iterations):
     """Check if a password can decrypt the master key."""
     try:
@@ -272,37 +406,7 @@ def check_password(password, encrypted_key, salt, iterations):
         # Try to decrypt the master key
         decrypted = decrypt_aes(encrypted_key, derived_key)
 
-        # Ultra-fast check: The last byte should be a valid padding value (1-16)
-        padding_byte = decrypted[-1]
-        if not (1 <= padding_byte <= 16):
-            return False, password
-
-        # Fast check: After removing padding, we should have a 32-byte key
-        expected_len = len(decrypted) - padding_byte
-        if expected_len != 32:
-            return False, password
-
-        # Fast check: Verify padding bytes match (using slice for better performance)
-        padding_pattern = bytes([padding_byte]) * padding_byte
-        if decrypted[-padding_byte:] != padding_pattern:
-            return False, password
-
-        # Remove padding
-        decrypted = decrypted[:-padding_byte]
-
-        # Fast check: Check for all zeros (unlikely to be a valid key)
-        # Use a faster method than sum()
-        if not any(decrypted):
-            return False, password
-
-        # Check for entropy in the key (valid keys should have good entropy)
-        # Just check first few bytes for performance
-        # Use a faster method with a set comprehension
-        if len({decrypted[i] for i in range(min(8, len(decrypted)))}) < 3:
-            return False, password
-
-        # If we passed all checks, this is likely a valid password
-        return True, password
+        return is_valid_master_key(decrypted), password
 
     except Exception:
         # Silent exceptions for performance
@@ -340,64 +444,456 @@ def generate_passwords(min_length, max_length, charset):
         for password in itertools.product(charset, repeat=length):
             yield ''.join(password)
 
+def full_padding_block(encrypted_key):
+    """
+    Return the raw AES decryption of the last block that a 48-byte master key must have.
+
+    A 32-byte key under PKCS#7 ends in a whole block of 0x10, and CBC XORs
+    the previous ciphertext block into the last one, so the expected value
+    is fixed by the ciphertext alone.
+    """
+    return bytes(byte ^ 0x10 for byte in encrypted_key[16:32])
+
+def check_derived_keys(passwords, derived_keys, encrypted_key):
+    """Return the passwords whose derived key decrypts the master key."""
+    # Malformed key data fails the same way for every password. Anything
+    # else (a failing deriver, say) propagates rather than passing for
+    # "no match"
+    if not encrypted_key or len(encrypted_key) % AES.block_size:
+        return []
+
+    if len(encrypted_key) == 48:
+        # Decrypt only the last block and compare it with the one value
+        # that gives full padding; the rare survivors get the full check
+        last_block, expected = encrypted_key[32:], full_padding_block(encrypted_key)
+        new, ecb = AES.new, AES.MODE_ECB
+        return [
+            password
+            for password, key in zip(passwords, derived_keys)
+            if new(key, ecb).decrypt(last_block) == expected
+            and is_valid_master_key(decrypt_aes(encrypted_key, key))
+        ]
+    return [
+        password
+        for password, decrypted in zip(passwords, decrypt_aes_batch(encrypted_key, derived_keys))
+        if is_valid_master_key(decrypted)
+    ]
+
 def process_chunk(chunk, encrypted_key, salt, iterations):
     """Process a chunk of passwords."""
+    passwords = [p.encode('utf-8') if isinstance(p, str) else p for p in chunk]
+
+    # Derive the whole batch through one call, then check each key
+    return check_derived_keys(passwords, derive_keys(passwords, salt, iterations), encrypted_key)
+
+def make_chunk_checker(encrypted_key, salt, iterations):
+    """
+    Return process_chunk specialised for one wallet's master key parameters.
+
+    The key derivation is resolved once: the compiled PBKDF2 (which already
+    has the salt and iteration count built in) if it is enabled, otherwise
+    pbkdf2_hmac with salt and iterations bound (by position, as fastpbkdf2
+    names its parameters differently). The returned function takes
+    only the chunk, so worker calls carry no per-call parameters.
+    """
+    native = _native_derivers.get((salt, iterations))
+    if native is not None:
+        derive = native.derive
+    else:
+        def derive(password):
+            return pbkdf2_hmac('sha512', password, salt, iterations, 32)
+
+    def check_chunk(chunk):
+        passwords = [p.encode('utf-8') if isinstance(p, str) else p for p in chunk]
+        return check_derived_keys(passwords, map(derive, passwords), encrypted_key)
+
+    return check_chunk
+
+# Smallest chunk worth a GPU dispatch; below this launch overhead dominates
+GPU_MIN_BATCH = 4096
+
+# Compiled OpenCL programs, keyed by (salt, iterations); None if unusable
+_gpu_derivers = {}
+
+def get_gpu_deriver(salt, iterations):
+    """Return the OpenCL key deriver for salt and iterations, or None if unavailable."""
+    cache_key = (salt, iterations)
+    if cache_key not in _gpu_derivers:
+        try:
+            _gpu_derivers[cache_key] = OpenCLPBKDF2(salt, iterations)
+        except Exception as e:
+            print(f"{WARNING}GPU acceleration failed, falling back to CPU: {e}{RESET}")
+            _gpu_derivers[cache_key] = None
+    return _gpu_derivers[cache_key]
+
+def process_chunk_gpu(chunk, encrypted_key, salt, iterations):
+    """Process a chunk of passwords with PBKDF2 on the GPU; None if the GPU is unusable."""
+    deriver = get_gpu_deriver(salt, iterations)
+    if deriver is None:
+        return None
+
+    # A 48-byte master key can only be valid with a full block of padding,
+    # which the GPU tests next to the keys; only flagged indices come back
+    full_padding = len(encrypted_key) == 48
+
+    # The chunk is packed straight into the kernel's contiguous buffer
+    try:
+        if full_padding:
+            candidates = [chunk[i] for i in deriver.find_full_padding(chunk, encrypted_key)]
+        else:
+            derived_keys = deriver.derive(chunk)
+    except Exception as e:
+        print(f"{WARNING}GPU key derivation failed, falling back to CPU: {e}{RESET}")
+        _gpu_derivers[(salt, iterations)] = None
+        return None
+
+    if full_padding:
+        # Flagged candidates are rare; run the complete check on the CPU
+        return [password for is_valid, password in
+                (check_password(p, encrypted_key, salt, iterations) for p in candidates) if is_valid]
+
+    # A single AES block per password is cheap next to PBKDF2; check on the host
+    # and encode only the matches, as process_chunk returns them
+    matches = check_derived_keys(chunk, derived_keys, encrypted_key)
+    return [p.encode('utf-8') if isinstance(p, str) else p for p in matches]
+
+# process_chunk specialised for the wallet, set once by _init_worker
+_worker_check = None
+
+# Set once a password is found so workers drop the rest of their tiles;
+# shared between the parent and the workers of the current pool
+_stop_event = None
+
+# Passwords a worker derives between checks of the stop event
+STOP_CHECK_INTERVAL = 32
+
+def _init_worker(encrypted_key, salt, iterations, native=False, stop_event=None):
+    """Store the master key parameters in a pool worker."""
+    global _worker_check, _stop_event
+    _stop_event = stop_event
+    if native:
+        # The library is already built; workers only load it
+        enable_native_pbkdf2(salt, iterations)
+    _worker_check = make_chunk_checker(encrypted_key, salt, iterations)
+
+def _process_chunk_worker(chunk):
+    """Process a chunk of passwords in a pool worker, stopping early once a password is found."""
+    if _stop_event is None:
+        return _worker_check(chunk)
+
     results = []
-    for password in chunk:
-        success, pwd = check_password(password, encrypted_key, salt, iterations)
-        if success:
-            results.append(pwd)
+    for i in range(0, len(chunk), STOP_CHECK_INTERVAL):
+        if _stop_event.is_set():
+            break
+        results.extend(_worker_check(chunk[i:i + STOP_CHECK_INTERVAL]))
     return results
 
-def process_chunk_parallel(chunk, encrypted_key, salt, iterations, processes):
-    """Process a chunk of passwords in parallel using multiple processes."""
-    # If processes is 1 or less, just use the single-threaded version
+def create_worker_pool(processes, encrypted_key, salt, iterations, native=False):
+    """Create the long-lived worker pool, or return None for single-process runs."""
+    global _stop_event
     if processes <= 1:
+        return None
+    _stop_event = multiprocessing.Event()
+    return multiprocessing.Pool(processes, initializer=_init_worker,
+                                initargs=(encrypted_key, salt, iterations, native, _stop_event))
+
+def process_chunk_parallel(chunk, encrypted_key, salt, iterations, processes, use_gpu=False, pool=None):
+    """Process a chunk of passwords in parallel on a worker pool."""
+    # Large chunks go to the GPU when requested and available
+    if use_gpu and GPU_AVAILABLE and len(chunk) >= GPU_MIN_BATCH:
+        results = process_chunk_gpu(chunk, encrypted_key, salt, iterations)
+        if results is not None:
+            return results
+
+    # Without a pool, or for very small chunks, use the single-process version
+    queued = _queue_chunk(chunk, processes, pool)
+    if queued is None:
         return process_chunk(chunk, encrypted_key, salt, iterations)
+    return _collect_chunk(queued)
+
+# Target run time of one worker tile: long enough that pickling and task
+# hand-off are a small share of it, short enough to keep workers balanced.
+# Tiles travel as PasswordRange integers or one PasswordBlock buffer, so a
+# round trip through the pool costs some 30-40 us, well under 0.1% of a
+# tile; a shared-memory ring of candidate slots would not pay for itself
+TILE_TARGET_SECONDS = 0.1
+
+# Smoothed seconds per key derivation in one worker; None until measured
+_derive_seconds = None
+
+def measure_derive_time(salt, iterations, samples=8):
+    """Time a few key derivations in this process and return seconds per key."""
+    passwords = [b'calibration%d' % i for i in range(samples)]
+    start = time.perf_counter()
+    for _ in derive_keys(passwords, salt, iterations):
+        pass
+    return (time.perf_counter() - start) / samples
+
+def update_derive_time(seconds):
+    """Fold a measured per-key derivation time into the running average."""
+    global _derive_seconds
+    if _derive_seconds is None:
+        _derive_seconds = seconds
+    else:
+        _derive_seconds = 0.8 * _derive_seconds + 0.2 * seconds
+
+def tile_size(chunk_length, processes):
+    """Return the number of passwords per worker tile for a chunk."""
+    # At least four tiles per worker, so one that finishes early picks up
+    # more work instead of idling while the slowest tile completes
+    balanced = max(1, chunk_length // (processes * 4))
+    if not _derive_seconds:
+        return min(256, balanced)
+    return max(1, min(balanced, int(TILE_TARGET_SECONDS / _derive_seconds)))
+
+def _queue_chunk(chunk, processes, pool):
+    """Queue a chunk on the worker pool in small tiles; None if it should run in-process."""
+    if pool is None or processes <= 1 or len(chunk) < processes * 4:
+        return None
 
-    # For very small chunks, don't bother with parallelism
-    if len(chunk) < processes * 4:  # Increased threshold for better efficiency
-        return process_chunk(chunk, encrypted_key, salt, iterations)
+    size = tile_size(len(chunk), processes)
+    tiles = (chunk[i:i + size] for i in range(0, len(chunk), size))
+    return pool.imap_unordered(_process_chunk_worker, tiles)
 
-    # Optimize for M3 processor - use a more efficient chunk size
-    # M3 has high single-core performance, so we want larger chunks per core
-    # to reduce overhead from process creation and communication
-    optimal_chunk_size = max(100, len(chunk) // processes)
+def _collect_chunk(queued):
+    """Wait for every tile of a queued chunk and return the matching passwords."""
+    results = []
+    for tile_results in queued:
+        if tile_results and _stop_event is not None:
+            # Found: the remaining tiles return as soon as their workers notice
+            _stop_event.set()
+        results.extend(tile_results)
+    return results
 
-    # Split the chunk into smaller chunks for parallel processing
-    # Use a more efficient method for creating sub-chunks
-    sub_chunks = []
-    for i in range(0, len(chunk), optimal_chunk_size):
-        end = min(i + optimal_chunk_size, len(chunk))
-        sub_chunks.append(chunk[i:end])
+def pipeline_chunks(chunks, encrypted_key, salt, iterations, processes, use_gpu=False, pool=None):
+    """
+    Process chunks in order, yielding (chunk, results) for each.
 
-    # Process the sub-chunks in parallel
-    results = []
+    Each chunk bound for the worker pool is queued before the previous
+    chunk's results are collected, so workers that finish their last tile
+    move straight on to the next chunk instead of waiting at the boundary.
+    """
+    pending = None
+    last_collected = time.perf_counter()
+    for chunk in chunks:
+        queued = None
+        if not (use_gpu and GPU_AVAILABLE and len(chunk) >= GPU_MIN_BATCH):
+            queued = _queue_chunk(chunk, processes, pool)
+
+        if pending is not None:
+            results = _collect_chunk(pending[1])
+
+            # With the pool kept busy, chunks complete one per
+            # len(chunk) / processes derivations; refine the tile size
+            now = time.perf_counter()
+            if not results:
+                update_derive_time((now - last_collected) * processes / len(pending[0]))
+            last_collected = now
+
+            yield pending[0], results
+            pending = None
+
+        if queued is None:
+            yield chunk, process_chunk_parallel(chunk, encrypted_key, salt, iterations, processes, use_gpu, pool)
+            last_collected = time.perf_counter()
+        else:
+            pending = (chunk, queued)
+
+    if pending is not None:
+        yield pending[0], _collect_chunk(pending[1])
+
+# Batches a producer thread may build ahead of the search loop
+PREFETCH_DEPTH = 4
 
-    # Use a context manager to ensure proper cleanup
-    with ProcessPoolExecutor(max_workers=processes) as executor:
-        # Submit all tasks
-        futures = []
-        for sub_chunk in sub_chunks:
-            future = executor.submit(process_chunk, sub_chunk, encrypted_key, salt, iterations)
-            futures.append(future)
+def prefetch(iterable, depth=PREFETCH_DEPTH):
+    """
+    Iterate over iterable while a background thread builds up to depth items ahead.
+
+    The next batches are generated while the search loop is blocked
+    waiting on workers, instead of after each chunk is collected. An
+    exception raised by the iterable is re-raised here; stopping early
+    (closing this generator) also stops the producer.
+    """
+    items = queue.Queue(depth)
+    stopping = threading.Event()
+    done = object()
 
-        # Collect results as they complete - more efficient with as_completed
-        for future in as_completed(futures):
+    def put(item):
+        # Wait for room, but give up once the consumer has gone
+        while not stopping.is_set():
             try:
-                sub_results = future.result()
-                if sub_results:  # If we found a match
-                    results.extend(sub_results)
-                    # Cancel remaining futures immediately
-                    for f in futures:
-                        if not f.done():
-                            f.cancel()
-                    break
-            except Exception:
-                # Ignore exceptions in worker processes for robustness
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
                 pass
+        return False
 
-    return results
+    def produce():
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+        except BaseException as e:
+            put((done, e))
+        else:
+            put((done, None))
+
+    producer = threading.Thread(target=produce, name="prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item, error = items.get()
+            if item is done:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stopping.set()
+        producer.join()
+
+@functools.lru_cache(maxsize=32)
+def password_decoder(charset, length):
+    """
+    Return a function mapping a product index to its password, unrolled for one length.
+
+    The source is generated per (charset, length) with one digit per line
+    and the charset size as a literal, so decoding a candidate runs no
+    inner loop and builds no divmod tuples.
+    """
+    base = len(charset)
+    lines = ["def password_at(index, charset=charset):"]
+    for position in range(length - 1):
+        lines.append(f"    c{position} = charset[index % {base}]; index //= {base}")
+    if length:
+        lines.append(f"    c{length - 1} = charset[index % {base}]")
+        lines.append("    return " + " + ".join(f"c{position}" for position in reversed(range(length))))
+    else:
+        lines.append("    return ''")
+    namespace = {'charset': charset}
+    exec("\n".join(lines), namespace)
+    return namespace['password_at']
+
+class PasswordRange:
+    """
+    A run of consecutive candidates from itertools.product(charset, repeat=length).
+
+    Acts as a read-only list of password strings (len, indexing, contiguous
+    slicing and iteration) but pickles as a handful of integers, so worker
+    tiles carry an index range and the workers generate the passwords.
+    """
+
+    __slots__ = ('charset', 'length', 'start', 'count')
+
+    def __init__(self, charset, length, start, count):
+        self.charset = charset
+        self.length = length
+        self.start = start
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def password_at(self, index):
+        """Return the candidate at an absolute product index (mixed-radix decode)."""
+        return password_decoder(self.charset, self.length)(index)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self.count)
+            if step != 1:
+                raise ValueError("PasswordRange slices must be contiguous")
+            return PasswordRange(self.charset, self.length, self.start + start, max(0, stop - start))
+        if key < 0:
+            key += self.count
+        if not 0 <= key < self.count:
+            raise IndexError("PasswordRange index out of range")
+        return self.password_at(self.start + key)
+
+    def __iter__(self):
+        return map(password_decoder(self.charset, self.length), range(self.start, self.start + self.count))
+
+    def filtered(self, max_consecutive):
+        """
+        Return the candidates with no run longer than max_consecutive.
+
+        With NumPy and an ASCII charset the whole range is decoded at once
+        into a fixed-stride byte matrix and runs are rejected column by
+        column; the survivors are returned as a PasswordBlock. Other ranges
+        fall back to has_too_many_consecutive_chars per candidate and
+        return a list of strings.
+        """
+        base = len(self.charset)
+        if not (NUMPY_AVAILABLE and self.length and self.charset.isascii() and base ** self.length < 2 ** 63):
+            too_many = has_too_many_consecutive_chars
+            return [password for password in self if not too_many(password, max_consecutive)]
+
+        table = np.frombuffer(self.charset.encode('ascii'), dtype=np.uint8)
+        index = np.arange(self.start, self.start + self.count, dtype=np.int64)
+        codes = np.empty((self.count, self.length), dtype=np.uint8)
+        for column in range(self.length - 1, -1, -1):
+            index, digit = np.divmod(index, base)
+            codes[:, column] = table[digit]
+
+        if 0 < max_consecutive < self.length:
+            # Compare characters rather than digits so repeated charset
+            # entries count as the same character
+            run = np.ones(self.count, dtype=np.int64)
+            keep = np.ones(self.count, dtype=bool)
+            for column in range(1, self.length):
+                same = codes[:, column] == codes[:, column - 1]
+                run = np.where(same, run + 1, 1)
+                keep &= run <= max_consecutive
+            codes = codes[keep]
+
+        return PasswordBlock(codes.tobytes(), self.length)
+
+class PasswordBlock:
+    """
+    A batch of same-length passwords stored back to back in one bytes object.
+
+    Acts as a read-only list of byte passwords (len, indexing, contiguous
+    slicing and iteration). The batch holds no object per candidate until a
+    password is taken out, pickles as a single buffer and hands workers
+    bytes, so candidates are never round-tripped through str.
+    """
+
+    __slots__ = ('data', 'length')
+
+    def __init__(self, data, length):
+        self.data = data
+        self.length = length
+
+    def __len__(self):
+        return len(self.data) // self.length
+
+    def __getitem__(self, key):
+        count = len(self)
+        if isinstance(key, slice):
+            start, stop, step = key.indices(count)
+            if step != 1:
+                raise ValueError("PasswordBlock slices must be contiguous")
+            return PasswordBlock(self.data[start * self.length:max(start, stop) * self.length], self.length)
+        if key < 0:
+            key += count
+        if not 0 <= key < count:
+            raise IndexError("PasswordBlock index out of range")
+        return self.data[key * self.length:(key + 1) * self.length]
+
+    def __iter__(self):
+        data, length = self.data, self.length
+        return (data[i:i + length] for i in range(0, len(data), length))
+
+def password_ranges(charset, length, batch_size):
+    """Split all passwords of a length into PasswordRange batches, in product order."""
+    total = len(charset) ** length
+    for start in range(0, total, batch_size):
+        yield PasswordRange(charset, length, start, min(batch_size, total - start))
+
+def filtered_password_batches(charset, length, batch_size, max_consecutive):
+    """Yield batches of passwords with no run longer than max_consecutive, in product order."""
+    for password_range in password_ranges(charset, length, batch_size):
+        yield password_range.filtered(max_consecutive)
 
 def chunk_generator(generator, chunk_size):
     """Split a generator into chunks."""
@@ -427,6 +923,10 @@ def smart_password_generator(charset, length, batch_size=1000, max_consecutive=0
     # First, try common patterns
     batch = []
 
+    # Every pattern candidate, so none is derived twice (the patterns overlap
+    # each other and the exhaustive pass)
+    tried = set()
+
     # Try common prefixes with common suffixes
     for prefix in common_prefixes:
         for suffix in common_suffixes:
@@ -435,7 +935,9 @@ def smart_password_generator(charset, length, batch_size=1000, max_consecutive=0
                 middle_len = length - len(prefix) - len(suffix)
                 if middle_len == 0:
                     password = prefix + suffix
-                    if max_consecutive <= 0 or not has_too_many_consecutive_chars(password, max_consecutive):
+                    if password not in tried and (max_consecutive <= 0 or
+                                                  not has_too_many_consecutive_chars(password, max_consecutive)):
+                        tried.add(password)
                         batch.append(password)
                         if len(batch) >= batch_size:
                             yield batch
@@ -445,7 +947,9 @@ def smart_password_generator(charset, length, batch_size=1000, max_consecutive=0
                     for c in common_chars[:min(10, len(common_chars))]:
                         middle = c * middle_len
                         password = prefix + middle + suffix
-                        if max_consecutive <= 0 or not has_too_many_consecutive_chars(password, max_consecutive):
+                        if password not in tried and (max_consecutive <= 0 or
+                                                      not has_too_many_consecutive_chars(password, max_consecutive)):
+                            tried.add(password)
                             batch.append(password)
                             if len(batch) >= batch_size:
                                 yield batch
@@ -455,7 +959,8 @@ def smart_password_generator(charset, length, batch_size=1000, max_consecutive=0
     for c in charset:
         password = c * length
         # Only add if max_consecutive allows it (or is disabled)
-        if max_consecutive <= 0 or length <= max_consecutive:
+        if password not in tried and (max_consecutive <= 0 or length <= max_consecutive):
+            tried.add(password)
             batch.append(password)
             if len(batch) >= batch_size:
                 yield batch
@@ -468,7 +973,9 @@ def smart_password_generator(charset, length, batch_size=1000, max_consecutive=0
             if length % 2 == 1:
                 pattern += charset[i]
             # Check for consecutive characters
-            if max_consecutive <= 0 or not has_too_many_consecutive_chars(pattern, max_consecutive):
+            if pattern not in tried and (max_consecutive <= 0 or
+                                         not has_too_many_consecutive_chars(pattern, max_consecutive)):
+                tried.add(pattern)
                 batch.append(pattern)
                 if len(batch) >= batch_size:
                     yield batch
@@ -477,6 +984,7 @@ def smart_password_generator(charset, length, batch_size=1000, max_consecutive=0
     # Yield any remaining passwords
     if batch:
         yield batch
+        batch = []
 
     # Finally, fall back to regular brute force
     # But prioritize common characters first
@@ -488,28 +996,94 @@ def smart_password_generator(charset, length, batch_size=1000, max_consecutive=0
         if c not in sorted_charset:
             sorted_charset += c
 
-    # Now generate passwords with the sorted charset
-    for password_tuple in itertools.product(sorted_charset, repeat=length):
-        password = ''.join(password_tuple)
-        batch.append(password)
-        if len(batch) >= batch_size:
-            yield batch
-            batch = []
-
-    # Yield any remaining passwords
-    if batch:
+    # Now generate passwords with the sorted charset; joining, filtering and
+    # batching all run through iterator builtins rather than a Python loop
+    candidates = itertools.filterfalse(
+        tried.__contains__, map(''.join, itertools.product(sorted_charset, repeat=length))
+    )
+    while True:
+        batch = list(itertools.islice(candidates, batch_size))
+        if not batch:
+            break
         yield batch
 
+def _write_checkpoint(checkpoint_file, data):
+    """
+    Write serialized checkpoint bytes atomically.
+
+    The bytes go to a temporary file next to the checkpoint (synchronously
+    on disk where O_DSYNC exists) which then replaces it, so an interrupted
+    write never leaves a truncated checkpoint behind.
+    """
+    tmp_file = checkpoint_file + '.tmp'
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_DSYNC', 0)
+    fd = os.open(tmp_file, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp_file, checkpoint_file)
+
 def save_checkpoint(checkpoint_file, current_state):
     """Save the current state to a checkpoint file."""
     try:
-        with open(checkpoint_file, 'w') as f:
-            json.dump(current_state, f)
+        _write_checkpoint(checkpoint_file, json.dumps(current_state).encode('utf-8'))
         return True
     except Exception as e:
         print(f"\n{WARNING}Error saving checkpoint: {e}{RESET}")
         return False
 
+class CheckpointWriter:
+    """
+    Save checkpoints from a background thread.
+
+    save() only serializes the state and hands the bytes over; the thread
+    does the file write, so disk latency is hidden behind the search. If a
+    write is still pending when the next checkpoint arrives, only the newer
+    one is written.
+    """
+
+    def __init__(self, checkpoint_file, notify=print):
+        self.checkpoint_file = checkpoint_file
+        self.notify = notify
+        self._pending = None
+        self._closing = False
+        self._ready = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="checkpoint", daemon=True)
+        self._thread.start()
+
+    def save(self, current_state):
+        """Queue the state for writing without waiting for the disk."""
+        data = json.dumps(current_state).encode('utf-8')
+        with self._ready:
+            self._pending = (data, current_state.get('attempts', 0))
+            self._ready.notify()
+
+    def close(self):
+        """Write any pending checkpoint and stop the thread; safe to call more than once."""
+        with self._ready:
+            self._closing = True
+            self._ready.notify()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._ready:
+                while self._pending is None and not self._closing:
+                    self._ready.wait()
+                pending, self._pending = self._pending, None
+                if pending is None:
+                    return
+            data, attempts = pending
+            try:
+                _write_checkpoint(self.checkpoint_file, data)
+            except Exception as e:
+                self.notify(f"{WARNING}Error saving checkpoint: {e}{RESET}")
+            else:
+                self.notify(f"{INFO}Checkpoint saved: {attempts:,} passwords tested{RESET}")
+
 def load_checkpoint(checkpoint_file):
     """Load the current state from a checkpoint file."""
     try:
@@ -547,17 +1121,11 @@ def calculate_eta(attempts, total, elapsed):
     seconds_remaining = remaining_attempts / rate
     return format_time(seconds_remaining)
 
-def print_stats(attempts, total, elapsed, rate, current_password=None, show_current=False, single_line=True):
-    """Print statistics about the brute force process."""
+def format_stats(attempts, total, elapsed, rate, current_password=None, show_current=False, single_line=True):
+    """Return the status text print_stats writes, including its line control characters."""
     percent = (attempts / total) * 100 if total > 0 else 0
     eta = calculate_eta(attempts, total, elapsed)
 
-    # For single line mode, we need to clear the line first
-    if single_line:
-        # Use a longer clear string to ensure the entire line is cleared
-        # This is especially important for wide terminal windows
-        sys.stdout.write("\r" + " " * 150 + "\r")
-
     # Build the stats string
     stats = (
         f"{INFO}Progress: {BOLD}{percent:.2f}%{RESET} "
@@ -570,24 +1138,139 @@ def print_stats(attempts, total, elapsed, rate, current_password=None, show_curr
     if show_current and current_password:
         stats += f" | Current: {current_password}"
 
-    # For single line mode, we need to start with a carriage return
-    # and NOT end with a newline
+    # For single line mode, clear the line first (a long clear string covers
+    # wide terminal windows), then start with a carriage return and do NOT
+    # end with a newline
     if single_line:
-        # Only add the carriage return at the beginning
-        stats = "\r" + stats
-    else:
-        # For multi-line mode, end with a newline
-        stats += "\n"
+        return CLEAR_LINE + stats
+    # For multi-line mode, end with a newline
+    return stats + "\n"
 
+def print_stats(attempts, total, elapsed, rate, current_password=None, show_current=False, single_line=True):
+    """Print statistics about the brute force process."""
     # Write the stats and flush to ensure immediate display
-    sys.stdout.write(stats)
+    sys.stdout.write(format_stats(attempts, total, elapsed, rate, current_password, show_current, single_line))
     sys.stdout.flush()
 
-def brute_force_wordlist(wordlist_path, encrypted_key, salt, iterations, processes, status_interval, show_current=False, quiet=False, single_line=True):
+def _raw_terminal_fd():
+    """
+    Return the file descriptor behind sys.stdout if status lines can be written to it directly.
+
+    Only a POSIX terminal qualifies: redirected output keeps going through
+    sys.stdout so it stays ordered with buffered prints, and on Windows
+    colorama has to translate the colour codes.
+    """
+    if os.name != 'posix':
+        return None
+    try:
+        if sys.stdout.isatty():
+            return sys.stdout.fileno()
+    except (AttributeError, ValueError, OSError):
+        pass
+    return None
+
+def status_interval_shift(status_interval):
+    """
+    Round a status interval to the nearest power of two and return its exponent.
+
+    The search loops force a status update whenever attempts >> shift
+    changes, i.e. each time a multiple of the interval is crossed, which
+    costs a shift and a compare per batch instead of a division.
+    """
+    interval = max(1, status_interval)
+    shift = interval.bit_length() - 1
+    if interval - (1 << shift) > (2 << shift) - interval:
+        shift += 1
+    return shift
+
+class StatusReporter:
+    """
+    Print brute force progress from a background thread.
+
+    The search loop only publishes its latest counters with update(); the
+    thread formats and writes them at most once per interval (or at once
+    when forced), so terminal output never holds up the loop and the
+    elapsed time and ETA keep ticking while the loop waits on a chunk.
+    """
+
+    def __init__(self, total, start_ns, show_current=False, single_line=True, interval=0.5):
+        self.total = total
+        self.start_ns = start_ns
+        self.show_current = show_current
+        self.single_line = single_line
+        self.interval = interval
+        self.lock = threading.Lock()
+        self._snapshot = None
+        self._printed = None
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="status", daemon=True)
+        self._fd = _raw_terminal_fd()
+
+    def start(self):
+        """Start the reporting thread and return self."""
+        self._thread.start()
+        return self
+
+    def update(self, attempts, current=None, detail=None, force=False):
+        """Publish the latest progress; force prints it without waiting for the interval."""
+        self._snapshot = (attempts, current, detail)
+        if force:
+            self._wake.set()
+
+    def message(self, text):
+        """Print a line of its own without tearing the status line."""
+        with self.lock:
+            if self.single_line:
+                sys.stdout.write(CLEAR_LINE)
+            print(text)
+
+    def stop(self):
+        """Stop the reporting thread; safe to call more than once."""
+        if not self._stopping:
+            self._stopping = True
+            self._wake.set()
+            self._thread.join()
+
+    def _run(self):
+        while not self._stopping:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            if not self._stopping:
+                self._print()
+
+    def _print(self):
+        snapshot = self._snapshot
+        # A single status line is refreshed so the clock keeps moving; in
+        # multi-line mode only new progress is printed
+        if snapshot is None or (not self.single_line and snapshot is self._printed):
+            return
+        self._printed = snapshot
+
+        attempts, current, detail = snapshot
+        if isinstance(current, bytes):
+            current = current.decode('utf-8', errors='replace')
+        elapsed = (time.monotonic_ns() - self.start_ns) / 1e9
+        rate = attempts / elapsed if elapsed > 0 else 0
+        text = format_stats(attempts, self.total, elapsed, rate, current, self.show_current, self.single_line)
+        if detail and not self.single_line:
+            text += detail
+        with self.lock:
+            if self._fd is None:
+                sys.stdout.write(text)
+                sys.stdout.flush()
+            else:
+                # One raw write per refresh, bypassing the text layer (and
+                # colorama's wrapper, hence the explicit reset)
+                os.write(self._fd, (text + RESET).encode('utf-8', errors='replace'))
+
+def brute_force_wordlist(wordlist_path, encrypted_key, salt, iterations, processes, status_interval, show_current=False, quiet=False, single_line=True,
+                         pool=None):
     """Brute force using a wordlist."""
     try:
         with open(wordlist_path, 'r', encoding='utf-8', errors='ignore') as f:
-            passwords = [line.strip() for line in f if line.strip()]
+            # Drop repeated entries up front, keeping the wordlist order
+            passwords = list(dict.fromkeys(line.strip() for line in f if line.strip()))
     except Exception as e:
         print(f"{ERROR}Error reading wordlist: {e}{RESET}")
         sys.exit(1)
@@ -606,67 +1289,67 @@ def brute_force_wordlist(wordlist_path, encrypted_key, salt, iterations, process
 
     # Process passwords in chunks
     attempts = 0
-    start_time = time.time()
-    last_status_time = start_time
-    last_update_time = start_time
+    # Monotonic integer nanoseconds: immune to clock steps, no float per check
+    start_ns = time.monotonic_ns()
+    last_update_ns = start_ns
     found_passwords = []
 
+    # Progress is printed from a background thread
+    reporter = None
+    if not quiet:
+        reporter = StatusReporter(total_passwords, start_ns, show_current, single_line, interval=1).start()
+    status_shift = status_interval_shift(status_interval)
+    status_block = 0
+
     # Process in chunks to provide regular updates
     # Optimize for M3 processor - use larger chunks for better performance
     chunk_size = 5000  # Much larger chunks for M3's high performance cores
     batch_num = 0
 
-    for i in range(0, total_passwords, chunk_size):
+    # Process the chunks using parallel processing if available
+    chunks = (passwords[i:i + chunk_size] for i in range(0, total_passwords, chunk_size))
+    for chunk, results in pipeline_chunks(chunks, encrypted_key, salt, iterations, processes, pool=pool):
         batch_num += 1
-        chunk = passwords[i:i+chunk_size]
-
-        # Process the chunk using parallel processing if available
-        results = process_chunk_parallel(chunk, encrypted_key, salt, iterations, processes)
         chunk_size_actual = len(chunk)
         attempts += chunk_size_actual
 
         # Update progress bar (force update every 0.1 seconds)
-        current_time = time.time()
-        if pbar and (current_time - last_update_time >= 0.1):
+        now_ns = time.monotonic_ns()
+        if pbar and (now_ns - last_update_ns >= PROGRESS_BAR_INTERVAL_NS):
             pbar.update(chunk_size_actual)
             pbar.refresh()
-            last_update_time = current_time
-
-        # Print detailed stats
-        if attempts % status_interval == 0 or current_time - last_status_time >= 1:
-            elapsed = current_time - start_time
-            rate = attempts / elapsed if elapsed > 0 else 0
-
-            # Show current password if requested
-            current_pwd = chunk[-1] if show_current and chunk else None
-
-            # Print stats
-            if not quiet:
-                if single_line:
-                    # Just print a single status line
-                    print_stats(attempts, total_passwords, elapsed, rate, current_pwd, show_current, True)
-                else:
-                    # Print more detailed stats
-                    print_stats(attempts, total_passwords, elapsed, rate, current_pwd, show_current, False)
-                    sys.stdout.write(f"\r{INFO}Batch {batch_num}: Testing {chunk_size_actual} passwords from wordlist{RESET}")
-                    sys.stdout.flush()
-
-            last_status_time = current_time
+            last_update_ns = now_ns
+
+        # Publish progress for the status thread
+        if reporter:
+            current_pwd = chunk[-1] if show_current else None
+            detail = None
+            if not single_line:
+                detail = WORDLIST_BATCH_STATUS % (batch_num, chunk_size_actual)
+            block = attempts >> status_shift
+            reporter.update(attempts, current_pwd, detail, force=block != status_block)
+            status_block = block
 
         # Check if we found a match
         if results:
+            if reporter:
+                reporter.stop()
             for password in results:
+                # The worker's check already rules out false positives (a
+                # full block of valid padding alone is a 2^-128 event), so
+                # the hit is not derived a second time. Workers hand back the
+                # bytes they derived from; this is the one decode, for the
+                # printout and the return value
                 if isinstance(password, bytes):
                     password = password.decode('utf-8', errors='replace')
+                found_passwords.append(password)
+                print(f"\n{SUCCESS}{BOLD}Potential password found: {password}{RESET}")
 
-                # Double-check the password to avoid false positives
-                is_valid, _ = check_password(password, encrypted_key, salt, iterations)
-                if is_valid:
-                    found_passwords.append(password)
-                    print(f"\n{SUCCESS}{BOLD}Potential password found: {password}{RESET}")
-                    if not single_line:
-                        print(f"{INFO}Continuing to search for additional matches...{RESET}")
+            # Stop at the first hit; main() tears down the pool
+            break
 
+    if reporter:
+        reporter.stop()
     if pbar:
         pbar.close()
 
@@ -688,12 +1371,35 @@ def brute_force_wordlist(wordlist_path, encrypted_key, salt, iterations, process
         print(f"{WARNING}No matching password found in wordlist{RESET}")
         return None
 
+def architecture_settings(optimize_for, processes):
+    """Return the (batch_size, processes) to use for generated passwords on this CPU."""
+    if optimize_for == "m3":
+        # M3 has high single-core performance and efficient cores
+        batch_size = 10000  # Larger batches for M3
+        processes = min(processes, 10)  # Slight oversubscription for M3
+    elif optimize_for == "m2" or optimize_for == "m1":
+        # M1/M2 also have good performance
+        batch_size = 8000
+        processes = min(processes, 10)
+    elif optimize_for == "intel":
+        # Intel processors often have more cores but lower single-core performance
+        batch_size = 5000
+        processes = min(processes, os.cpu_count() + 2)  # More oversubscription
+    else:  # auto
+        # Detect Apple Silicon
+        import platform as plt
+        if plt.processor() == 'arm':
+            batch_size = 10000  # Assume M-series
+            processes = min(processes, 10)
+        else:
+            batch_size = 5000
+            processes = min(processes, os.cpu_count() + 2)
+    return batch_size, processes
+
 def brute_force_generated(min_length, max_length, charset, encrypted_key, salt, iterations, processes, status_interval,
                        show_current=False, quiet=False, single_line=True, smart=False, checkpoint=None,
-                       checkpoint_interval=60, use_gpu=False, optimize_for="auto", max_consecutive=0):
+                       checkpoint_interval=60, use_gpu=False, optimize_for="auto", max_consecutive=0, pool=None):
     """Brute force using generated passwords."""
-    charset_list = list(charset)
-
     # Calculate total number of passwords to try
     if max_consecutive > 0 and max_consecutive < max_length:
         # Estimate the number of passwords with max_consecutive constraint
@@ -752,10 +1458,11 @@ def brute_force_generated(min_length, max_length, charset, encrypted_key, salt,
 
     # Process results as they complete
     attempts = 0
-    start_time = time.time()
-    last_status_time = start_time
-    last_update_time = start_time
-    last_checkpoint_time = start_time
+    # Monotonic integer nanoseconds: immune to clock steps, no float per check
+    start_ns = time.monotonic_ns()
+    last_update_ns = start_ns
+    last_checkpoint_ns = start_ns
+    checkpoint_interval_ns = int(checkpoint_interval * 1e9)
 
     # Use a simpler approach with direct processing
     print(f"{INFO}Starting password testing...{RESET}")
@@ -771,32 +1478,23 @@ def brute_force_generated(min_length, max_length, charset, encrypted_key, salt,
         if checkpoint_data:
             print(f"{INFO}Resuming from checkpoint: {checkpoint_data.get('attempts', 0):,} passwords tested{RESET}")
             attempts = checkpoint_data.get('attempts', 0)
-            start_time = time.time() - checkpoint_data.get('elapsed', 0)
+            start_ns = time.monotonic_ns() - int(checkpoint_data.get('elapsed', 0) * 1e9)
             # Skip lengths that have been completed
             min_length = checkpoint_data.get('current_length', min_length)
 
-    # Optimize for specific architecture
-    if optimize_for == "m3":
-        # M3 has high single-core performance and efficient cores
-        batch_size = 10000  # Larger batches for M3
-        processes = min(processes, 10)  # Slight oversubscription for M3
-    elif optimize_for == "m2" or optimize_for == "m1":
-        # M1/M2 also have good performance
-        batch_size = 8000
-        processes = min(processes, 10)
-    elif optimize_for == "intel":
-        # Intel processors often have more cores but lower single-core performance
-        batch_size = 5000
-        processes = min(processes, os.cpu_count() + 2)  # More oversubscription
-    else:  # auto
-        # Detect Apple Silicon
-        import platform as plt
-        if plt.processor() == 'arm':
-            batch_size = 10000  # Assume M-series
-            processes = min(processes, 10)
-        else:
-            batch_size = 5000
-            processes = min(processes, os.cpu_count() + 2)
+    batch_size, processes = architecture_settings(optimize_for, processes)
+
+    # Progress is printed from a background thread
+    reporter = None
+    if not quiet:
+        reporter = StatusReporter(total_passwords, start_ns, show_current, single_line).start()
+    status_shift = status_interval_shift(status_interval)
+    status_block = attempts >> status_shift
+
+    # Checkpoints are written from a background thread
+    writer = None
+    if checkpoint:
+        writer = CheckpointWriter(checkpoint, reporter.message if reporter else lambda text: print(f"\n{text}"))
 
     for length in range(min_length, max_length + 1):
         if not single_line:
@@ -806,7 +1504,7 @@ def brute_force_generated(min_length, max_length, charset, encrypted_key, salt,
         if checkpoint:
             checkpoint_data = {
                 'attempts': attempts,
-                'elapsed': time.time() - start_time,
+                'elapsed': (time.monotonic_ns() - start_ns) / 1e9,
                 'current_length': length,
                 'charset': charset,
                 'min_length': min_length,
@@ -815,104 +1513,91 @@ def brute_force_generated(min_length, max_length, charset, encrypted_key, salt,
 
         # Choose the password generator based on settings
         if smart:
-            generator = smart_password_generator(charset, length, batch_size, max_consecutive)
-        else:
-            # For each length, generate all possible passwords
-            # Optimize batch size based on architecture
-            generator = chunk_generator(itertools.product(charset_list, repeat=length), batch_size)
+            password_batches = smart_password_generator(charset, length, batch_size, max_consecutive)
 
-        for batch in generator:
-            batch_num += 1
-            # Convert tuples to strings and filter out passwords with too many consecutive characters
+            # Filter out passwords with too many consecutive characters
             if max_consecutive > 0:
-                password_batch = [''.join(p) for p in batch if not has_too_many_consecutive_chars(''.join(p), max_consecutive)]
-            else:
-                password_batch = [''.join(p) for p in batch]
-
-            # Process the batch
+                too_many = has_too_many_consecutive_chars
+                password_batches = ([password for password in batch if not too_many(password, max_consecutive)]
+                                    for batch in password_batches)
+        elif max_consecutive <= 0:
+            # Unfiltered exhaustive search: batches are index ranges, so
+            # workers receive a few integers per tile and build the passwords
+            password_batches = password_ranges(charset, length, batch_size)
+        else:
+            # Filtered exhaustive search: each batch is decoded and filtered
+            # as a whole rather than one product tuple at a time
+            password_batches = filtered_password_batches(charset, length, batch_size, max_consecutive)
+
+        if smart or max_consecutive > 0:
+            # These batches take real work to build; build them while the
+            # loop waits on the workers (index ranges are free to create)
+            password_batches = prefetch(password_batches)
+
+        # Process the batches; the next batch is queued while this one finishes
+        for password_batch, results in pipeline_chunks(password_batches, encrypted_key, salt, iterations,
+                                                       processes, use_gpu, pool):
+            batch_num += 1
             try:
-                results = process_chunk_parallel(password_batch, encrypted_key, salt, iterations, processes)
                 current_batch_size = len(password_batch)
                 attempts += current_batch_size
 
                 # Update progress bar (force update every 0.1 seconds)
-                current_time = time.time()
-                if pbar and (current_time - last_update_time >= 0.1):
+                now_ns = time.monotonic_ns()
+                if pbar and (now_ns - last_update_ns >= PROGRESS_BAR_INTERVAL_NS):
                     pbar.update(current_batch_size)
                     pbar.refresh()
-                    last_update_time = current_time
-
-                # Print detailed stats
-                if attempts % status_interval == 0 or current_time - last_status_time >= 0.5:
-                    elapsed = current_time - start_time
-                    rate = attempts / elapsed if elapsed > 0 else 0
-
-                    # Update current pattern for display
-                    current_pattern = password_batch[-1] if show_current and password_batch else None
-
-                    # Print stats
-                    if not quiet:
-                        if single_line:
-                            # Just print a single status line
-                            print_stats(attempts, total_passwords, elapsed, rate, current_pattern, show_current, True)
-                        else:
-                            # Print more detailed stats
-                            print_stats(attempts, total_passwords, elapsed, rate, current_pattern, show_current, False)
-                            sys.stdout.write(f"\r{INFO}Batch {batch_num}: Testing {current_batch_size} passwords of length {length}{RESET}")
-                            sys.stdout.flush()
-
-                    last_status_time = current_time
-
-                    # Save checkpoint if needed
-                    if checkpoint and (current_time - last_checkpoint_time >= checkpoint_interval):
-                        checkpoint_data = {
-                            'attempts': attempts,
-                            'elapsed': current_time - start_time,
-                            'current_length': length,
-                            'charset': charset,
-                            'min_length': min_length,
-                            'max_length': max_length
-                        }
-                        if save_checkpoint(checkpoint, checkpoint_data):
-                            # If in single line mode, don't add a newline
-                            if single_line:
-                                # Save current progress stats
-                                elapsed = current_time - start_time
-                                rate = attempts / elapsed if elapsed > 0 else 0
-                                current_pattern = password_batch[-1] if show_current and password_batch else None
-
-                                # Clear the line first
-                                sys.stdout.write("\r" + " " * 150 + "\r")
-                                sys.stdout.write(f"{INFO}Checkpoint saved: {attempts:,} passwords tested{RESET}")
-                                sys.stdout.flush()
-
-                                # Wait a moment to show the message
-                                time.sleep(0.5)
-
-                                # Restore progress display
-                                sys.stdout.write("\r" + " " * 150 + "\r")
-                                print_stats(attempts, total_passwords, elapsed, rate, current_pattern, show_current, True)
-                            else:
-                                print(f"\n{INFO}Checkpoint saved: {attempts:,} passwords tested{RESET}")
-                        last_checkpoint_time = current_time
+                    last_update_ns = now_ns
+
+                # Publish progress for the status thread
+                if reporter:
+                    current_pattern = password_batch[-1] if show_current and current_batch_size else None
+                    detail = None
+                    if not single_line:
+                        detail = GENERATED_BATCH_STATUS % (batch_num, current_batch_size, length)
+                    block = attempts >> status_shift
+                    reporter.update(attempts, current_pattern, detail, force=block != status_block)
+                    status_block = block
+
+                # Save checkpoint if needed
+                if checkpoint and (now_ns - last_checkpoint_ns >= checkpoint_interval_ns):
+                    checkpoint_data = {
+                        'attempts': attempts,
+                        'elapsed': (now_ns - start_ns) / 1e9,
+                        'current_length': length,
+                        'charset': charset,
+                        'min_length': min_length,
+                        'max_length': max_length
+                    }
+                    writer.save(checkpoint_data)
+                    last_checkpoint_ns = now_ns
 
                 # Check if we found a match
                 if results:
+                    if writer:
+                        writer.close()
+                    if reporter:
+                        reporter.stop()
                     for password in results:
+                        # Verified by the worker's check; see brute_force_wordlist
                         if isinstance(password, bytes):
                             password = password.decode('utf-8', errors='replace')
+                        found_passwords.append(password)
+                        print(f"\n{SUCCESS}{BOLD}Potential password found: {password}{RESET}")
 
-                        # Double-check the password to avoid false positives
-                        is_valid, _ = check_password(password, encrypted_key, salt, iterations)
-                        if is_valid:
-                            found_passwords.append(password)
-                            print(f"\n{SUCCESS}{BOLD}Potential password found: {password}{RESET}")
-                            if not single_line:
-                                print(f"{INFO}Continuing to search for additional matches...{RESET}")
+                    # Stop at the first hit; main() tears down the pool
+                    break
 
             except Exception as e:
                 print(f"\n{ERROR}Error processing batch {batch_num}: {e}{RESET}")
 
+        if found_passwords:
+            break
+
+    if writer:
+        writer.close()
+    if reporter:
+        reporter.stop()
     if pbar:
         pbar.close()
 
@@ -996,6 +1681,18 @@ def print_system_info():
     else:
         print(f"  {INFO}GPU Acceleration:{RESET} Not available (install pyopencl and numpy for GPU support)")
 
+    # Report the key derivation backend
+    if PBKDF2_BACKEND == "hashlib":
+        print(f"  {INFO}PBKDF2:{RESET} hashlib (install fastpbkdf2 for faster key derivation)")
+    else:
+        print(f"  {INFO}PBKDF2:{RESET} {PBKDF2_BACKEND}")
+
+    # Report how the master key is decrypted
+    if AESNI_AVAILABLE:
+        print(f"  {INFO}AES:{RESET} AES-NI (PyCryptodome)")
+    else:
+        print(f"  {INFO}AES:{RESET} software (PyCryptodome; no AES instructions detected)")
+
     print(f"  {INFO}Python:{RESET} {plt.python_version()}")
     print()
 
@@ -1054,28 +1751,60 @@ def main():
     # Start time for the whole process
     overall_start_time = time.time()
 
-    # Start brute force
-    if args.wordlist:
-        print(f"{INFO}Starting brute force with wordlist: {args.wordlist}{RESET}")
-        password = brute_force_wordlist(
-            args.wordlist, encrypted_key, salt, iterations,
-            args.processes, args.status_interval, args.show_current, args.quiet, args.single_line
-        )
+    # Build the specialised PBKDF2 before starting workers so it is compiled
+    # once; on Apple Silicon the hardware SHA-512 in CommonCrypto is faster
+    native = args.native and not COMMONCRYPTO_AVAILABLE and enable_native_pbkdf2(salt, iterations)
+    if native:
+        print(f"  {INFO}PBKDF2 backend:{RESET} specialised C")
     else:
-        print(f"{INFO}Starting brute force with generated passwords{RESET}")
-        password = brute_force_generated(
-            args.min_passwd, args.max_passwd, args.charset,
-            encrypted_key, salt, iterations, args.processes,
-            args.status_interval, args.show_current, args.quiet, args.single_line,
-            args.smart, args.checkpoint, args.checkpoint_interval, args.use_gpu, args.optimize_for,
-            args.max_consecutive
-        )
+        print(f"  {INFO}PBKDF2 backend:{RESET} {PBKDF2_BACKEND}")
+
+    # Generated passwords cap the worker count for the target CPU; size the
+    # pool from that capped count so tiles match the workers actually running
+    processes = args.processes
+    if not args.wordlist:
+        _, processes = architecture_settings(args.optimize_for, args.processes)
+
+    # Start the worker processes once; every batch reuses them
+    pool = create_worker_pool(processes, encrypted_key, salt, iterations, native)
+
+    # Size worker tiles from a measured derivation time; refined as chunks complete
+    update_derive_time(measure_derive_time(salt, iterations))
+    if args.debug:
+        print(f"  {INFO}Key derivation:{RESET} {_derive_seconds * 1000:.2f} ms per password")
+        print(f"  {INFO}Worker tile size:{RESET} {tile_size(5000, processes)} passwords per 5000-password chunk")
+
+    # Start brute force
+    try:
+        if args.wordlist:
+            print(f"{INFO}Starting brute force with wordlist: {args.wordlist}{RESET}")
+            password = brute_force_wordlist(
+                args.wordlist, encrypted_key, salt, iterations,
+                args.processes, args.status_interval, args.show_current, args.quiet, args.single_line,
+                pool
+            )
+        else:
+            print(f"{INFO}Starting brute force with generated passwords{RESET}")
+            password = brute_force_generated(
+                args.min_passwd, args.max_passwd, args.charset,
+                encrypted_key, salt, iterations, processes,
+                args.status_interval, args.show_current, args.quiet, args.single_line,
+                args.smart, args.checkpoint, args.checkpoint_interval, args.use_gpu, args.optimize_for,
+                args.max_consecutive, pool
+            )
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
 
     # Calculate total time
     total_time = time.time() - overall_start_time
 
     if password:
-        # Final verification with a different method if possible
+        # Final verification with a different method if possible. This is
+        # the only key derived twice: the search loops trust worker hits (and
+        # stop at the first one), so a single derivation here, in this
+        # process and off the GPU/Metal path, is the whole verification cost
         print(f"\n{INFO}Performing final verification of password...{RESET}")
 
         # If we have a wallet file, try to use it to verify the password